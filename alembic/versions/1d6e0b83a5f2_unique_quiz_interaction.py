@@ -0,0 +1,47 @@
+"""unique quiz interaction per user
+
+Revision ID: 1d6e0b83a5f2
+Revises: 8c27e4b9f0d1
+Create Date: 2026-10-18 15:02:16.447390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d6e0b83a5f2'
+down_revision: Union[str, Sequence[str], None] = '8c27e4b9f0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keep the first attempt of each user on a quiz
+    op.execute(
+        """
+        DELETE FROM quiz_interactions
+        WHERE id NOT IN (
+            SELECT min(id) FROM quiz_interactions GROUP BY quiz_id, user_id
+        )
+        """
+    )
+    op.execute("DELETE FROM quiz_answer_counts")
+    op.execute(
+        """
+        INSERT INTO quiz_answer_counts (quiz_id, answer_id, count)
+        SELECT quiz_id, answer_id, count(*)
+        FROM quiz_interactions
+        WHERE answer_id IS NOT NULL
+        GROUP BY quiz_id, answer_id
+        """
+    )
+    op.create_unique_constraint('uq_quiz_interactions_quiz_user', 'quiz_interactions', ['quiz_id', 'user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_quiz_interactions_quiz_user', 'quiz_interactions', type_='unique')
@@ -0,0 +1,28 @@
+"""event date_time index
+
+Revision ID: 2b7f5e8a0c39
+Revises: 9e4b7d2c6f18
+Create Date: 2026-10-18 16:21:47.062915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7f5e8a0c39'
+down_revision: Union[str, Sequence[str], None] = '9e4b7d2c6f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_events_date_time_id', 'events', ['date_time', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_date_time_id', table_name='events')
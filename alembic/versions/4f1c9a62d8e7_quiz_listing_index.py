@@ -0,0 +1,28 @@
+"""quiz listing index
+
+Revision ID: 4f1c9a62d8e7
+Revises: b3e58d17c2a4
+Create Date: 2026-10-18 14:12:38.905143
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1c9a62d8e7'
+down_revision: Union[str, Sequence[str], None] = 'b3e58d17c2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_quizzes_visibility_created_at', 'quizzes', ['visibility', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_quizzes_visibility_created_at', table_name='quizzes')
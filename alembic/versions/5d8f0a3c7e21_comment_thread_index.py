@@ -0,0 +1,28 @@
+"""comment thread index
+
+Revision ID: 5d8f0a3c7e21
+Revises: c41e7d2a9b58
+Create Date: 2026-10-18 10:47:05.730162
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8f0a3c7e21'
+down_revision: Union[str, Sequence[str], None] = 'c41e7d2a9b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_comments_post_parent_created', 'comments', ['post_id', 'parent_comment_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_post_parent_created', table_name='comments')
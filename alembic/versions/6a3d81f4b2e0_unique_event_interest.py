@@ -0,0 +1,37 @@
+"""unique event interest per user
+
+Revision ID: 6a3d81f4b2e0
+Revises: 2b7f5e8a0c39
+Create Date: 2026-10-18 16:44:09.385521
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a3d81f4b2e0'
+down_revision: Union[str, Sequence[str], None] = '2b7f5e8a0c39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keep the latest interest of each user on an event
+    op.execute(
+        """
+        DELETE FROM event_interests
+        WHERE id NOT IN (
+            SELECT max(id) FROM event_interests GROUP BY event_id, user_id
+        )
+        """
+    )
+    op.create_unique_constraint('uq_event_interests_event_user', 'event_interests', ['event_id', 'user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_event_interests_event_user', 'event_interests', type_='unique')
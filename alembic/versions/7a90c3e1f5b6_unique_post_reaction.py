@@ -0,0 +1,43 @@
+"""unique post reaction per user
+
+Revision ID: 7a90c3e1f5b6
+Revises: e6b2f19d4a03
+Create Date: 2026-10-18 13:08:44.612957
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a90c3e1f5b6'
+down_revision: Union[str, Sequence[str], None] = 'e6b2f19d4a03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keep the latest reaction of each user on a post
+    op.execute(
+        """
+        DELETE FROM post_reactions
+        WHERE id NOT IN (
+            SELECT max(id) FROM post_reactions GROUP BY post_id, user_id
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE posts SET
+            reaction_count = (SELECT count(*) FROM post_reactions WHERE post_reactions.post_id = posts.id)
+        """
+    )
+    op.create_unique_constraint('uq_post_reactions_post_user', 'post_reactions', ['post_id', 'user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_post_reactions_post_user', 'post_reactions', type_='unique')
@@ -0,0 +1,46 @@
+"""quiz answer counts
+
+Revision ID: 8c27e4b9f0d1
+Revises: 4f1c9a62d8e7
+Create Date: 2026-10-18 14:37:51.118420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c27e4b9f0d1'
+down_revision: Union[str, Sequence[str], None] = '4f1c9a62d8e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'quiz_answer_counts',
+        sa.Column('quiz_id', sa.Integer(), nullable=False),
+        sa.Column('answer_id', sa.Integer(), nullable=False),
+        sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['quiz_id'], ['quizzes.id'], ),
+        sa.PrimaryKeyConstraint('quiz_id', 'answer_id')
+    )
+
+    # backfill from the existing interactions
+    op.execute(
+        """
+        INSERT INTO quiz_answer_counts (quiz_id, answer_id, count)
+        SELECT quiz_id, answer_id, count(*)
+        FROM quiz_interactions
+        WHERE answer_id IS NOT NULL
+        GROUP BY quiz_id, answer_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('quiz_answer_counts')
@@ -0,0 +1,79 @@
+"""quiz leaderboard standings
+
+Revision ID: 9e4b7d2c6f18
+Revises: 1d6e0b83a5f2
+Create Date: 2026-10-18 15:48:20.731654
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b7d2c6f18'
+down_revision: Union[str, Sequence[str], None] = '1d6e0b83a5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('quiz_interactions', sa.Column('correct_rank', sa.Integer(), nullable=True))
+    op.create_index('ix_quiz_interactions_quiz_correct_rank', 'quiz_interactions', ['quiz_id', 'correct_rank'], unique=False)
+    op.create_table(
+        'user_quiz_scores',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('correct_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('reached_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index('ix_user_quiz_scores_standing', 'user_quiz_scores', ['correct_count', 'reached_at'], unique=False)
+    op.create_table(
+        'quiz_score_buckets',
+        sa.Column('correct_count', sa.Integer(), nullable=False),
+        sa.Column('users', sa.Integer(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('correct_count')
+    )
+
+    # backfill from the existing interactions
+    op.execute(
+        """
+        UPDATE quiz_interactions SET correct_rank = ranked.rn
+        FROM (
+            SELECT qi.id, row_number() OVER (PARTITION BY qi.quiz_id ORDER BY qi.created_at, qi.id) AS rn
+            FROM quiz_interactions qi
+            JOIN quizzes q ON q.id = qi.quiz_id
+            WHERE qi.answer_id = q.correct_answer
+        ) AS ranked
+        WHERE quiz_interactions.id = ranked.id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO user_quiz_scores (user_id, correct_count, reached_at)
+        SELECT user_id, count(*), max(created_at)
+        FROM quiz_interactions
+        WHERE correct_rank IS NOT NULL
+        GROUP BY user_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO quiz_score_buckets (correct_count, users)
+        SELECT correct_count, count(*)
+        FROM user_quiz_scores
+        GROUP BY correct_count
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('quiz_score_buckets')
+    op.drop_index('ix_user_quiz_scores_standing', table_name='user_quiz_scores')
+    op.drop_table('user_quiz_scores')
+    op.drop_index('ix_quiz_interactions_quiz_correct_rank', table_name='quiz_interactions')
+    op.drop_column('quiz_interactions', 'correct_rank')
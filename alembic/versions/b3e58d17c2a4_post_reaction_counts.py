@@ -0,0 +1,46 @@
+"""post reaction counts per type
+
+Revision ID: b3e58d17c2a4
+Revises: 7a90c3e1f5b6
+Create Date: 2026-10-18 13:41:05.270318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e58d17c2a4'
+down_revision: Union[str, Sequence[str], None] = '7a90c3e1f5b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'post_reaction_counts',
+        sa.Column('post_id', sa.Integer(), nullable=False),
+        sa.Column('reaction_type_id', sa.Integer(), nullable=False),
+        sa.Column('count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ),
+        sa.ForeignKeyConstraint(['reaction_type_id'], ['reaction_types.id'], ),
+        sa.PrimaryKeyConstraint('post_id', 'reaction_type_id')
+    )
+
+    # backfill from the existing reactions
+    op.execute(
+        """
+        INSERT INTO post_reaction_counts (post_id, reaction_type_id, count)
+        SELECT post_id, reaction_type_id, count(*)
+        FROM post_reactions
+        GROUP BY post_id, reaction_type_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('post_reaction_counts')
@@ -0,0 +1,45 @@
+"""post engagement counters
+
+Revision ID: c41e7d2a9b58
+Revises: 92b45807d4d5
+Create Date: 2026-10-18 10:03:27.551904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e7d2a9b58'
+down_revision: Union[str, Sequence[str], None] = '92b45807d4d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('posts', sa.Column('reaction_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('posts', sa.Column('rating_sum', sa.Float(), server_default='0', nullable=False))
+    op.add_column('posts', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+
+    # backfill from the existing child rows
+    op.execute(
+        """
+        UPDATE posts SET
+            comment_count = (SELECT count(*) FROM comments WHERE comments.post_id = posts.id),
+            reaction_count = (SELECT count(*) FROM post_reactions WHERE post_reactions.post_id = posts.id),
+            rating_sum = (SELECT coalesce(sum(ratings), 0) FROM post_ratings WHERE post_ratings.post_id = posts.id),
+            rating_count = (SELECT count(*) FROM post_ratings WHERE post_ratings.post_id = posts.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('posts', 'rating_count')
+    op.drop_column('posts', 'rating_sum')
+    op.drop_column('posts', 'reaction_count')
+    op.drop_column('posts', 'comment_count')
@@ -0,0 +1,54 @@
+"""course attempts and completions
+
+Revision ID: d85a2c47e9b1
+Revises: 6a3d81f4b2e0
+Create Date: 2026-10-18 17:26:33.590274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd85a2c47e9b1'
+down_revision: Union[str, Sequence[str], None] = '6a3d81f4b2e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'course_attempts',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('course_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Integer(), nullable=False),
+        sa.Column('total_marks', sa.Integer(), nullable=False),
+        sa.Column('passed', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['course_id'], ['courses.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_course_attempts_id'), 'course_attempts', ['id'], unique=False)
+    op.create_index('ix_course_attempts_course_user', 'course_attempts', ['course_id', 'user_id'], unique=False)
+    op.create_table(
+        'course_completions',
+        sa.Column('course_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['course_id'], ['courses.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('course_id', 'user_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('course_completions')
+    op.drop_index('ix_course_attempts_course_user', table_name='course_attempts')
+    op.drop_index(op.f('ix_course_attempts_id'), table_name='course_attempts')
+    op.drop_table('course_attempts')
@@ -0,0 +1,30 @@
+"""user listing indexes
+
+Revision ID: e6b2f19d4a03
+Revises: 5d8f0a3c7e21
+Create Date: 2026-10-18 11:26:51.094417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b2f19d4a03'
+down_revision: Union[str, Sequence[str], None] = '5d8f0a3c7e21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_role_created_id', 'users', ['role_id', 'created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_student_data_grade'), 'student_data', ['grade'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_student_data_grade'), table_name='student_data')
+    op.drop_index('ix_users_role_created_id', table_name='users')
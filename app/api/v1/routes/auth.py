@@ -14,7 +14,7 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
 @router.post("/login", status_code=status.HTTP_202_ACCEPTED)
-async def login_user(credentials: LoginRequest, db: Session = Depends(get_db)):
+def login_user(credentials: LoginRequest, db: Session = Depends(get_db)):
     try:
         data = login(db, credentials)
         user = data["user"]
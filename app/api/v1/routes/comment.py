@@ -1,7 +1,8 @@
 import logging
-from fastapi import APIRouter, status, Request, Depends
+from fastapi import APIRouter, status, Request, Depends, Query
 from sqlalchemy.orm import Session
-from app.schemas.post import CommentCreate, CommentResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.post import CommentCreate, CommentResponse, CommentPage
 from app.crud.crud_comment import crud_comment
 from app.core.exceptions import (
     ValidationError,
@@ -9,10 +10,8 @@ from app.core.exceptions import (
     NotFoundError,
     AuthorizationError,
 )
-from app.db.deps import get_db
-from app.constants.score_update_values import SCORE_UPDATE_VALUES
-from app.services.interaction_score_update import update_user_score
-from typing import List
+from app.db.deps import get_db, get_async_db
+from typing import List, Optional
 
 
 logger = logging.getLogger(__name__)
@@ -21,15 +20,12 @@ router = APIRouter(prefix="/comments", tags=["Comments"])
 
 # create
 @router.post("/create", status_code=status.HTTP_201_CREATED)
-async def create_comment(
+def create_comment(
     request: Request, new_comment: CommentCreate, db: Session = Depends(get_db)
 ):
     try:
         user = request.state.user
         crud_comment.create_comment(db=db, new_comment=new_comment, user_id=user.id)
-        update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["COMMENT_POST"], user_id=user.id
-        )
         return {"message": "Commented"}
     except ValidationError as e:
         logger.warning(f"Validation error in create: {str(e)}")
@@ -46,10 +42,16 @@ async def create_comment(
     status_code=status.HTTP_200_OK,
 )
 async def get_comments_by_post_id(
-    request: Request, post_id: int, db: Session = Depends(get_db)
+    request: Request,
+    post_id: int,
+    max_depth: Optional[int] = Query(None, ge=0),
+    reply_limit: Optional[int] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        comments = crud_comment.get_comments_by_post_id(db=db, post_id=post_id)
+        comments = await crud_comment.get_comments_by_post_id(
+            db=db, post_id=post_id, max_depth=max_depth, reply_limit=reply_limit
+        )
         if not comments:
             raise NotFoundError("Comments Not Available")
         return comments
@@ -62,3 +64,56 @@ async def get_comments_by_post_id(
     except Exception as e:
         logger.error(f"Unexpected error fetching comments: {str(e)}")
         raise DatabaseError("Unexpected error occurred while retrieving comments")
+
+
+# get paginated top level comments by post id
+@router.get(
+    "/thread/{post_id}",
+    response_model=CommentPage,
+    status_code=status.HTTP_200_OK,
+)
+async def get_comment_thread(
+    post_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    replies: int = Query(3, ge=0, le=20),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        return await crud_comment.get_comment_page(
+            db=db,
+            post_id=post_id,
+            limit=limit,
+            cursor=cursor,
+            replies_per_comment=replies,
+        )
+    except ValidationError as e:
+        logger.warning(f"Validation error fetching comments: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching comments: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving comments")
+
+
+# get paginated replies of a comment
+@router.get(
+    "/replies/{comment_id}",
+    response_model=CommentPage,
+    status_code=status.HTTP_200_OK,
+)
+async def get_comment_replies(
+    comment_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        return await crud_comment.get_reply_page(
+            db=db, comment_id=comment_id, limit=limit, cursor=cursor
+        )
+    except (NotFoundError, ValidationError) as e:
+        logger.warning(str(e))
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching replies: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving replies")
@@ -1,7 +1,9 @@
 import logging
-from fastapi import APIRouter, Depends, status, Request 
+from fastapi import APIRouter, Depends, status, Request, Query
 from sqlalchemy.orm import Session
-from app.schemas.course import CourseCreate, CourseResponse
+from app.schemas.course import (
+    CourseCreate, CourseResponse, CourseSummaryPage, CourseAttemptCreate, CourseAttemptResponse
+)
 from app.crud.crud_course import crud_course
 from app.core.exceptions import (
     ValidationError,
@@ -10,24 +12,19 @@ from app.core.exceptions import (
     AuthorizationError,
 )
 from app.db.deps import get_db
-from typing import List
-from app.services.interaction_score_update import update_user_score
-from app.constants.score_update_values import SCORE_UPDATE_VALUES
+from typing import List, Optional
+from app.constants.roles import ROLE_STUDENT
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/courses", tags=["Courses"])
 
 # Create course
 @router.post("/create", status_code=status.HTTP_201_CREATED)
-async def create_course(request: Request, new_course: CourseCreate, db: Session = Depends(get_db)):
+def create_course(request: Request, new_course: CourseCreate, db: Session = Depends(get_db)):
     try:
         user = request.state.user
-        crud_course.create_course(db=db, new_course=new_course)
+        crud_course.create_course(db=db, new_course=new_course, user_id=user.id)
         logger.info("Course created")
-        new_score = update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["CREATE_COURSE"], user_id=user.id
-        )
-        logger.info(f"User {user.id} score after course: {new_score}")
         return {"message": "Course created successfully"}
     except ValidationError as e:
         logger.warning(f"Validation error in course create: {str(e)}")
@@ -38,9 +35,12 @@ async def create_course(request: Request, new_course: CourseCreate, db: Session
 
 # Get course by id
 @router.get("/get/{course_id}", response_model=CourseResponse, status_code=status.HTTP_200_OK)
-async def get_course_by_id(course_id: int, db: Session = Depends(get_db)):
+def get_course_by_id(request: Request, course_id: int, db: Session = Depends(get_db)):
     try:
-        course = crud_course.get_course_by_id(db=db, course_id=course_id)
+        user = request.state.user
+        course = crud_course.get_course_by_id(
+            db=db, course_id=course_id, include_answer_key=user.role_id != ROLE_STUDENT
+        )
         if not course:
             raise NotFoundError("Course not found")
         return course
@@ -53,9 +53,10 @@ async def get_course_by_id(course_id: int, db: Session = Depends(get_db)):
 
 # Get all courses
 @router.get("/get_all", response_model=List[CourseResponse], status_code=status.HTTP_200_OK)
-async def get_courses(db: Session = Depends(get_db)):
+def get_courses(request: Request, db: Session = Depends(get_db)):
     try:
-        courses = crud_course.get_courses(db=db)
+        user = request.state.user
+        courses = crud_course.get_courses(db=db, include_answer_key=user.role_id != ROLE_STUDENT)
         if not courses:
             raise NotFoundError("Courses not available")
         return courses
@@ -66,9 +67,33 @@ async def get_courses(db: Session = Depends(get_db)):
         logger.error(f"Unexpected error fetching courses: {str(e)}")
         raise DatabaseError("Unexpected error occurred while retrieving courses")
 
+# Course summaries (listing page)
+@router.get("/summaries", response_model=CourseSummaryPage, status_code=status.HTTP_200_OK)
+def get_course_summaries(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    applicable_grade: Optional[str] = Query(None, alias="applicableGrade"),
+    applicable_level: Optional[str] = Query(None, alias="applicableLevel"),
+    db: Session = Depends(get_db),
+):
+    try:
+        return crud_course.get_course_summaries(
+            db=db,
+            limit=limit,
+            cursor=cursor,
+            applicable_grade=applicable_grade,
+            applicable_level=applicable_level,
+        )
+    except ValidationError as e:
+        logger.warning(f"Validation error in course summaries: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching course summaries: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving courses")
+
 # Update course
 @router.put("/update/{course_id}", status_code=status.HTTP_200_OK)
-async def update_course(course_id: int, course_update: CourseCreate, db: Session = Depends(get_db)):
+def update_course(course_id: int, course_update: CourseCreate, db: Session = Depends(get_db)):
     try:
         crud_course.update_course(db=db, course_id=course_id, course_update=course_update)
         logger.info("Course updated")
@@ -82,7 +107,7 @@ async def update_course(course_id: int, course_update: CourseCreate, db: Session
 
 # Delete course
 @router.delete("/delete/{course_id}", status_code=status.HTTP_200_OK)
-async def delete_course(course_id: int, db: Session = Depends(get_db)):
+def delete_course(course_id: int, db: Session = Depends(get_db)):
     try:
         crud_course.delete_course(db=db, course_id=course_id)
         logger.info("Course deleted")
@@ -93,3 +118,21 @@ async def delete_course(course_id: int, db: Session = Depends(get_db)):
     except Exception as e:
         logger.error(f"Unexpected error deleting course: {str(e)}")
         raise DatabaseError("Unexpected error occurred while deleting course")
+
+# Submit a course attempt
+@router.post("/attempt/{course_id}", response_model=CourseAttemptResponse, status_code=status.HTTP_201_CREATED)
+def submit_course_attempt(
+    request: Request, course_id: int, attempt: CourseAttemptCreate, db: Session = Depends(get_db)
+):
+    try:
+        user = request.state.user
+        return crud_course.submit_attempt(db=db, course_id=course_id, user_id=user.id, attempt=attempt)
+    except NotFoundError as e:
+        logger.warning(str(e))
+        raise e
+    except ValidationError as e:
+        logger.warning(f"Validation error in course attempt: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error in course attempt: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while grading course attempt")
@@ -1,11 +1,12 @@
 import logging
-from fastapi import APIRouter, Depends, status, Request
+from fastapi import APIRouter, Depends, status, Request, Query
 from sqlalchemy.orm import Session
 from app.schemas.events import (
     EventCreate,
     EventInterestResponse,
     EventInterestsCreate,
     EventResponse,
+    EventPage,
 )
 from app.crud.crud_event import crud_events
 from app.core.exceptions import (
@@ -14,9 +15,8 @@ from app.core.exceptions import (
     NotFoundError,
 )
 from app.db.deps import get_db
-from app.constants.score_update_values import SCORE_UPDATE_VALUES
-from app.services.interaction_score_update import update_user_score
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/events", tags=["Events"])
@@ -24,15 +24,12 @@ router = APIRouter(prefix="/events", tags=["Events"])
 
 # create event
 @router.post("/create", status_code=status.HTTP_201_CREATED)
-async def create_event(
+def create_event(
     request: Request, new_event: EventCreate, db: Session = Depends(get_db)
 ):
     try:
         user = request.state.user
         event = crud_events.create_event(db=db, new_event=new_event, user_id=user.id)
-        update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["CREATE_EVENT"], user_id=user.id
-        )
         logger.info("Event Created")
         return {"success": True, "event": event}
     except ValidationError as e:
@@ -49,9 +46,10 @@ async def create_event(
     response_model=List[EventResponse],
     status_code=status.HTTP_200_OK,
 )
-async def get_active_events(db: Session = Depends(get_db)):
+def get_active_events(request: Request, db: Session = Depends(get_db)):
     try:
-        events = crud_events.get_all_active_events(db=db)
+        user = request.state.user
+        events = crud_events.get_all_active_events(db=db, user_id=user.id)
         if not events:
             raise NotFoundError("Events Not Available")
         return events
@@ -72,9 +70,10 @@ async def get_active_events(db: Session = Depends(get_db)):
     response_model=List[EventResponse],
     status_code=status.HTTP_200_OK,
 )
-async def get_inactive_events(db: Session = Depends(get_db)):
+def get_inactive_events(request: Request, db: Session = Depends(get_db)):
     try:
-        events = crud_events.get_all_inactive_events(db=db)
+        user = request.state.user
+        events = crud_events.get_all_inactive_events(db=db, user_id=user.id)
         if not events:
             raise NotFoundError("Events Not Available")
         return events
@@ -89,15 +88,70 @@ async def get_inactive_events(db: Session = Depends(get_db)):
         raise DatabaseError("Unexpected error occurred ")
 
 
+# get inactive events (newest first, cursor paginated)
+@router.get(
+    "/get_inactive_events/page",
+    response_model=EventPage,
+    status_code=status.HTTP_200_OK,
+)
+def get_inactive_events_page(
+    request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        user = request.state.user
+        return crud_events.get_inactive_events_page(
+            db=db, user_id=user.id, limit=limit, cursor=cursor
+        )
+    except ValidationError as e:
+        logger.warning(f"Validation error : {str(e)}")
+        raise ValidationError(str(e))
+    except Exception as e:
+        logger.error(f"Unexpected error : {str(e)}")
+        raise DatabaseError("Unexpected error occurred ")
+
+
+# get events in a calendar window
+@router.get(
+    "/range",
+    response_model=EventPage,
+    status_code=status.HTTP_200_OK,
+)
+def get_events_in_range(
+    request: Request,
+    start: datetime = Query(..., alias="from"),
+    end: datetime = Query(..., alias="to"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        user = request.state.user
+        return crud_events.get_events_in_range(
+            db=db, user_id=user.id, start=start, end=end, limit=limit, cursor=cursor
+        )
+    except ValidationError as e:
+        logger.warning(f"Validation error : {str(e)}")
+        raise ValidationError(str(e))
+    except Exception as e:
+        logger.error(f"Unexpected error : {str(e)}")
+        raise DatabaseError("Unexpected error occurred ")
+
+
 # get event by id
 @router.get(
     "/get/{event_id}",
     response_model=EventResponse,
     status_code=status.HTTP_200_OK,
 )
-async def get_event_interest_by_id(event_id: int, db: Session = Depends(get_db)):
+def get_event_interest_by_id(
+    request: Request, event_id: int, db: Session = Depends(get_db)
+):
     try:
-        event = crud_events.get_event_by_id(db=db, event_id=event_id)
+        user = request.state.user
+        event = crud_events.get_event_by_id(db=db, event_id=event_id, user_id=user.id)
         if not event:
             raise NotFoundError("Events Not Available")
         return event
@@ -114,7 +168,7 @@ async def get_event_interest_by_id(event_id: int, db: Session = Depends(get_db))
 
 # create event interest
 @router.post("/interest/create/{event_id}", status_code=status.HTTP_201_CREATED)
-async def create_event_interest(
+def create_event_interest(
     request: Request,
     new_interest: EventInterestsCreate,
     event_id: int,
@@ -125,9 +179,6 @@ async def create_event_interest(
         event_interest = crud_events.create_event_interest(
             db=db, new_interest=new_interest, event_id=event_id, user_id=user.id
         )
-        update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["INTEREST_EVENT"], user_id=user.id
-        )
         logger.info("Event Interest Created")
         return {"success": True, "event_interest": event_interest}
     except ValidationError as e:
@@ -144,7 +195,7 @@ async def create_event_interest(
     response_model=List[EventInterestResponse],
     status_code=status.HTTP_200_OK,
 )
-async def get_event_by_id(event_id: int, db: Session = Depends(get_db)):
+def get_event_by_id(event_id: int, db: Session = Depends(get_db)):
     try:
         event_interests = crud_events.get_event_interest_by_event_id(
             db=db, event_id=event_id
@@ -11,22 +11,16 @@ from app.core.exceptions import (
 )
 from app.db.deps import get_db
 from typing import List
-from app.constants.score_update_values import SCORE_UPDATE_VALUES
-from app.services.interaction_score_update import update_user_score
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/exam_papers", tags=["Exam Papers"])
 
 # Create exam paper
 @router.post("/create", status_code=status.HTTP_201_CREATED)
-async def create_exam_paper(request: Request, new_exam_paper: ExamPaperCreate, db: Session = Depends(get_db)):
+def create_exam_paper(request: Request, new_exam_paper: ExamPaperCreate, db: Session = Depends(get_db)):
     try:
         user = request.state.user
-        crud_exam_paper.create_exam_paper(db=db, new_exam_paper=new_exam_paper)
+        crud_exam_paper.create_exam_paper(db=db, new_exam_paper=new_exam_paper, user_id=user.id)
         logger.info("Exam paper created")
-        new_score = update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["CREATE_EXAM_PAPER"], user_id=user.id
-        )
-        logger.info(f"User {user.id} score after exam paper: {new_score}")
         return {"message": "Exam paper created successfully"}
     except ValidationError as e:
         logger.warning(f"Validation error in exam paper create: {str(e)}")
@@ -37,7 +31,7 @@ async def create_exam_paper(request: Request, new_exam_paper: ExamPaperCreate, d
 
 # Get exam paper by id
 @router.get("/get/{exam_paper_id}", response_model=ExamPaperResponse, status_code=status.HTTP_200_OK)
-async def get_exam_paper_by_id(exam_paper_id: int, db: Session = Depends(get_db)):
+def get_exam_paper_by_id(exam_paper_id: int, db: Session = Depends(get_db)):
     try:
         exam_paper = crud_exam_paper.get_exam_paper_by_id(db=db, exam_paper_id=exam_paper_id)
         if not exam_paper:
@@ -52,7 +46,7 @@ async def get_exam_paper_by_id(exam_paper_id: int, db: Session = Depends(get_db)
 
 # Get all exam papers
 @router.get("/get_all", response_model=List[ExamPaperResponse], status_code=status.HTTP_200_OK)
-async def get_exam_papers(db: Session = Depends(get_db)):
+def get_exam_papers(db: Session = Depends(get_db)):
     try:
         exam_papers = crud_exam_paper.get_exam_papers(db=db)
         if not exam_papers:
@@ -67,7 +61,7 @@ async def get_exam_papers(db: Session = Depends(get_db)):
 
 # Update exam paper
 @router.put("/update/{exam_paper_id}", status_code=status.HTTP_200_OK)
-async def update_exam_paper(exam_paper_id: int, exam_paper_update: ExamPaperUpdate, db: Session = Depends(get_db)):
+def update_exam_paper(exam_paper_id: int, exam_paper_update: ExamPaperUpdate, db: Session = Depends(get_db)):
     try:
         crud_exam_paper.update_exam_paper(db=db, exam_paper_id=exam_paper_id, exam_paper_update=exam_paper_update)
         logger.info("Exam paper updated")
@@ -81,7 +75,7 @@ async def update_exam_paper(exam_paper_id: int, exam_paper_update: ExamPaperUpda
 
 # Delete exam paper
 @router.delete("/delete/{exam_paper_id}", status_code=status.HTTP_200_OK)
-async def delete_exam_paper(exam_paper_id: int, db: Session = Depends(get_db)):
+def delete_exam_paper(exam_paper_id: int, db: Session = Depends(get_db)):
     try:
         crud_exam_paper.delete_exam_paper(db=db, exam_paper_id=exam_paper_id)
         logger.info("Exam paper deleted")
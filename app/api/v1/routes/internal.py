@@ -0,0 +1,20 @@
+import logging
+from fastapi import APIRouter, Request, status
+from app.constants.roles import ROLE_ADMIN
+from app.core.exceptions import AuthorizationError
+from app.db.pool_metrics import async_pool_metrics, sync_pool_metrics
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+# database pool metrics
+@router.get("/metrics/db-pool", status_code=status.HTTP_200_OK)
+def get_db_pool_metrics(request: Request):
+    user = request.state.user
+    if user.role_id != ROLE_ADMIN:
+        raise AuthorizationError("Not authorized to view metrics")
+    return {
+        "sync": sync_pool_metrics.snapshot(),
+        "async": async_pool_metrics.snapshot(),
+    }
@@ -1,7 +1,8 @@
 import logging
-from fastapi import APIRouter, Depends, status, Request
+from fastapi import APIRouter, Depends, status, Request, Query
 from sqlalchemy.orm import Session
-from app.schemas.post import PostCreate, PostResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.post import PostCreate, PostResponse, PostFeedPage
 from app.crud.crud_post import crud_post
 from app.core.exceptions import (
     ValidationError,
@@ -9,10 +10,8 @@ from app.core.exceptions import (
     NotFoundError,
     AuthorizationError,
 )
-from app.db.deps import get_db
-from app.constants.score_update_values import SCORE_UPDATE_VALUES
-from app.services.interaction_score_update import update_user_score
-from typing import List
+from app.db.deps import get_db, get_async_db
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/posts", tags=["Posts"])
@@ -20,17 +19,13 @@ router = APIRouter(prefix="/posts", tags=["Posts"])
 
 # cerate
 @router.post("/create", status_code=status.HTTP_201_CREATED)
-async def create_post(
+def create_post(
     request: Request, new_post: PostCreate, db: Session = Depends(get_db)
 ):
     try:
         user = request.state.user
         crud_post.create_post(db=db, new_post=new_post, user_id=user.id)
         logger.info("Post created")
-        new_score = update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["CREATE_POST"], user_id=user.id
-        )
-        logger.info(f"User {user.id} score after post: {new_score}")
         return {"message": "Post created successfully"}
     except ValidationError as e:
         logger.warning(f"Validation error in post create: {str(e)}")
@@ -44,10 +39,12 @@ async def create_post(
 @router.get(
     "/get/{post_id}", response_model=PostResponse, status_code=status.HTTP_200_OK
 )
-async def get_post_by_id(request: Request, post_id: int, db: Session = Depends(get_db)):
+async def get_post_by_id(
+    request: Request, post_id: int, db: AsyncSession = Depends(get_async_db)
+):
     try:
         user = request.state.user
-        post = crud_post.get_post_by_id(db=db, post_id=post_id, user_id=user.id)
+        post = await crud_post.get_post_by_id(db=db, post_id=post_id, user_id=user.id)
         if not post:
             raise NotFoundError("Post not found")
         return post
@@ -66,10 +63,10 @@ async def get_post_by_id(request: Request, post_id: int, db: Session = Depends(g
 @router.get(
     "/get_all", response_model=List[PostResponse], status_code=status.HTTP_200_OK
 )
-async def get_post_by_id(request: Request, db: Session = Depends(get_db)):
+async def get_posts(request: Request, db: AsyncSession = Depends(get_async_db)):
     try:
         user = request.state.user
-        posts = crud_post.get_posts(db=db, user_id=user.id)
+        posts = await crud_post.get_posts(db=db, user_id=user.id)
         if not posts:
             raise NotFoundError("Posts not available")
         return posts
@@ -82,3 +79,24 @@ async def get_post_by_id(request: Request, db: Session = Depends(get_db)):
     except Exception as e:
         logger.error(f"Unexpected error fetching posts: {str(e)}")
         raise DatabaseError("Unexpected error occurred while retrieving posts")
+
+
+# get feed (cursor paginated)
+@router.get("/feed", response_model=PostFeedPage, status_code=status.HTTP_200_OK)
+async def get_post_feed(
+    request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        user = request.state.user
+        return await crud_post.get_feed_page(
+            db=db, user_id=user.id, limit=limit, cursor=cursor
+        )
+    except ValidationError as e:
+        logger.warning(f"Validation error in post feed: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching post feed: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving posts")
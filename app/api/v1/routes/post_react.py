@@ -1,20 +1,21 @@
 import logging
-from fastapi import APIRouter, status, Request, Depends
+from fastapi import APIRouter, status, Request, Depends, Query
 from sqlalchemy.orm import Session
-from app.schemas.post import ReactionCreate
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.post import ReactionBatch, ReactionCreate, ReactionSummary
 from app.crud.crud_post_reactions import crud_reactions
 from app.core.exceptions import ValidationError, DatabaseError
-from app.db.deps import get_db
-from app.constants.score_update_values import SCORE_UPDATE_VALUES
-from app.services.interaction_score_update import update_user_score
+from app.db.deps import get_db, get_async_db
 from typing import List
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/reaction", tags=["Reaction"])
 
+MAX_SUMMARY_POSTS = 100
+
 
 @router.post("/create", status_code=status.HTTP_201_CREATED)
-async def react_to_post(
+def react_to_post(
     request: Request, new_react: ReactionCreate, db: Session = Depends(get_db)
 ):
     try:
@@ -22,9 +23,6 @@ async def react_to_post(
         react = crud_reactions.react_to_a_post(
             db=db, new_react=new_react, user_id=user.id
         )
-        update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["REACT_POST"], user_id=user.id
-        )
         return {"message": "Success", "react": react}
     except ValidationError as e:
         logger.warning(f"Validation error in create: {str(e)}")
@@ -32,3 +30,47 @@ async def react_to_post(
     except Exception as e:
         logger.error(f"Unexpected error in create: {str(e)}")
         raise DatabaseError("Unexpected error occurred while creating")
+
+
+# apply a burst of reactions in one transaction
+@router.post("/batch", status_code=status.HTTP_201_CREATED)
+def react_to_posts(
+    request: Request, batch: ReactionBatch, db: Session = Depends(get_db)
+):
+    try:
+        user = request.state.user
+        reacts = crud_reactions.react_to_posts(
+            db=db, reactions=batch.reactions, user_id=user.id
+        )
+        return {"message": "Success", "reacts": reacts}
+    except ValidationError as e:
+        logger.warning(f"Validation error in batch: {str(e)}")
+        raise ValidationError(str(e))
+    except Exception as e:
+        logger.error(f"Unexpected error in batch: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while reacting")
+
+
+# per-type breakdown for a batch of posts
+@router.get(
+    "/summary", response_model=List[ReactionSummary], status_code=status.HTTP_200_OK
+)
+async def get_reaction_summaries(
+    request: Request,
+    post_ids: List[int] = Query(...),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        user = request.state.user
+        post_ids = list(dict.fromkeys(post_ids))
+        if len(post_ids) > MAX_SUMMARY_POSTS:
+            raise ValidationError(f"At most {MAX_SUMMARY_POSTS} post ids per request")
+        return await crud_reactions.get_reaction_summaries(
+            db=db, post_ids=post_ids, user_id=user.id
+        )
+    except ValidationError as e:
+        logger.warning(f"Validation error in reaction summary: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching reaction summary: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving reactions")
@@ -1,8 +1,12 @@
 import logging
-from fastapi import APIRouter, Depends, status, Request
+from fastapi import APIRouter, Depends, status, Request, Query
 from sqlalchemy.orm import Session
-from app.schemas.quiz import QuizCreate, QuizResponse, QuizInteractionCreate, QuizInteractionResponse
+from app.schemas.quiz import (
+    QuizCreate, QuizResponse, QuizInteractionCreate, QuizInteractionResponse, QuizPage, QuizInteractionPage, QuizStats,
+    QuizLeaderboardEntry, GlobalLeaderboardEntry
+)
 from app.crud.crud_quiz import crud_quiz
+from app.crud.crud_quiz_leaderboard import crud_quiz_leaderboard
 from app.core.exceptions import (
     ValidationError,
     DatabaseError,
@@ -10,23 +14,17 @@ from app.core.exceptions import (
     AuthorizationError,
 )
 from app.db.deps import get_db
-from typing import List
-from app.constants.score_update_values import SCORE_UPDATE_VALUES
-from app.services.interaction_score_update import update_user_score
+from typing import List, Optional
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/quizzes", tags=["Quizzes"])
 
 # Create quiz
 @router.post("/create", status_code=status.HTTP_201_CREATED)
-async def create_quiz(request: Request, new_quiz: QuizCreate, db: Session = Depends(get_db)):
+def create_quiz(request: Request, new_quiz: QuizCreate, db: Session = Depends(get_db)):
     try:
         user = request.state.user
         crud_quiz.create_quiz(db=db, new_quiz=new_quiz, user_id=user.id)
         logger.info("Quiz created")
-        new_score = update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["CREATE_QUIZ"], user_id=user.id
-        )
-        logger.info(f"User {user.id} score after quiz: {new_score}")
         return {"message": "Quiz created successfully"}
     except ValidationError as e:
         logger.warning(f"Validation error in quiz create: {str(e)}")
@@ -37,7 +35,7 @@ async def create_quiz(request: Request, new_quiz: QuizCreate, db: Session = Depe
 
 # Get quiz by id
 @router.get("/get/{quiz_id}", response_model=QuizResponse, status_code=status.HTTP_200_OK)
-async def get_quiz_by_id(request: Request, quiz_id: int, db: Session = Depends(get_db)):
+def get_quiz_by_id(request: Request, quiz_id: int, db: Session = Depends(get_db)):
     try:
         user = request.state.user
         quiz = crud_quiz.get_quiz_by_id(db=db, quiz_id=quiz_id, user_id=user.id)
@@ -56,7 +54,7 @@ async def get_quiz_by_id(request: Request, quiz_id: int, db: Session = Depends(g
 
 # Get all quizzes
 @router.get("/get_all", response_model=List[QuizResponse], status_code=status.HTTP_200_OK)
-async def get_quizzes(request: Request, db: Session = Depends(get_db)):
+def get_quizzes(request: Request, db: Session = Depends(get_db)):
     try:
         user = request.state.user
         quizzes = crud_quiz.get_quizzes(db=db, user_id=user.id)
@@ -73,17 +71,31 @@ async def get_quizzes(request: Request, db: Session = Depends(get_db)):
         logger.error(f"Unexpected error fetching quizzes: {str(e)}")
         raise DatabaseError("Unexpected error occurred while retrieving quizzes")
 
+# Get quizzes (cursor paginated)
+@router.get("/page", response_model=QuizPage, status_code=status.HTTP_200_OK)
+def get_quiz_page(
+    request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        user = request.state.user
+        return crud_quiz.get_quiz_page(db=db, user_id=user.id, limit=limit, cursor=cursor)
+    except ValidationError as e:
+        logger.warning(f"Validation error in quiz page: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching quiz page: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving quizzes")
+
 # Update quiz
 @router.put("/update/{quiz_id}", status_code=status.HTTP_200_OK)
-async def update_quiz(request: Request, quiz_id: int, quiz_update: QuizCreate, db: Session = Depends(get_db)):
+def update_quiz(request: Request, quiz_id: int, quiz_update: QuizCreate, db: Session = Depends(get_db)):
     try:
         user = request.state.user
         crud_quiz.update_quiz(db=db, quiz_id=quiz_id, quiz_update=quiz_update, user_id=user.id)
         logger.info("Quiz updated")
-        new_score = update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["UPDATE_QUIZ"], user_id=user.id
-        )
-        logger.info(f"User {user.id} score after quiz: {new_score}")
         return {"message": "Quiz updated successfully"}
     except ValidationError as e:
         logger.warning(f"Validation error in quiz update: {str(e)}")
@@ -97,15 +109,11 @@ async def update_quiz(request: Request, quiz_id: int, quiz_update: QuizCreate, d
 
 # Delete quiz
 @router.delete("/delete/{quiz_id}", status_code=status.HTTP_200_OK)
-async def delete_quiz(request: Request, quiz_id: int, db: Session = Depends(get_db)):
+def delete_quiz(request: Request, quiz_id: int, db: Session = Depends(get_db)):
     try:
         user = request.state.user
         crud_quiz.delete_quiz(db=db, quiz_id=quiz_id, user_id=user.id)
         logger.info("Quiz deleted")
-        new_score = update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["DELETE_QUIZ"], user_id=user.id
-        )
-        logger.info(f"User {user.id} score after quiz: {new_score}")
         return {"message": "Quiz deleted successfully"}
     except NotFoundError as e:
         logger.warning(str(e))
@@ -119,28 +127,42 @@ async def delete_quiz(request: Request, quiz_id: int, db: Session = Depends(get_
 
 # Create quiz interaction (answer)
 @router.post("/interact/{quiz_id}", response_model=QuizInteractionResponse, status_code=status.HTTP_201_CREATED)
-async def create_quiz_interaction(request: Request, quiz_id: int, interaction: QuizInteractionCreate, db: Session = Depends(get_db)):
+def create_quiz_interaction(request: Request, quiz_id: int, interaction: QuizInteractionCreate, db: Session = Depends(get_db)):
     try:
         user = request.state.user
-        response = crud_quiz.create_quiz_interaction(db=db, quiz_id=quiz_id, user_id=user.id, interaction=interaction)
-        logger.info("Quiz interaction created")
-        new_score = update_user_score(
-            db=db, value=SCORE_UPDATE_VALUES["ANSWER_QUIZ"], user_id=user.id
-        )
-        logger.info(f"User {user.id} score after quiz: {new_score}")
-        return response
+        return crud_quiz.create_quiz_interaction(db=db, quiz_id=quiz_id, user=user, interaction=interaction)
     except ValidationError as e:
         logger.warning(f"Validation error in quiz interaction: {str(e)}")
         raise ValidationError(str(e))
+    except NotFoundError as e:
+        logger.warning(str(e))
+        raise e
     except Exception as e:
         logger.error(f"Unexpected error in quiz interaction: {str(e)}")
         raise DatabaseError("Unexpected error occurred while creating quiz interaction")
 
+# Answer statistics for a quiz
+@router.get("/stats/{quiz_id}", response_model=QuizStats, status_code=status.HTTP_200_OK)
+def get_quiz_stats(request: Request, quiz_id: int, db: Session = Depends(get_db)):
+    try:
+        user = request.state.user
+        return crud_quiz.get_quiz_stats(db=db, quiz_id=quiz_id, user_id=user.id)
+    except NotFoundError as e:
+        logger.warning(str(e))
+        raise e
+    except AuthorizationError as e:
+        logger.warning(str(e))
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching quiz stats: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving quiz stats")
+
 # Get all interactions for a quiz
 @router.get("/interactions/{quiz_id}", response_model=List[QuizInteractionResponse], status_code=status.HTTP_200_OK)
-async def get_quiz_interactions(request: Request, quiz_id: int, db: Session = Depends(get_db)):
+def get_quiz_interactions(request: Request, quiz_id: int, db: Session = Depends(get_db)):
     try:
-        interactions = crud_quiz.get_quiz_interactions(db=db, quiz_id=quiz_id)
+        user = request.state.user
+        interactions = crud_quiz.get_quiz_interactions(db=db, quiz_id=quiz_id, user_id=user.id)
         if not interactions:
             raise NotFoundError("No interactions found for this quiz")
         return interactions
@@ -150,3 +172,78 @@ async def get_quiz_interactions(request: Request, quiz_id: int, db: Session = De
     except Exception as e:
         logger.error(f"Unexpected error fetching quiz interactions: {str(e)}")
         raise DatabaseError("Unexpected error occurred while retrieving quiz interactions")
+
+# Get interactions for a quiz (cursor paginated)
+@router.get("/interactions/{quiz_id}/page", response_model=QuizInteractionPage, status_code=status.HTTP_200_OK)
+def get_quiz_interaction_page(
+    request: Request,
+    quiz_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        user = request.state.user
+        return crud_quiz.get_quiz_interaction_page(
+            db=db, quiz_id=quiz_id, user_id=user.id, limit=limit, cursor=cursor
+        )
+    except ValidationError as e:
+        logger.warning(f"Validation error in quiz interaction page: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching quiz interaction page: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving quiz interactions")
+
+# Global leaderboard (most correct answers)
+@router.get("/leaderboard", response_model=List[GlobalLeaderboardEntry], status_code=status.HTTP_200_OK)
+def get_global_leaderboard(limit: int = Query(10, ge=1, le=100), db: Session = Depends(get_db)):
+    try:
+        return crud_quiz_leaderboard.get_global_top(db=db, limit=limit)
+    except Exception as e:
+        logger.error(f"Unexpected error fetching leaderboard: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving leaderboard")
+
+# Caller's global rank
+@router.get("/leaderboard/me", response_model=GlobalLeaderboardEntry, status_code=status.HTTP_200_OK)
+def get_my_global_rank(request: Request, db: Session = Depends(get_db)):
+    try:
+        user = request.state.user
+        return crud_quiz_leaderboard.get_global_rank(db=db, user=user)
+    except NotFoundError as e:
+        logger.warning(str(e))
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching rank: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving rank")
+
+# Quiz leaderboard (first correct answers)
+@router.get("/leaderboard/{quiz_id}", response_model=List[QuizLeaderboardEntry], status_code=status.HTTP_200_OK)
+def get_quiz_leaderboard(
+    request: Request, quiz_id: int, limit: int = Query(10, ge=1, le=100), db: Session = Depends(get_db)
+):
+    try:
+        user = request.state.user
+        crud_quiz.get_quiz_by_id(db=db, quiz_id=quiz_id, user_id=user.id)
+        return crud_quiz_leaderboard.get_quiz_top(db=db, quiz_id=quiz_id, limit=limit)
+    except NotFoundError as e:
+        logger.warning(str(e))
+        raise e
+    except AuthorizationError as e:
+        logger.warning(str(e))
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching quiz leaderboard: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving quiz leaderboard")
+
+# Caller's rank on a quiz
+@router.get("/leaderboard/{quiz_id}/me", response_model=QuizLeaderboardEntry, status_code=status.HTTP_200_OK)
+def get_my_quiz_rank(request: Request, quiz_id: int, db: Session = Depends(get_db)):
+    try:
+        user = request.state.user
+        return crud_quiz_leaderboard.get_quiz_rank(db=db, quiz_id=quiz_id, user=user)
+    except NotFoundError as e:
+        logger.warning(str(e))
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching quiz rank: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving quiz rank")
@@ -1,7 +1,13 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from app.schemas.user import UserFullCreate, User as UserSchema
+from app.schemas.user import (
+    UserFullCreate,
+    User as UserSchema,
+    TeacherListPage,
+    StudentListPage,
+)
+from typing import Optional
 from app.crud.crud_user import crud_user
 from sqlalchemy.exc import IntegrityError
 from app.core.exceptions import ValidationError, DatabaseError, NotFoundError
@@ -18,7 +24,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
 
 # register
 @router.post("/register", status_code=status.HTTP_201_CREATED)
-async def register_user(user_in: UserFullCreate, db: Session = Depends(get_db)):
+def register_user(user_in: UserFullCreate, db: Session = Depends(get_db)):
     try:
         user = crud_user.create_user(db=db, user_in=user_in)
         logger.info(f"User registered successfully: {user.email}")
@@ -77,6 +83,33 @@ def get_teachers(db: Session = Depends(get_db)):
         raise DatabaseError("Unexpected error occurred while retrieving Teachers")
 
 
+# get teachers page
+@router.get("/teachers/page", response_model=TeacherListPage)
+def get_teachers_page(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    school: Optional[str] = None,
+    city: Optional[str] = None,
+    province: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        teachers, total, next_cursor = crud_user.get_teachers_page(
+            db, limit, cursor, school=school, city=city, province=province
+        )
+        return TeacherListPage(
+            teachers=[build_teacher_list_response(t, db) for t in teachers],
+            total=total,
+            next_cursor=next_cursor,
+        )
+    except ValidationError as e:
+        logger.warning(f"Validation error fetching Teachers: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching Teachers: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving Teachers")
+
+
 # get students
 @router.get("/students")
 def get_students(db: Session = Depends(get_db)):
@@ -94,6 +127,40 @@ def get_students(db: Session = Depends(get_db)):
         raise DatabaseError("Unexpected error occurred while retrieving Students")
 
 
+# get students page
+@router.get("/students/page", response_model=StudentListPage)
+def get_students_page(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    grade: Optional[int] = Query(None, ge=1, le=13),
+    school: Optional[str] = None,
+    city: Optional[str] = None,
+    province: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    try:
+        students, total, next_cursor = crud_user.get_students_page(
+            db,
+            limit,
+            cursor,
+            grade=grade,
+            school=school,
+            city=city,
+            province=province,
+        )
+        return StudentListPage(
+            students=[build_student_list_response(s, db) for s in students],
+            total=total,
+            next_cursor=next_cursor,
+        )
+    except ValidationError as e:
+        logger.warning(f"Validation error fetching Students: {str(e)}")
+        raise e
+    except Exception as e:
+        logger.error(f"Unexpected error fetching Students: {str(e)}")
+        raise DatabaseError("Unexpected error occurred while retrieving Students")
+
+
 # Most engaging users
 @router.get("/most_engaging", status_code=status.HTTP_200_OK)
 def get_most_engaging_users(db: Session = Depends(get_db)):
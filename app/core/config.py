@@ -1,3 +1,5 @@
+from pathlib import Path
+from typing import Optional
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
@@ -6,10 +8,27 @@ load_dotenv()
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # defaults to DATABASE_URL with its async driver (asyncpg / aiosqlite)
+    ASYNC_DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     CLIENT_URL: str
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_MAX_SIZE: int = 10000
+    SCORE_LEVEL_CACHE_TTL_SECONDS: int = 300
+    SCORE_WRITE_BEHIND: bool = False
+    SCORE_FLUSH_INTERVAL_MS: int = 500
+    SCORE_FLUSH_MAX_EVENTS: int = 500
+    # each process spools to "<path>.<pid>"; relative paths resolve against the cwd
+    SCORE_SPOOL_PATH: str = str(Path(__file__).resolve().parents[2] / "score_deltas.spool")
+    COURSE_KEY_CACHE_TTL_SECONDS: int = 300
+    COURSE_KEY_CACHE_MAX_SIZE: int = 256
 
     class Config:
         env_file = ".env"
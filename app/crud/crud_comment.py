@@ -1,6 +1,9 @@
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.comment import Comments
-from app.schemas.post import CommentResponse, CommentCreate
+from app.models.user import User
+from app.schemas.post import CommentResponse, CommentCreate, CommentPage
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.core.exceptions import (
     DatabaseError,
@@ -8,7 +11,12 @@ from app.core.exceptions import (
     NotFoundError,
 )
 import logging
-from app.services.format_comment import format_comment
+from app.services.format_comment import build_comment_tree, format_comment
+from typing import Optional, List
+from app.services.post_counters import adjust_post_counters
+from app.services.interaction_score_update import update_user_score
+from app.constants.score_update_values import SCORE_UPDATE_VALUES
+from app.utils.pagination import encode_cursor, decode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +33,10 @@ class CRUDComment:
             )
             db.add(comment)
             db.flush()
+            adjust_post_counters(db, new_comment.post_id, comment_count=1)
+            update_user_score(
+                db, SCORE_UPDATE_VALUES["COMMENT_POST"], user_id, commit=False
+            )
             db.commit()
             logger.info("Commented Successfully")
             return comment
@@ -41,23 +53,149 @@ class CRUDComment:
             logger.error(f"Unexpected error creating comment: {str(e)}")
 
     # get all post comment
-    def get_comments_by_post_id(self, db: Session, post_id: int):
+    async def get_comments_by_post_id(
+        self,
+        db: AsyncSession,
+        post_id: int,
+        max_depth: Optional[int] = None,
+        reply_limit: Optional[int] = None,
+    ):
         try:
-            top_level_comments = (
-                db.query(Comments)
-                .filter(Comments.post_id == post_id, Comments.parent_comment_id == None)
-                .all()
+            result = await db.execute(
+                self._comment_select()
+                .where(Comments.post_id == post_id)
+                .order_by(Comments.created_at, Comments.id)
+            )
+            formatted_comments = build_comment_tree(
+                result.all(), max_depth=max_depth, reply_limit=reply_limit
             )
-            if not top_level_comments:
+            if not formatted_comments:
                 raise NotFoundError("No Comments Available")
-
-            formatted_comments = [
-                format_comment(comment) for comment in top_level_comments
-            ]
             return formatted_comments
         except SQLAlchemyError as e:
             logger.error(f"Error fetching comments by post id: {str(e)}")
             raise DatabaseError("Failed to fetch comments post by id")
 
+    # get top level comments page with reply counts and first replies inline
+    async def get_comment_page(
+        self,
+        db: AsyncSession,
+        post_id: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        replies_per_comment: int = 3,
+    ) -> CommentPage:
+        try:
+            stmt = self._comment_select().where(
+                Comments.post_id == post_id, Comments.parent_comment_id == None
+            )
+            rows, next_cursor = await self._page(db, stmt, limit, cursor)
+            comments = [format_comment(row) for row in rows]
+            parent_ids = [comment.id for comment in comments]
+
+            if replies_per_comment and parent_ids:
+                position = (
+                    func.row_number()
+                    .over(
+                        partition_by=Comments.parent_comment_id,
+                        order_by=(Comments.created_at, Comments.id),
+                    )
+                    .label("position")
+                )
+                ranked = (
+                    select(Comments.id.label("id"), position)
+                    .where(
+                        Comments.post_id == post_id,
+                        Comments.parent_comment_id.in_(parent_ids),
+                    )
+                    .subquery()
+                )
+                result = await db.execute(
+                    self._comment_select()
+                    .join(ranked, ranked.c.id == Comments.id)
+                    .where(ranked.c.position <= replies_per_comment)
+                    .order_by(Comments.created_at, Comments.id)
+                )
+                by_id = {comment.id: comment for comment in comments}
+                for row in result.all():
+                    reply = format_comment(row)
+                    by_id[reply.parent_comment_id].replies.append(reply)
+
+            await self._attach_reply_counts(
+                db, post_id, comments + [r for c in comments for r in c.replies]
+            )
+            return CommentPage(comments=comments, next_cursor=next_cursor)
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching comment page: {str(e)}")
+            raise DatabaseError("Failed to fetch comments")
+
+    # get replies page of a comment
+    async def get_reply_page(
+        self,
+        db: AsyncSession,
+        comment_id: int,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> CommentPage:
+        try:
+            parent = await db.get(Comments, comment_id)
+            if not parent:
+                raise NotFoundError("Comment not found")
+
+            stmt = self._comment_select().where(
+                Comments.post_id == parent.post_id,
+                Comments.parent_comment_id == comment_id,
+            )
+            rows, next_cursor = await self._page(db, stmt, limit, cursor)
+            replies = [format_comment(row) for row in rows]
+            await self._attach_reply_counts(db, parent.post_id, replies)
+            return CommentPage(comments=replies, next_cursor=next_cursor)
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching comment replies: {str(e)}")
+            raise DatabaseError("Failed to fetch replies")
+
+    def _comment_select(self):
+        return select(
+            Comments,
+            User.name.label("user_name"),
+            User.image.label("user_image"),
+        ).join(User, User.id == Comments.user_id)
+
+    # keyset page, oldest first
+    async def _page(self, db: AsyncSession, stmt, limit: int, cursor: Optional[str]):
+        if cursor:
+            created_at, comment_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(Comments.created_at, Comments.id) > tuple_(created_at, comment_id)
+            )
+        result = await db.execute(
+            stmt.order_by(Comments.created_at, Comments.id).limit(limit + 1)
+        )
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1].Comments
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return rows, next_cursor
+
+    async def _attach_reply_counts(
+        self, db: AsyncSession, post_id: int, comments: List[CommentResponse]
+    ):
+        if not comments:
+            return
+        result = await db.execute(
+            select(Comments.parent_comment_id, func.count(Comments.id))
+            .where(
+                Comments.post_id == post_id,
+                Comments.parent_comment_id.in_([c.id for c in comments]),
+            )
+            .group_by(Comments.parent_comment_id)
+        )
+        counts = dict(result.all())
+        for comment in comments:
+            comment.reply_count = counts.get(comment.id, 0)
+
 
 crud_comment = CRUDComment()
@@ -1,68 +1,33 @@
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from app.models.course import Course, CourseQuestion, CourseAnswer
-from app.schemas.course import CourseCreate, CourseResponse
+from app.models.course import Course, CourseQuestion, CourseAnswer, CourseAttempt, CourseCompletion
+from app.schemas.course import (
+    CourseCreate, CourseQuestionCreate, CourseResponse, CourseAttemptCreate, CourseAttemptResponse
+)
 from app.core.exceptions import (
     DatabaseError, ValidationError, NotFoundError, AuthorizationError
 )
 from datetime import datetime
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.services.course_answer_key import answer_key_cache
+from app.services.interaction_score_update import update_user_score
+from app.constants.score_update_values import SCORE_UPDATE_VALUES
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
 class CRUDCourse:
-    def create_course(self, db: Session, new_course: CourseCreate):
+    def create_course(self, db: Session, new_course: CourseCreate, user_id: int):
         try:
-            # Map media/resources/thumbnail lists to columns
-            media = new_course.media or []
-            resources = new_course.resources or []
-            thumbnail = new_course.thumbnail or []
-            course = Course(
-                title=new_course.title,
-                description=new_course.description,
-                thumbnail_url=thumbnail[0] if thumbnail else None,
-                media_url_1=media[0] if len(media) > 0 else None,
-                media_url_2=media[1] if len(media) > 1 else None,
-                media_url_3=media[2] if len(media) > 2 else None,
-                media_url_4=media[3] if len(media) > 3 else None,
-                media_url_5=media[4] if len(media) > 4 else None,
-                media_url_6=media[5] if len(media) > 5 else None,
-                media_url_7=media[6] if len(media) > 6 else None,
-                media_url_8=media[7] if len(media) > 7 else None,
-                media_url_9=media[8] if len(media) > 8 else None,
-                media_url_10=media[9] if len(media) > 9 else None,
-                media_url_11=media[10] if len(media) > 10 else None,
-                media_url_12=media[11] if len(media) > 11 else None,
-                media_url_13=media[12] if len(media) > 12 else None,
-                media_url_14=media[13] if len(media) > 13 else None,
-                media_url_15=media[14] if len(media) > 14 else None,
-                resource_url_1=resources[0] if len(resources) > 0 else None,
-                resource_url_2=resources[1] if len(resources) > 1 else None,
-                resource_url_3=resources[2] if len(resources) > 2 else None,
-                resource_url_4=resources[3] if len(resources) > 3 else None,
-                resource_url_5=resources[4] if len(resources) > 4 else None,
-                marks_for_pass=new_course.marks_for_pass,
-                applicable_grade=new_course.applicable_grade,
-                applicable_level=new_course.applicable_level,
-            )
+            course = Course(**self._course_columns(new_course))
             db.add(course)
             db.flush()
-            # Add questions and answers
-            for q in new_course.questions:
-                question = CourseQuestion(
-                    course_id=course.id,
-                    question=q.question,
-                    correct_answer=q.correct_answer,
-                    marks=q.marks,
-                )
-                db.add(question)
-                db.flush()
-                for ans in q.answers:
-                    answer = CourseAnswer(
-                        question_id=question.id,
-                        answer=ans,
-                    )
-                    db.add(answer)
+            # Add questions and answers: one multi-row INSERT each
+            self._insert_questions(db, course.id, new_course.questions)
+            update_user_score(db, SCORE_UPDATE_VALUES["CREATE_COURSE"], user_id, commit=False)
             db.commit()
             db.refresh(course)
             logger.info("Course created successfully")
@@ -80,123 +45,188 @@ class CRUDCourse:
             logger.error(f"Unexpected error creating course: {str(e)}")
             raise DatabaseError("An unexpected error occurred")
 
-    def get_course_by_id(self, db: Session, course_id: int):
+    def get_course_by_id(self, db: Session, course_id: int, include_answer_key: bool = True):
         try:
-            course = db.get(Course, course_id)
+            course = (
+                self._course_detail_query(db)
+                .filter(Course.id == course_id)
+                .one_or_none()
+            )
             if not course:
                 raise NotFoundError("Course not found")
-            # Build media/resources/thumbnail lists
-            media = [getattr(course, f"media_url_{i}") for i in range(1, 16) if getattr(course, f"media_url_{i}")]
-            resources = [getattr(course, f"resource_url_{i}") for i in range(1, 6) if getattr(course, f"resource_url_{i}")]
-            thumbnail = [course.thumbnail_url] if course.thumbnail_url else []
-            # Build questions and answers
-            questions = []
-            for q in course.questions:
-                answers = [a.answer for a in q.answers]
-                questions.append({
-                    "id": q.id,
-                    "question": q.question,
-                    "answers": answers,
-                    "correctAnswer": q.correct_answer,
-                    "marks": q.marks,
-                })
-            return {
-                "id": course.id,
-                "title": course.title,
-                "description": course.description,
-                "thumbnail": thumbnail,
-                "media": media,
-                "resources": resources,
-                "marksForPass": course.marks_for_pass,
-                "applicableGrade": course.applicable_grade,
-                "applicableLevel": course.applicable_level,
-                "questions": questions,
-                "created_at": course.created_at,
-            }
+            return self._build_course_detail(course, include_answer_key)
         except SQLAlchemyError as e:
             logger.error(f"Error fetching course by id: {str(e)}")
             raise DatabaseError("Failed to fetch course by id")
 
-    def get_courses(self, db: Session):
+    def get_courses(self, db: Session, include_answer_key: bool = True):
         try:
-            courses = db.query(Course).all()
+            courses = self._course_detail_query(db).all()
             if not courses:
                 raise NotFoundError("No courses found")
-            response_courses = []
-            for course in courses:
-                media = [getattr(course, f"media_url_{i}") for i in range(1, 16) if getattr(course, f"media_url_{i}")]
-                resources = [getattr(course, f"resource_url_{i}") for i in range(1, 6) if getattr(course, f"resource_url_{i}")]
-                thumbnail = [course.thumbnail_url] if course.thumbnail_url else []
-                questions = []
-                for q in course.questions:
-                    answers = [a.answer for a in q.answers]
-                    questions.append({
-                        "id": q.id,
-                        "question": q.question,
-                        "answers": answers,
-                        "correctAnswer": q.correct_answer,
-                        "marks": q.marks,
-                    })
-                formatted_course = {
-                    "id": course.id,
-                    "title": course.title,
-                    "description": course.description,
-                    "thumbnail": thumbnail,
-                    "media": media,
-                    "resources": resources,
-                    "marksForPass": course.marks_for_pass,
-                    "applicableGrade": course.applicable_grade,
-                    "applicableLevel": course.applicable_level,
-                    "questions": questions,
-                    "created_at": course.created_at,
-                }
-                response_courses.append(formatted_course)
-            return response_courses
+            return [self._build_course_detail(course, include_answer_key) for course in courses]
         except SQLAlchemyError as e:
             logger.error(f"Error fetching courses: {str(e)}")
             raise DatabaseError("Failed to fetch courses")
 
+    # Summary columns + question count only, newest first, cursor paginated
+    def get_course_summaries(
+        self,
+        db: Session,
+        limit: int,
+        cursor: Optional[str] = None,
+        applicable_grade: Optional[str] = None,
+        applicable_level: Optional[str] = None,
+    ):
+        try:
+            question_count = (
+                select(func.count(CourseQuestion.id))
+                .where(CourseQuestion.course_id == Course.id)
+                .scalar_subquery()
+            )
+            query = db.query(
+                Course.id,
+                Course.title,
+                Course.thumbnail_url,
+                Course.marks_for_pass,
+                Course.applicable_grade,
+                Course.applicable_level,
+                Course.created_at,
+                question_count.label("question_count"),
+            )
+            if applicable_grade:
+                query = query.filter(Course.applicable_grade == applicable_grade)
+            if applicable_level:
+                query = query.filter(Course.applicable_level == applicable_level)
+            if cursor:
+                created_at, course_id = decode_cursor(cursor)
+                query = query.filter(tuple_(Course.created_at, Course.id) < tuple_(created_at, course_id))
+            rows = query.order_by(Course.created_at.desc(), Course.id.desc()).limit(limit + 1).all()
+
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+            return {
+                "courses": [
+                    {
+                        "id": row.id,
+                        "title": row.title,
+                        "thumbnail": [row.thumbnail_url] if row.thumbnail_url else [],
+                        "marksForPass": row.marks_for_pass,
+                        "applicableGrade": row.applicable_grade,
+                        "applicableLevel": row.applicable_level,
+                        "questionCount": row.question_count,
+                        "created_at": row.created_at,
+                    }
+                    for row in rows
+                ],
+                "next_cursor": next_cursor,
+            }
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching course summaries: {str(e)}")
+            raise DatabaseError("Failed to fetch courses")
+
+    # Questions and their answers come in two IN-list queries, not one per question
+    def _course_detail_query(self, db: Session):
+        return db.query(Course).options(
+            selectinload(Course.questions).selectinload(CourseQuestion.answers)
+        )
+
+    def _build_course_detail(self, course: Course, include_answer_key: bool = True) -> dict:
+        # Build media/resources/thumbnail lists
+        media = [getattr(course, f"media_url_{i}") for i in range(1, 16) if getattr(course, f"media_url_{i}")]
+        resources = [getattr(course, f"resource_url_{i}") for i in range(1, 6) if getattr(course, f"resource_url_{i}")]
+        thumbnail = [course.thumbnail_url] if course.thumbnail_url else []
+        # Build questions and answers
+        questions = []
+        for q in course.questions:
+            answers = [a.answer for a in q.answers]
+            questions.append({
+                "id": q.id,
+                "question": q.question,
+                "answers": answers,
+                "correctAnswer": q.correct_answer if include_answer_key else None,
+                "marks": q.marks,
+            })
+        return {
+            "id": course.id,
+            "title": course.title,
+            "description": course.description,
+            "thumbnail": thumbnail,
+            "media": media,
+            "resources": resources,
+            "marksForPass": course.marks_for_pass,
+            "applicableGrade": course.applicable_grade,
+            "applicableLevel": course.applicable_level,
+            "questions": questions,
+            "created_at": course.created_at,
+        }
+
     def update_course(self, db: Session, course_id: int, course_update: CourseCreate):
         try:
             course = db.get(Course, course_id)
             if not course:
                 raise NotFoundError("Course not found")
             # Update simple fields
-            course.title = course_update.title
-            course.description = course_update.description
-            thumbnail = course_update.thumbnail or []
-            course.thumbnail_url = thumbnail[0] if thumbnail else None
-            media = course_update.media or []
-            for i in range(1, 16):
-                setattr(course, f"media_url_{i}", media[i-1] if len(media) >= i else None)
-            resources = course_update.resources or []
-            for i in range(1, 6):
-                setattr(course, f"resource_url_{i}", resources[i-1] if len(resources) >= i else None)
-            course.marks_for_pass = course_update.marks_for_pass
-            course.applicable_grade = course_update.applicable_grade
-            course.applicable_level = course_update.applicable_level
-            # Remove old questions/answers
-            for q in course.questions:
-                db.query(CourseAnswer).filter(CourseAnswer.question_id == q.id).delete()
-            db.query(CourseQuestion).filter(CourseQuestion.course_id == course.id).delete()
-            db.flush()
-            # Add new questions/answers
-            for q in course_update.questions:
-                question = CourseQuestion(
-                    course_id=course.id,
-                    question=q.question,
-                    correct_answer=q.correct_answer,
-                    marks=q.marks,
+            for field, value in self._course_columns(course_update).items():
+                setattr(course, field, value)
+
+            # Diff questions/answers by position so unchanged rows keep their ids
+            existing_questions = (
+                db.query(CourseQuestion)
+                .filter(CourseQuestion.course_id == course_id)
+                .order_by(CourseQuestion.id)
+                .all()
+            )
+            existing_answers = {}
+            for answer in (
+                db.query(CourseAnswer)
+                .filter(CourseAnswer.question_id.in_([q.id for q in existing_questions]))
+                .order_by(CourseAnswer.id)
+            ):
+                existing_answers.setdefault(answer.question_id, []).append(answer)
+
+            question_updates, answer_updates, answer_inserts = [], [], []
+            stale_answer_ids = []
+            for question, q in zip(existing_questions, course_update.questions):
+                if (question.question, question.correct_answer, question.marks) != (
+                    q.question, q.correct_answer, q.marks
+                ):
+                    question_updates.append({
+                        "id": question.id,
+                        "question": q.question,
+                        "correct_answer": q.correct_answer,
+                        "marks": q.marks,
+                    })
+                answers = existing_answers.get(question.id, [])
+                for answer, text in zip(answers, q.answers):
+                    if answer.answer != text:
+                        answer_updates.append({"id": answer.id, "answer": text})
+                answer_inserts.extend(
+                    {"question_id": question.id, "answer": text} for text in q.answers[len(answers):]
                 )
-                db.add(question)
-                db.flush()
-                for ans in q.answers:
-                    answer = CourseAnswer(
-                        question_id=question.id,
-                        answer=ans,
-                    )
-                    db.add(answer)
+                stale_answer_ids.extend(answer.id for answer in answers[len(q.answers):])
+
+            stale_question_ids = [q.id for q in existing_questions[len(course_update.questions):]]
+            stale_answer_ids.extend(
+                answer.id for question_id in stale_question_ids for answer in existing_answers.get(question_id, [])
+            )
+
+            if stale_answer_ids:
+                db.execute(delete(CourseAnswer).where(CourseAnswer.id.in_(stale_answer_ids)))
+            if stale_question_ids:
+                db.execute(delete(CourseQuestion).where(CourseQuestion.id.in_(stale_question_ids)))
+            if question_updates:
+                db.execute(update(CourseQuestion), question_updates)
+            if answer_updates:
+                db.execute(update(CourseAnswer), answer_updates)
+            if answer_inserts:
+                db.execute(insert(CourseAnswer), answer_inserts)
+            self._insert_questions(db, course_id, course_update.questions[len(existing_questions):])
             db.commit()
+            answer_key_cache.invalidate(course_id)
             db.refresh(course)
             logger.info("Course updated successfully")
             return course
@@ -218,8 +248,14 @@ class CRUDCourse:
             course = db.get(Course, course_id)
             if not course:
                 raise NotFoundError("Course not found")
-            db.delete(course)
+            question_ids = select(CourseQuestion.id).where(CourseQuestion.course_id == course_id)
+            db.execute(delete(CourseAnswer).where(CourseAnswer.question_id.in_(question_ids)))
+            db.execute(delete(CourseQuestion).where(CourseQuestion.course_id == course_id))
+            db.execute(delete(CourseAttempt).where(CourseAttempt.course_id == course_id))
+            db.execute(delete(CourseCompletion).where(CourseCompletion.course_id == course_id))
+            db.execute(delete(Course).where(Course.id == course_id))
             db.commit()
+            answer_key_cache.invalidate(course_id)
             logger.info("Course deleted successfully")
             return True
         except SQLAlchemyError as e:
@@ -231,4 +267,105 @@ class CRUDCourse:
             logger.error(f"Unexpected error deleting course: {str(e)}")
             raise DatabaseError("An unexpected error occurred")
 
+    # Grade an attempt against the cached answer key; VIEW_COURSE is credited on first pass
+    def submit_attempt(self, db: Session, course_id: int, user_id: int, attempt: CourseAttemptCreate):
+        try:
+            key = answer_key_cache.get(db, course_id)
+            # with no questions there is nothing to grade and no pass mark to beat
+            if not key.question_ids:
+                raise ValidationError("Course has no questions to attempt")
+            unknown = attempt.answers.keys() - set(key.question_ids)
+            if unknown:
+                raise ValidationError(f"Questions not in this course: {sorted(unknown)}")
+            score, correct_count = key.grade(attempt.answers)
+            passed = score >= key.pass_marks
+
+            course_attempt = CourseAttempt(
+                course_id=course_id,
+                user_id=user_id,
+                score=score,
+                total_marks=key.total_marks,
+                passed=passed,
+            )
+            db.add(course_attempt)
+            db.flush()
+            credited = False
+            if passed:
+                dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+                credited = db.execute(
+                    dialect.insert(CourseCompletion)
+                    .values(course_id=course_id, user_id=user_id, completed_at=datetime.utcnow())
+                    .on_conflict_do_nothing(index_elements=["course_id", "user_id"])
+                    .returning(CourseCompletion.course_id)
+                ).first() is not None
+                if credited:
+                    update_user_score(db, SCORE_UPDATE_VALUES["VIEW_COURSE"], user_id, commit=False)
+            db.commit()
+            logger.info(f"Course attempt graded: {score}/{key.total_marks}")
+            return CourseAttemptResponse(
+                id=course_attempt.id,
+                course_id=course_id,
+                score=score,
+                total_marks=key.total_marks,
+                correct_count=correct_count,
+                question_count=len(key.question_ids),
+                passed=passed,
+                credited=credited,
+                created_at=course_attempt.created_at,
+            )
+        except (NotFoundError, ValidationError):
+            db.rollback()
+            raise
+        except IntegrityError as e:
+            db.rollback()
+            logger.error(f"Error submitting course attempt: {str(e)}")
+            raise ValidationError(str(e))
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"Error submitting course attempt: {str(e)}")
+            raise DatabaseError("Failed to submit course attempt")
+
+    # Map media/resources/thumbnail lists to columns
+    def _course_columns(self, course_in: CourseCreate) -> dict:
+        media = course_in.media or []
+        resources = course_in.resources or []
+        thumbnail = course_in.thumbnail or []
+        columns = {
+            "title": course_in.title,
+            "description": course_in.description,
+            "thumbnail_url": thumbnail[0] if thumbnail else None,
+            "marks_for_pass": course_in.marks_for_pass,
+            "applicable_grade": course_in.applicable_grade,
+            "applicable_level": course_in.applicable_level,
+        }
+        for i in range(1, 16):
+            columns[f"media_url_{i}"] = media[i-1] if len(media) >= i else None
+        for i in range(1, 6):
+            columns[f"resource_url_{i}"] = resources[i-1] if len(resources) >= i else None
+        return columns
+
+    # Bulk insert questions (RETURNING ids in input order), then all their answers
+    def _insert_questions(self, db: Session, course_id: int, questions: List[CourseQuestionCreate]):
+        if not questions:
+            return
+        question_ids = db.execute(
+            insert(CourseQuestion).returning(CourseQuestion.id, sort_by_parameter_order=True),
+            [
+                {
+                    "course_id": course_id,
+                    "question": q.question,
+                    "correct_answer": q.correct_answer,
+                    "marks": q.marks,
+                }
+                for q in questions
+            ],
+        ).scalars().all()
+        answers = [
+            {"question_id": question_id, "answer": text}
+            for question_id, q in zip(question_ids, questions)
+            for text in q.answers
+        ]
+        if answers:
+            db.execute(insert(CourseAnswer), answers)
+
 crud_course = CRUDCourse()
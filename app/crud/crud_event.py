@@ -5,16 +5,23 @@ from app.schemas.events import (
     EventInterestsCreate,
     EventInterestResponse,
     EventResponse,
+    EventPage,
     UserPreview,
 )
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.core.exceptions import (
     DatabaseError,
     ValidationError,
     NotFoundError,
 )
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.services.interaction_score_update import update_user_score
+from app.constants.score_update_values import SCORE_UPDATE_VALUES
 from datetime import datetime, timezone
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +44,7 @@ class CRUDEvents:
             )
             db.add(event)
             db.flush()
+            update_user_score(db, SCORE_UPDATE_VALUES["CREATE_EVENT"], user_id, commit=False)
             db.commit()
             db.refresh(event)
             logger.info("Created Successfully")
@@ -54,46 +62,22 @@ class CRUDEvents:
             logger.error(f"Unexpected error: {str(e)}")
             raise DatabaseError("Failed to create event")
 
-    # get all active events
-    def get_all_active_events(self, db: Session):
+    # get all active events (soonest first)
+    def get_all_active_events(self, db: Session, user_id: int):
         try:
             events = (
-                db.query(Event)
+                self._events_query(db)
                 .filter(Event.date_time >= datetime.now(tz=timezone.utc))
+                .order_by(Event.date_time, Event.id)
                 .all()
             )
             if not events:
                 raise NotFoundError("No Events Available")
-
-            formatted_events = []
-            for event in events:
-                formatted_user = UserPreview(
-                    id=event.user.id,
-                    name=event.user.name,
-                    image=event.user.image,
-                )
-
-                formatted_event = EventResponse(
-                    id=event.id,
-                    title=event.title,
-                    date_time=event.date_time,
-                    location=event.location,
-                    description=event.description,
-                    media_url_one=event.media_url_one,
-                    media_url_two=event.media_url_two,
-                    media_url_three=event.media_url_three,
-                    media_url_four=event.media_url_four,
-                    media_url_five=event.media_url_five,
-                    created_at=event.created_at,
-                    user=formatted_user,
-                )
-                formatted_events.append(formatted_event)
-            return formatted_events
+            return self._attach_interests(
+                db, [self._build_event_response(event) for event in events], user_id
+            )
         except NotFoundError:
             raise
-        except IntegrityError as e:
-            logger.error(f"error: {str(e)}")
-            raise ValidationError(str(e))
         except SQLAlchemyError as e:
             logger.error(f"error: {str(e)}")
             raise DatabaseError("Failed to fetch events")
@@ -101,46 +85,78 @@ class CRUDEvents:
             logger.error(f"Unexpected error: {str(e)}")
             raise DatabaseError("Failed to fetch events")
 
-    # get all inactive events
-    def get_all_inactive_events(self, db: Session):
+    # get all inactive events (newest first)
+    def get_all_inactive_events(self, db: Session, user_id: int):
         try:
             events = (
-                db.query(Event)
+                self._events_query(db)
                 .filter(Event.date_time <= datetime.now(tz=timezone.utc))
+                .order_by(Event.date_time.desc(), Event.id.desc())
                 .all()
             )
             if not events:
                 raise NotFoundError("No Events Available")
+            return self._attach_interests(
+                db, [self._build_event_response(event) for event in events], user_id
+            )
+        except NotFoundError:
+            raise
+        except SQLAlchemyError as e:
+            logger.error(f"error: {str(e)}")
+            raise DatabaseError("Failed to fetch events")
+        except Exception as e:
+            logger.error(f"Unexpected error: {str(e)}")
+            raise DatabaseError("Failed to fetch events")
 
-            formatted_events = []
-            for event in events:
-                formatted_user = UserPreview(
-                    id=event.user.id,
-                    name=event.user.name,
-                    image=event.user.image,
+    # get inactive events (newest first, cursor paginated)
+    def get_inactive_events_page(
+        self, db: Session, user_id: int, limit: int, cursor: Optional[str] = None
+    ) -> EventPage:
+        try:
+            query = self._events_query(db).filter(
+                Event.date_time <= datetime.now(tz=timezone.utc)
+            )
+            if cursor:
+                date_time, event_id = decode_cursor(cursor)
+                query = query.filter(
+                    tuple_(Event.date_time, Event.id) < tuple_(date_time, event_id)
                 )
+            query = query.order_by(Event.date_time.desc(), Event.id.desc())
+            return self._page(db, query, limit, user_id)
+        except ValidationError:
+            raise
+        except SQLAlchemyError as e:
+            logger.error(f"error: {str(e)}")
+            raise DatabaseError("Failed to fetch events")
+        except Exception as e:
+            logger.error(f"Unexpected error: {str(e)}")
+            raise DatabaseError("Failed to fetch events")
 
-                formatted_event = EventResponse(
-                    id=event.id,
-                    title=event.title,
-                    date_time=event.date_time,
-                    location=event.location,
-                    description=event.description,
-                    media_url_one=event.media_url_one,
-                    media_url_two=event.media_url_two,
-                    media_url_three=event.media_url_three,
-                    media_url_four=event.media_url_four,
-                    media_url_five=event.media_url_five,
-                    created_at=event.created_at,
-                    user=formatted_user,
+    # get events in a calendar window (chronological, cursor paginated)
+    def get_events_in_range(
+        self,
+        db: Session,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> EventPage:
+        try:
+            if end < start:
+                raise ValidationError("'to' must not be before 'from'")
+            query = self._events_query(db).filter(
+                Event.date_time >= start, Event.date_time < end
+            )
+            if cursor:
+                date_time, event_id = decode_cursor(cursor)
+                query = query.filter(
+                    tuple_(Event.date_time, Event.id) > tuple_(date_time, event_id)
                 )
-                formatted_events.append(formatted_event)
-            return formatted_events
-        except NotFoundError:
+            query = query.order_by(Event.date_time, Event.id)
+            return self._page(db, query, limit, user_id)
+        except ValidationError:
             raise
-        except IntegrityError as e:
-            logger.error(f"error: {str(e)}")
-            raise ValidationError(str(e))
         except SQLAlchemyError as e:
             logger.error(f"error: {str(e)}")
             raise DatabaseError("Failed to fetch events")
@@ -149,33 +165,14 @@ class CRUDEvents:
             raise DatabaseError("Failed to fetch events")
 
     # get event by id
-    def get_event_by_id(self, db: Session, event_id: int):
+    def get_event_by_id(self, db: Session, event_id: int, user_id: int):
         try:
             event = db.get(Event, event_id)
             if not event:
                 raise NotFoundError("No Events Available")
-
-            formatted_user = UserPreview(
-                id=event.user.id,
-                name=event.user.name,
-                image=event.user.image,
-            )
-
-            formatted_event = EventResponse(
-                id=event.id,
-                title=event.title,
-                date_time=event.date_time,
-                location=event.location,
-                description=event.description,
-                media_url_one=event.media_url_one,
-                media_url_two=event.media_url_two,
-                media_url_three=event.media_url_three,
-                media_url_four=event.media_url_four,
-                media_url_five=event.media_url_five,
-                created_at=event.created_at,
-                user=formatted_user,
-            )
-            return formatted_event
+            return self._attach_interests(
+                db, [self._build_event_response(event)], user_id
+            )[0]
         except NotFoundError:
             raise
         except IntegrityError as e:
@@ -188,7 +185,71 @@ class CRUDEvents:
             logger.error(f"Unexpected error: {str(e)}")
             raise DatabaseError("Failed to fetch event")
 
-    # create event interest
+    # author preview comes back in the same query
+    def _events_query(self, db: Session):
+        return db.query(Event).options(joinedload(Event.user))
+
+    def _page(self, db: Session, query, limit: int, user_id: int) -> EventPage:
+        events = query.limit(limit + 1).all()
+        next_cursor = None
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = encode_cursor(events[-1].date_time, events[-1].id)
+        return EventPage(
+            events=self._attach_interests(
+                db, [self._build_event_response(event) for event in events], user_id
+            ),
+            next_cursor=next_cursor,
+        )
+
+    # interest counts per type + the caller's own interest, one grouped query
+    def _attach_interests(
+        self, db: Session, events: List[EventResponse], user_id: int
+    ) -> List[EventResponse]:
+        if not events:
+            return events
+        by_id = {event.id: event for event in events}
+        rows = (
+            db.query(
+                EventInterests.event_id,
+                EventInterests.interest_type,
+                func.count(EventInterests.id).label("count"),
+                func.max(case((EventInterests.user_id == user_id, 1), else_=0)).label(
+                    "mine"
+                ),
+            )
+            .filter(EventInterests.event_id.in_(by_id.keys()))
+            .group_by(EventInterests.event_id, EventInterests.interest_type)
+            .all()
+        )
+        for row in rows:
+            event = by_id[row.event_id]
+            event.interest_counts[row.interest_type] = row.count
+            if row.mine:
+                event.my_interest = row.interest_type
+        return events
+
+    def _build_event_response(self, event: Event) -> EventResponse:
+        return EventResponse(
+            id=event.id,
+            title=event.title,
+            date_time=event.date_time,
+            location=event.location,
+            description=event.description,
+            media_url_one=event.media_url_one,
+            media_url_two=event.media_url_two,
+            media_url_three=event.media_url_three,
+            media_url_four=event.media_url_four,
+            media_url_five=event.media_url_five,
+            created_at=event.created_at,
+            user=UserPreview(
+                id=event.user.id,
+                name=event.user.name,
+                image=event.user.image,
+            ),
+        )
+
+    # create or update event interest (single upsert)
     def create_event_interest(
         self,
         db: Session,
@@ -197,34 +258,31 @@ class CRUDEvents:
         user_id: int,
     ):
         try:
-            existing_interest = (
-                db.query(EventInterests)
-                .filter(
-                    EventInterests.event_id == event_id,
-                    EventInterests.user_id == user_id,
-                )
-                .first()
-            )
-            if existing_interest:
-                # Update existing interest
-                existing_interest.interest_type = new_interest.interest_type
-                db.commit()
-                db.refresh(existing_interest)
-                logger.info("interest updated")
-                return existing_interest
-
-            # Create new interest
-            event_interest = EventInterests(
+            dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+            stmt = dialect.insert(EventInterests).values(
                 interest_type=new_interest.interest_type,
                 user_id=user_id,
                 event_id=event_id,
+                created_at=datetime.utcnow(),
             )
-            db.add(event_interest)
-            db.flush()
+            row = db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["event_id", "user_id"],
+                    set_={"interest_type": stmt.excluded.interest_type},
+                ).returning(
+                    EventInterests.id,
+                    EventInterests.interest_type,
+                    EventInterests.created_at,
+                )
+            ).one()
+            update_user_score(db, SCORE_UPDATE_VALUES["INTEREST_EVENT"], user_id, commit=False)
             db.commit()
-            db.refresh(event_interest)
-            logger.info("Created Successfully")
-            return event_interest
+            logger.info("interest saved")
+            return EventInterestResponse(
+                id=row.id,
+                interest_type=row.interest_type,
+                created_at=row.created_at,
+            )
         except IntegrityError as e:
             db.rollback()
             logger.error(f"error: {str(e)}")
@@ -247,6 +305,7 @@ class CRUDEvents:
 
             interests = (
                 db.query(EventInterests)
+                .options(joinedload(EventInterests.user))
                 .filter(EventInterests.event_id == event_id)
                 .all()
             )
@@ -6,13 +6,15 @@ from app.schemas.exam_paper import ExamPaperCreate, ExamPaperUpdate, ExamPaperRe
 from app.core.exceptions import (
     DatabaseError, ValidationError, NotFoundError, AuthorizationError
 )
+from app.services.interaction_score_update import update_user_score
+from app.constants.score_update_values import SCORE_UPDATE_VALUES
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 class CRUDExamPaper:
     # Create exam paper
-    def create_exam_paper(self, db: Session, new_exam_paper: ExamPaperCreate):
+    def create_exam_paper(self, db: Session, new_exam_paper: ExamPaperCreate, user_id: int):
         try:
             # Map media list to individual media_url fields
             media = new_exam_paper.media or []
@@ -33,6 +35,7 @@ class CRUDExamPaper:
             )
             db.add(exam_paper)
             db.flush()
+            update_user_score(db, SCORE_UPDATE_VALUES["CREATE_EXAM_PAPER"], user_id, commit=False)
             db.commit()
             db.refresh(exam_paper)
             logger.info("Exam paper created successfully")
@@ -1,6 +1,9 @@
+from sqlalchemy import or_, select, tuple_
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.post import Post
-from app.schemas.post import PostCreate, PostResponse
+from app.models.user import User
+from app.schemas.post import PostCreate, PostResponse, PostFeedPage
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.core.exceptions import (
     DatabaseError,
@@ -8,6 +11,10 @@ from app.core.exceptions import (
     NotFoundError,
     AuthorizationError,
 )
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.constants.score_update_values import SCORE_UPDATE_VALUES
+from app.services.interaction_score_update import update_user_score
+from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,6 +34,9 @@ class CRUDPost:
             )
             db.add(post)
             db.flush()
+            update_user_score(
+                db, SCORE_UPDATE_VALUES["CREATE_POST"], user_id, commit=False
+            )
             db.commit()
             logger.info("Post created successfully")
             return post
@@ -44,91 +54,97 @@ class CRUDPost:
             raise DatabaseError("An unexpected error occurred")
 
     # get by id
-    def get_post_by_id(self, db: Session, post_id: int, user_id: int):
+    async def get_post_by_id(self, db: AsyncSession, post_id: int, user_id: int):
         try:
-            post = db.get(Post, post_id)
-            if not post:
+            result = await db.execute(self._post_select().where(Post.id == post_id))
+            row = result.first()
+            if not row:
                 raise NotFoundError("Post not found")
 
+            post = row.Post
             if not post.is_public and post.user_id != user_id:
                 raise AuthorizationError("Not Authorized to view")
 
-            comments_count = len(post.comment)
-            reaction_count = len(post.post_reaction)
-            avg_ratings = (
-                sum(r.ratings for r in post.post_rating) / len(post.post_rating)
-                if post.post_rating
-                else 0.0
-            )
-            posted_user = {
-                "id": post.user_id,
-                "name": post.user.name,
-                "image": post.user.image or None,
-            }
-
-            return PostResponse(
-                id=post.id,
-                media_type=post.media_type,
-                media_link=post.media_link,
-                title=post.title,
-                description=post.description,
-                is_public=post.is_public,
-                user=posted_user,
-                created_at=post.created_at,
-                updated_at=post.updated_at,
-                comments_number=comments_count or 0,
-                reaction_number=reaction_count or 0,
-                post_ratings=avg_ratings,
-            )
+            return self._build_feed_response(row)
 
         except SQLAlchemyError as e:
             logger.error(f"Error fetching post by id: {str(e)}")
             raise DatabaseError("Failed to fetch post by id")
 
     # get all
-    def get_posts(self, db: Session, user_id: int):
+    async def get_posts(self, db: AsyncSession, user_id: int):
         try:
-            posts = db.query(Post)
-            if not posts:
-                raise NotFoundError("Posts not found")
-
-            response_posts = []
-            for post in posts:
-                if not post.is_public and post.user_id != user_id:
-                    continue
-
-                comments_count = len(post.comment)
-                reaction_count = len(post.post_reaction)
-                avg_ratings = (
-                    sum(r.ratings for r in post.post_rating) / len(post.post_rating)
-                    if post.post_rating
-                    else 0.0
-                )
-                posted_user = {
-                    "id": post.user_id,
-                    "name": post.user.name,
-                    "image": post.user.image or None,
-                }
-
-                formatted_post = PostResponse(
-                    id=post.id,
-                    media_type=post.media_type,
-                    media_link=post.media_link,
-                    title=post.title,
-                    description=post.description,
-                    is_public=post.is_public,
-                    user=posted_user,
-                    created_at=post.created_at,
-                    updated_at=post.updated_at,
-                    comments_number=comments_count or 0,
-                    reaction_number=reaction_count or 0,
-                    post_ratings=avg_ratings,
+            rows = (await db.execute(self._feed_select(user_id))).all()
+            return [self._build_feed_response(row) for row in rows]
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching posts: {str(e)}")
+            raise DatabaseError("Failed to fetch posts")
+
+    # get feed page (keyset on created_at, id)
+    async def get_feed_page(
+        self, db: AsyncSession, user_id: int, limit: int, cursor: Optional[str] = None
+    ) -> PostFeedPage:
+        try:
+            stmt = self._feed_select(user_id)
+            if cursor:
+                created_at, post_id = decode_cursor(cursor)
+                stmt = stmt.where(
+                    tuple_(Post.created_at, Post.id) < tuple_(created_at, post_id)
                 )
-                response_posts.append(formatted_post)
-            return response_posts
+            stmt = stmt.order_by(Post.created_at.desc(), Post.id.desc()).limit(
+                limit + 1
+            )
+            rows = (await db.execute(stmt)).all()
+
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                last = rows[-1].Post
+                next_cursor = encode_cursor(last.created_at, last.id)
+
+            return PostFeedPage(
+                posts=[self._build_feed_response(row) for row in rows],
+                next_cursor=next_cursor,
+            )
         except SQLAlchemyError as e:
-            logger.error(f"Error fetching post by id: {str(e)}")
-            raise DatabaseError("Failed to fetch post by id")
+            logger.error(f"Error fetching post feed: {str(e)}")
+            raise DatabaseError("Failed to fetch post feed")
+
+    # post + author preview columns; engagement comes from the counter columns
+    def _post_select(self):
+        return select(
+            Post,
+            User.name.label("user_name"),
+            User.image.label("user_image"),
+        ).join(User, User.id == Post.user_id)
+
+    def _feed_select(self, user_id: int):
+        return self._post_select().where(
+            or_(Post.is_public == True, Post.user_id == user_id)
+        )
+
+    def _build_feed_response(self, row) -> PostResponse:
+        post = row.Post
+        return PostResponse(
+            id=post.id,
+            media_type=post.media_type,
+            media_link=post.media_link,
+            title=post.title,
+            description=post.description,
+            is_public=post.is_public,
+            user={
+                "id": post.user_id,
+                "name": row.user_name,
+                "image": row.user_image or None,
+            },
+            created_at=post.created_at,
+            updated_at=post.updated_at,
+            comments_number=post.comment_count,
+            reaction_number=post.reaction_count,
+            post_ratings=(
+                post.rating_sum / post.rating_count if post.rating_count else 0.0
+            ),
+        )
 
 
 crud_post = CRUDPost()
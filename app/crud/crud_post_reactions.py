@@ -1,60 +1,117 @@
 import logging
-from app.models.post_reaction import PostReactions
+from datetime import datetime
+from app.models.post import Post
+from app.models.post_reaction import PostReactions, PostReactionCounts
+from sqlalchemy import delete, insert, or_, select, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from app.schemas.post import ReactionCreate
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.post import ReactionCreate, ReactionState, ReactionSummary
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.core.exceptions import (
     DatabaseError,
     ValidationError,
     NotFoundError,
 )
-import logging
-from app.services.format_comment import format_comment
+from app.services.post_counters import (
+    adjust_post_counters,
+    adjust_reaction_counts,
+    adjust_reaction_counters,
+)
+from app.services.interaction_score_update import update_user_score
+from app.constants.score_update_values import SCORE_UPDATE_VALUES
+from typing import List
 
 logger = logging.getLogger(__name__)
 
+REACTION_COUNT_DELTAS = {"created": 1, "updated": 0, "deleted": -1, "unchanged": 0}
+
+# lock the caller's row, then: same type deletes (toggle off), another type
+# switches it, no row inserts. An insert that loses a race with a concurrent
+# first tap returns nothing and is reported as unchanged.
+TOGGLE_REACTION_SQL = text(
+    """
+    WITH previous AS (
+        SELECT id, reaction_type_id FROM post_reactions
+        WHERE post_id = :post_id AND user_id = :user_id
+        FOR UPDATE
+    ), deleted AS (
+        DELETE FROM post_reactions
+        WHERE id IN (
+            SELECT id FROM previous WHERE reaction_type_id = :reaction_type_id
+        )
+        RETURNING id
+    ), updated AS (
+        UPDATE post_reactions SET reaction_type_id = :reaction_type_id
+        WHERE id IN (
+            SELECT id FROM previous
+            WHERE reaction_type_id IS DISTINCT FROM :reaction_type_id
+        )
+        RETURNING id
+    ), inserted AS (
+        INSERT INTO post_reactions (reaction_type_id, post_id, user_id, created_at)
+        SELECT :reaction_type_id, :post_id, :user_id, :created_at
+        WHERE NOT EXISTS (SELECT 1 FROM previous)
+        ON CONFLICT (post_id, user_id) DO NOTHING
+        RETURNING id
+    )
+    SELECT 'deleted' AS state, id, (SELECT reaction_type_id FROM previous) AS previous_type_id
+    FROM deleted
+    UNION ALL
+    SELECT 'updated', id, (SELECT reaction_type_id FROM previous) FROM updated
+    UNION ALL
+    SELECT 'created', id, NULL FROM inserted
+    """
+)
+
 
 class CRUDPostReaction:
-    # create
+    # create / switch / toggle off
     def react_to_a_post(self, db: Session, new_react: ReactionCreate, user_id: int):
         try:
-
-            existing_react = (
-                db.query(PostReactions)
-                .filter(
-                    PostReactions.post_id == new_react.post_id,
-                    PostReactions.user_id == user_id,
+            if db.get_bind().dialect.name == "postgresql":
+                state, reaction_id, previous_type_id = self._toggle(
+                    db, new_react, user_id
                 )
-                .first()
-            )
-            if (
-                existing_react
-                and existing_react.reaction_type_id != new_react.reaction_type_id
-            ):
-                existing_react.reaction_type_id = new_react.reaction_type_id
-                db.commit()
-                db.refresh(existing_react)
-                logger.info("react updated")
-                return None
-            elif (
-                existing_react
-                and existing_react.reaction_type_id == new_react.reaction_type_id
-            ):
-                db.delete(existing_react)
-                db.commit()
-                logger.info("react deleted")
-                return
             else:
-                react = PostReactions(
-                    reaction_type_id=new_react.reaction_type_id,
+                state, reaction_id, previous_type_id = self._toggle_fallback(
+                    db, new_react, user_id
+                )
+            if state == "unchanged":
+                # a concurrent first tap won; report its row, touch no counters
+                db.rollback()
+                current = self._current_reaction(db, new_react.post_id, user_id)
+                reaction_id = current.id if current else None
+                reaction_type_id = current.reaction_type_id if current else None
+                logger.info("react lost a race, unchanged")
+                return ReactionState(
+                    id=reaction_id,
                     post_id=new_react.post_id,
-                    user_id=user_id,
+                    reaction_type_id=reaction_type_id,
+                    state=state,
                 )
-                db.add(react)
-                db.flush()
-                db.commit()
-                logger.info("Reacted Successfully")
-                return react
+            adjust_post_counters(
+                db, new_react.post_id, reaction_count=REACTION_COUNT_DELTAS[state]
+            )
+            reaction_type_id = (
+                None if state == "deleted" else new_react.reaction_type_id
+            )
+            adjust_reaction_counts(
+                db,
+                new_react.post_id,
+                self._type_deltas(previous_type_id, reaction_type_id),
+            )
+            update_user_score(
+                db, SCORE_UPDATE_VALUES["REACT_POST"], user_id, commit=False
+            )
+            db.commit()
+            logger.info(f"react {state}")
+            return ReactionState(
+                id=reaction_id,
+                post_id=new_react.post_id,
+                reaction_type_id=reaction_type_id,
+                state=state,
+            )
         except IntegrityError as e:
             db.rollback()
             logger.error(f"error reacting: {str(e)}")
@@ -67,5 +124,217 @@ class CRUDPostReaction:
             db.rollback()
             logger.error(f"Unexpected error reacting: {str(e)}")
 
+    def _toggle(self, db: Session, new_react: ReactionCreate, user_id: int):
+        row = db.execute(
+            TOGGLE_REACTION_SQL,
+            {
+                "reaction_type_id": new_react.reaction_type_id,
+                "post_id": new_react.post_id,
+                "user_id": user_id,
+                "created_at": datetime.utcnow(),
+            },
+        ).first()
+        if row is None:
+            return "unchanged", None, None
+        return row.state, row.id, row.previous_type_id
+
+    def _current_reaction(self, db: Session, post_id: int, user_id: int):
+        return db.execute(
+            select(PostReactions.id, PostReactions.reaction_type_id).where(
+                PostReactions.post_id == post_id,
+                PostReactions.user_id == user_id,
+            )
+        ).first()
+
+    # sqlite has no data-modifying CTEs; writers are serialized there anyway
+    def _toggle_fallback(self, db: Session, new_react: ReactionCreate, user_id: int):
+        existing = self._current_reaction(db, new_react.post_id, user_id)
+        if existing and existing.reaction_type_id == new_react.reaction_type_id:
+            db.execute(delete(PostReactions).where(PostReactions.id == existing.id))
+            return "deleted", existing.id, existing.reaction_type_id
+        if existing:
+            db.execute(
+                update(PostReactions)
+                .where(PostReactions.id == existing.id)
+                .values(reaction_type_id=new_react.reaction_type_id)
+            )
+            return "updated", existing.id, existing.reaction_type_id
+
+        reaction_id = db.execute(
+            sqlite_insert(PostReactions)
+            .values(
+                reaction_type_id=new_react.reaction_type_id,
+                post_id=new_react.post_id,
+                user_id=user_id,
+                created_at=datetime.utcnow(),
+            )
+            .on_conflict_do_nothing(index_elements=["post_id", "user_id"])
+            .returning(PostReactions.id)
+        ).scalar_one_or_none()
+        if reaction_id is None:
+            return "unchanged", None, None
+        return "created", reaction_id, None
+
+    def _type_deltas(self, previous_type_id, reaction_type_id):
+        deltas = {}
+        if previous_type_id is not None:
+            deltas[previous_type_id] = -1
+        if reaction_type_id is not None:
+            deltas[reaction_type_id] = deltas.get(reaction_type_id, 0) + 1
+        return deltas
+
+    # replay a burst of toggles in client order and apply the net result at once
+    def react_to_posts(
+        self, db: Session, reactions: List[ReactionCreate], user_id: int
+    ) -> List[ReactionState]:
+        try:
+            post_ids = list(dict.fromkeys(react.post_id for react in reactions))
+            existing = {
+                row.post_id: row
+                for row in db.execute(
+                    select(
+                        PostReactions.id,
+                        PostReactions.post_id,
+                        PostReactions.reaction_type_id,
+                    )
+                    .where(
+                        PostReactions.user_id == user_id,
+                        PostReactions.post_id.in_(post_ids),
+                    )
+                    .with_for_update()
+                )
+            }
+
+            final = {
+                post_id: existing[post_id].reaction_type_id
+                if post_id in existing
+                else None
+                for post_id in post_ids
+            }
+            for react in reactions:
+                final[react.post_id] = (
+                    None
+                    if final[react.post_id] == react.reaction_type_id
+                    else react.reaction_type_id
+                )
+
+            states = {}
+            inserts, updates, deleted_ids = [], [], []
+            post_deltas, type_deltas = {}, {}
+            for post_id in post_ids:
+                current = existing.get(post_id)
+                previous_type_id = current.reaction_type_id if current else None
+                reaction_type_id = final[post_id]
+                if previous_type_id == reaction_type_id:
+                    state = "unchanged"
+                elif current is None:
+                    state = "created"
+                    inserts.append(
+                        {
+                            "reaction_type_id": reaction_type_id,
+                            "post_id": post_id,
+                            "user_id": user_id,
+                            "created_at": datetime.utcnow(),
+                        }
+                    )
+                elif reaction_type_id is None:
+                    state = "deleted"
+                    deleted_ids.append(current.id)
+                else:
+                    state = "updated"
+                    updates.append(
+                        {"id": current.id, "reaction_type_id": reaction_type_id}
+                    )
+
+                states[post_id] = ReactionState(
+                    id=current.id if current else None,
+                    post_id=post_id,
+                    reaction_type_id=reaction_type_id,
+                    state=state,
+                )
+                post_deltas[post_id] = REACTION_COUNT_DELTAS[state]
+                for type_id, delta in self._type_deltas(
+                    previous_type_id, reaction_type_id
+                ).items():
+                    type_deltas[(post_id, type_id)] = delta
+
+            if deleted_ids:
+                db.execute(
+                    delete(PostReactions)
+                    .where(PostReactions.id.in_(deleted_ids))
+                    .execution_options(synchronize_session=False)
+                )
+            if updates:
+                db.execute(update(PostReactions), updates)
+            if inserts:
+                for row in db.execute(
+                    insert(PostReactions).returning(
+                        PostReactions.id, PostReactions.post_id
+                    ),
+                    inserts,
+                ):
+                    states[row.post_id].id = row.id
+            adjust_reaction_counters(db, post_deltas, type_deltas)
+            update_user_score(
+                db,
+                SCORE_UPDATE_VALUES["REACT_POST"] * len(reactions),
+                user_id,
+                commit=False,
+            )
+            db.commit()
+            logger.info(f"applied {len(reactions)} reacts to {len(post_ids)} posts")
+            return list(states.values())
+        except IntegrityError as e:
+            db.rollback()
+            logger.error(f"error applying reactions: {str(e)}")
+            raise ValidationError(str(e))
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"error applying reactions: {str(e)}")
+            raise DatabaseError("Failed to react")
+
+    # per-type counts + the caller's own reaction for a batch of visible posts
+    async def get_reaction_summaries(
+        self, db: AsyncSession, post_ids: List[int], user_id: int
+    ) -> List[ReactionSummary]:
+        try:
+            visible_ids = select(Post.id).where(
+                Post.id.in_(post_ids),
+                or_(Post.is_public == True, Post.user_id == user_id),
+            )
+            summaries = {
+                post_id: ReactionSummary(post_id=post_id)
+                for post_id in (await db.execute(visible_ids)).scalars()
+            }
+            if not summaries:
+                return []
+
+            counts = await db.execute(
+                select(
+                    PostReactionCounts.post_id,
+                    PostReactionCounts.reaction_type_id,
+                    PostReactionCounts.count,
+                ).where(
+                    PostReactionCounts.post_id.in_(summaries.keys()),
+                    PostReactionCounts.count > 0,
+                )
+            )
+            for row in counts:
+                summaries[row.post_id].counts[row.reaction_type_id] = row.count
+
+            mine = await db.execute(
+                select(PostReactions.post_id, PostReactions.reaction_type_id).where(
+                    PostReactions.post_id.in_(summaries.keys()),
+                    PostReactions.user_id == user_id,
+                )
+            )
+            for row in mine:
+                summaries[row.post_id].my_reaction_type_id = row.reaction_type_id
+
+            return [summaries[post_id] for post_id in post_ids if post_id in summaries]
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching reaction summaries: {str(e)}")
+            raise DatabaseError("Failed to fetch reactions")
+
 
 crud_reactions = CRUDPostReaction()
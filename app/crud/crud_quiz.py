@@ -1,15 +1,24 @@
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from app.models.quiz import Quiz, QuizInteraction
-from app.models.user import User
+from app.models.quiz import Quiz, QuizInteraction, QuizAnswerCounts
 from app.schemas.quiz import (
-    QuizCreate, QuizResponse, QuizInteractionCreate, QuizInteractionResponse, UserPreview
+    QuizCreate, QuizResponse, QuizInteractionCreate, QuizInteractionResponse, UserPreview,
+    QuizPage, QuizInteractionPage, QuizStats
 )
 from app.core.exceptions import (
     DatabaseError, ValidationError, NotFoundError, AuthorizationError
 )
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.services.quiz_stats import adjust_quiz_answer_count
+from app.crud.crud_quiz_leaderboard import crud_quiz_leaderboard
+from app.services.interaction_score_update import update_user_score
+from app.services.principal_cache import AuthenticatedUser
+from app.constants.score_update_values import SCORE_UPDATE_VALUES
 from datetime import datetime
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +44,7 @@ class CRUDQuiz:
             )
             db.add(quiz)
             db.flush()
+            update_user_score(db, SCORE_UPDATE_VALUES["CREATE_QUIZ"], user_id, commit=False)
             db.commit()
             db.refresh(quiz)
             logger.info("Quiz created successfully")
@@ -60,26 +70,7 @@ class CRUDQuiz:
                 raise NotFoundError("Quiz not found")
             if not quiz.visibility and quiz.user_id != user_id:
                 raise AuthorizationError("Not authorized to view this quiz")
-            user = db.get(User, quiz.user_id)
-            user_preview = UserPreview(id=user.id, name=user.name, image=user.image)
-            return QuizResponse(
-                id=quiz.id,
-                title=quiz.title,
-                question=quiz.question,
-                description=quiz.description,
-                media_url_one=quiz.media_url_one,
-                media_url_two=quiz.media_url_two,
-                media_url_three=quiz.media_url_three,
-                answer_one=quiz.answer_one,
-                answer_two=quiz.answer_two,
-                answer_three=quiz.answer_three,
-                answer_four=quiz.answer_four,
-                answer_five=quiz.answer_five,
-                correct_answer=quiz.correct_answer,
-                visibility=quiz.visibility,
-                user=user_preview,
-                created_at=quiz.created_at,
-            )
+            return self._build_quiz_response(quiz)
         except SQLAlchemyError as e:
             logger.error(f"Error fetching quiz by id: {str(e)}")
             raise DatabaseError("Failed to fetch quiz by id")
@@ -87,39 +78,69 @@ class CRUDQuiz:
     # Get all quizzes
     def get_quizzes(self, db: Session, user_id: int):
         try:
-            quizzes = db.query(Quiz).all()
+            quizzes = (
+                self._visible_quizzes(db, user_id)
+                .order_by(Quiz.created_at.desc(), Quiz.id.desc())
+                .all()
+            )
             if not quizzes:
                 raise NotFoundError("No quizzes found")
-            response_quizzes = []
-            for quiz in quizzes:
-                if not quiz.visibility and quiz.user_id != user_id:
-                    continue
-                user = db.get(User, quiz.user_id)
-                user_preview = UserPreview(id=user.id, name=user.name, image=user.image)
-                formatted_quiz = QuizResponse(
-                    id=quiz.id,
-                    title=quiz.title,
-                    question=quiz.question,
-                    description=quiz.description,
-                    media_url_one=quiz.media_url_one,
-                    media_url_two=quiz.media_url_two,
-                    media_url_three=quiz.media_url_three,
-                    answer_one=quiz.answer_one,
-                    answer_two=quiz.answer_two,
-                    answer_three=quiz.answer_three,
-                    answer_four=quiz.answer_four,
-                    answer_five=quiz.answer_five,
-                    correct_answer=quiz.correct_answer,
-                    visibility=quiz.visibility,
-                    user=user_preview,
-                    created_at=quiz.created_at,
-                )
-                response_quizzes.append(formatted_quiz)
-            return response_quizzes
+            return [self._build_quiz_response(quiz) for quiz in quizzes]
         except SQLAlchemyError as e:
             logger.error(f"Error fetching quizzes: {str(e)}")
             raise DatabaseError("Failed to fetch quizzes")
 
+    # Get quizzes (cursor paginated)
+    def get_quiz_page(self, db: Session, user_id: int, limit: int, cursor: Optional[str] = None):
+        try:
+            query = self._visible_quizzes(db, user_id)
+            if cursor:
+                created_at, quiz_id = decode_cursor(cursor)
+                query = query.filter(tuple_(Quiz.created_at, Quiz.id) < tuple_(created_at, quiz_id))
+            quizzes = query.order_by(Quiz.created_at.desc(), Quiz.id.desc()).limit(limit + 1).all()
+
+            next_cursor = None
+            if len(quizzes) > limit:
+                quizzes = quizzes[:limit]
+                next_cursor = encode_cursor(quizzes[-1].created_at, quizzes[-1].id)
+
+            return QuizPage(
+                quizzes=[self._build_quiz_response(quiz) for quiz in quizzes],
+                next_cursor=next_cursor,
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching quiz page: {str(e)}")
+            raise DatabaseError("Failed to fetch quizzes")
+
+    # visibility is decided in SQL; the author comes back in the same query
+    def _visible_quizzes(self, db: Session, user_id: int):
+        return (
+            db.query(Quiz)
+            .options(joinedload(Quiz.user))
+            .filter(or_(Quiz.visibility == True, Quiz.user_id == user_id))
+        )
+
+    def _build_quiz_response(self, quiz: Quiz) -> QuizResponse:
+        user = quiz.user
+        return QuizResponse(
+            id=quiz.id,
+            title=quiz.title,
+            question=quiz.question,
+            description=quiz.description,
+            media_url_one=quiz.media_url_one,
+            media_url_two=quiz.media_url_two,
+            media_url_three=quiz.media_url_three,
+            answer_one=quiz.answer_one,
+            answer_two=quiz.answer_two,
+            answer_three=quiz.answer_three,
+            answer_four=quiz.answer_four,
+            answer_five=quiz.answer_five,
+            correct_answer=quiz.correct_answer,
+            visibility=quiz.visibility,
+            user=UserPreview(id=user.id, name=user.name, image=user.image),
+            created_at=quiz.created_at,
+        )
+
     # Update quiz
     def update_quiz(self, db: Session, quiz_id: int, quiz_update: QuizCreate, user_id: int):
         try:
@@ -128,8 +149,12 @@ class CRUDQuiz:
                 raise NotFoundError("Quiz not found")
             if quiz.user_id != user_id:
                 raise AuthorizationError("Not authorized to update this quiz")
+            previous_correct_answer = quiz.correct_answer
             for field, value in quiz_update.dict(exclude_unset=True).items():
                 setattr(quiz, field, value)
+            if quiz.correct_answer != previous_correct_answer:
+                db.flush()
+                crud_quiz_leaderboard.rerank_quiz(db, quiz_id, quiz.correct_answer)
             db.commit()
             db.refresh(quiz)
             logger.info("Quiz updated successfully")
@@ -155,6 +180,10 @@ class CRUDQuiz:
                 raise NotFoundError("Quiz not found")
             if quiz.user_id != user_id:
                 raise AuthorizationError("Not authorized to delete this quiz")
+            db.query(QuizAnswerCounts).filter(QuizAnswerCounts.quiz_id == quiz_id).delete(
+                synchronize_session=False
+            )
+            crud_quiz_leaderboard.remove_quiz(db, quiz_id)
             db.delete(quiz)
             db.commit()
             logger.info("Quiz deleted successfully")
@@ -168,30 +197,49 @@ class CRUDQuiz:
             logger.error(f"Unexpected error deleting quiz: {str(e)}")
             raise DatabaseError("An unexpected error occurred")
 
-    # Create quiz interaction (answer)
-    def create_quiz_interaction(self, db: Session, quiz_id: int, user_id: int, interaction: QuizInteractionCreate):
+    # Create quiz interaction (answer); one attempt per user, repeats return the first
+    def create_quiz_interaction(
+        self, db: Session, quiz_id: int, user: AuthenticatedUser, interaction: QuizInteractionCreate
+    ):
         try:
             quiz = db.get(Quiz, quiz_id)
             if not quiz:
                 raise NotFoundError("Quiz not found")
-            quiz_interaction = QuizInteraction(
-                user_id=user_id,
-                quiz_id=quiz_id,
-                answer_id=interaction.answer_id,
-            )
-            db.add(quiz_interaction)
-            db.flush()
-            db.commit()
-            db.refresh(quiz_interaction)
-            logger.info("Quiz interaction created successfully")
-            user = db.get(User, user_id)
-            user_preview = UserPreview(id=user.id, name=user.name, image=user.image)
+            dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+            row = db.execute(
+                dialect.insert(QuizInteraction)
+                .values(
+                    user_id=user.id,
+                    quiz_id=quiz_id,
+                    answer_id=interaction.answer_id,
+                    created_at=datetime.utcnow(),
+                )
+                .on_conflict_do_nothing(index_elements=["quiz_id", "user_id"])
+                .returning(QuizInteraction.id, QuizInteraction.answer_id, QuizInteraction.created_at)
+            ).first()
+            if row:
+                answer_count = adjust_quiz_answer_count(db, quiz_id, interaction.answer_id)
+                if interaction.answer_id == quiz.correct_answer:
+                    crud_quiz_leaderboard.record_correct_answer(
+                        db, row.id, user.id, correct_rank=answer_count, answered_at=row.created_at
+                    )
+                update_user_score(db, SCORE_UPDATE_VALUES["ANSWER_QUIZ"], user.id, commit=False)
+                db.commit()
+                logger.info("Quiz interaction created successfully")
+            else:
+                db.rollback()
+                row = (
+                    db.query(QuizInteraction.id, QuizInteraction.answer_id, QuizInteraction.created_at)
+                    .filter(QuizInteraction.quiz_id == quiz_id, QuizInteraction.user_id == user.id)
+                    .one()
+                )
+                logger.info("Quiz already answered, returning the first attempt")
             return QuizInteractionResponse(
-                id=quiz_interaction.id,
-                user=user_preview,
+                id=row.id,
+                user=UserPreview(id=user.id, name=user.name, image=user.image),
                 quiz_id=quiz_id,
-                answer_id=quiz_interaction.answer_id,
-                created_at=quiz_interaction.created_at,
+                answer_id=row.answer_id,
+                created_at=row.created_at,
             )
         except IntegrityError as e:
             db.rollback()
@@ -201,32 +249,101 @@ class CRUDQuiz:
             db.rollback()
             logger.error(f"Error creating quiz interaction: {str(e)}")
             raise DatabaseError("Failed to create quiz interaction")
+        except NotFoundError:
+            raise
         except Exception as e:
             db.rollback()
             logger.error(f"Unexpected error creating quiz interaction: {str(e)}")
             raise DatabaseError("An unexpected error occurred")
 
+    # Answer distribution from the counter rows
+    def get_quiz_stats(self, db: Session, quiz_id: int, user_id: int):
+        try:
+            quiz = db.get(Quiz, quiz_id)
+            if not quiz:
+                raise NotFoundError("Quiz not found")
+            if not quiz.visibility and quiz.user_id != user_id:
+                raise AuthorizationError("Not authorized to view this quiz")
+            answers = dict(
+                db.query(QuizAnswerCounts.answer_id, QuizAnswerCounts.count)
+                .filter(QuizAnswerCounts.quiz_id == quiz_id, QuizAnswerCounts.count > 0)
+                .all()
+            )
+            attempts = sum(answers.values())
+            correct = answers.get(quiz.correct_answer, 0)
+            return QuizStats(
+                quiz_id=quiz_id,
+                attempts=attempts,
+                correct=correct,
+                percent_correct=round(correct * 100 / attempts, 2) if attempts else 0.0,
+                answers=answers,
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching quiz stats: {str(e)}")
+            raise DatabaseError("Failed to fetch quiz stats")
+
     # Get all interactions for a quiz
-    def get_quiz_interactions(self, db: Session, quiz_id: int):
+    def get_quiz_interactions(self, db: Session, quiz_id: int, user_id: int):
         try:
-            interactions = db.query(QuizInteraction).filter(QuizInteraction.quiz_id == quiz_id).all()
+            interactions = (
+                self._visible_interactions(db, quiz_id, user_id)
+                .order_by(QuizInteraction.created_at, QuizInteraction.id)
+                .all()
+            )
             if not interactions:
                 raise NotFoundError("No interactions found for this quiz")
-            response_interactions = []
-            for interaction in interactions:
-                user = db.get(User, interaction.user_id)
-                user_preview = UserPreview(id=user.id, name=user.name, image=user.image)
-                formatted_interaction = QuizInteractionResponse(
-                    id=interaction.id,
-                    user=user_preview,
-                    quiz_id=interaction.quiz_id,
-                    answer_id=interaction.answer_id,
-                    created_at=interaction.created_at,
-                )
-                response_interactions.append(formatted_interaction)
-            return response_interactions
+            return [self._build_interaction_response(interaction) for interaction in interactions]
         except SQLAlchemyError as e:
             logger.error(f"Error fetching quiz interactions: {str(e)}")
             raise DatabaseError("Failed to fetch quiz interactions")
 
+    # Get interactions for a quiz (cursor paginated, oldest first)
+    def get_quiz_interaction_page(
+        self, db: Session, quiz_id: int, user_id: int, limit: int, cursor: Optional[str] = None
+    ):
+        try:
+            query = self._visible_interactions(db, quiz_id, user_id)
+            if cursor:
+                created_at, interaction_id = decode_cursor(cursor)
+                query = query.filter(
+                    tuple_(QuizInteraction.created_at, QuizInteraction.id) > tuple_(created_at, interaction_id)
+                )
+            interactions = (
+                query.order_by(QuizInteraction.created_at, QuizInteraction.id).limit(limit + 1).all()
+            )
+
+            next_cursor = None
+            if len(interactions) > limit:
+                interactions = interactions[:limit]
+                next_cursor = encode_cursor(interactions[-1].created_at, interactions[-1].id)
+
+            return QuizInteractionPage(
+                interactions=[self._build_interaction_response(interaction) for interaction in interactions],
+                next_cursor=next_cursor,
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching quiz interaction page: {str(e)}")
+            raise DatabaseError("Failed to fetch quiz interactions")
+
+    def _visible_interactions(self, db: Session, quiz_id: int, user_id: int):
+        return (
+            db.query(QuizInteraction)
+            .join(Quiz, Quiz.id == QuizInteraction.quiz_id)
+            .options(joinedload(QuizInteraction.user))
+            .filter(
+                QuizInteraction.quiz_id == quiz_id,
+                or_(Quiz.visibility == True, Quiz.user_id == user_id),
+            )
+        )
+
+    def _build_interaction_response(self, interaction: QuizInteraction) -> QuizInteractionResponse:
+        user = interaction.user
+        return QuizInteractionResponse(
+            id=interaction.id,
+            user=UserPreview(id=user.id, name=user.name, image=user.image),
+            quiz_id=interaction.quiz_id,
+            answer_id=interaction.answer_id,
+            created_at=interaction.created_at,
+        )
+
 crud_quiz = CRUDQuiz()
@@ -0,0 +1,328 @@
+import logging
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import case, delete, func, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from app.models.quiz import Quiz, QuizInteraction, UserQuizScores, QuizScoreBuckets
+from app.models.user import User
+from app.schemas.quiz import UserPreview, QuizLeaderboardEntry, GlobalLeaderboardEntry
+from app.core.exceptions import DatabaseError, NotFoundError
+from app.services.principal_cache import AuthenticatedUser
+
+logger = logging.getLogger(__name__)
+
+# Standings are maintained as answers come in:
+# - per quiz, each correct answer is stamped with its position (correct_rank),
+#   so "first to answer correctly" is an index range on (quiz_id, correct_rank)
+# - globally, user_quiz_scores holds each user's correct count and
+#   quiz_score_buckets holds how many users sit at each count, so a user's
+#   rank is one primary-key probe plus a sum over the distinct counts above it
+
+
+class CRUDQuizLeaderboard:
+    # Record a correct answer; the caller commits
+    def record_correct_answer(
+        self, db: Session, interaction_id: int, user_id: int, correct_rank: int, answered_at: datetime
+    ):
+        db.execute(
+            update(QuizInteraction)
+            .where(QuizInteraction.id == interaction_id)
+            .values(correct_rank=correct_rank)
+            .execution_options(synchronize_session=False)
+        )
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        score = dialect.insert(UserQuizScores).values(user_id=user_id, correct_count=1, reached_at=answered_at)
+        correct_count = db.execute(
+            score.on_conflict_do_update(
+                index_elements=["user_id"],
+                set_={
+                    "correct_count": UserQuizScores.correct_count + 1,
+                    "reached_at": score.excluded.reached_at,
+                },
+            ).returning(UserQuizScores.correct_count)
+        ).scalar_one()
+
+        # move the user from the previous bucket into the next one
+        bucket = dialect.insert(QuizScoreBuckets).values(correct_count=correct_count, users=1)
+        db.execute(
+            bucket.on_conflict_do_update(
+                index_elements=["correct_count"],
+                set_={"users": QuizScoreBuckets.users + 1},
+            )
+        )
+        if correct_count > 1:
+            db.execute(
+                update(QuizScoreBuckets)
+                .where(QuizScoreBuckets.correct_count == correct_count - 1)
+                .values(users=QuizScoreBuckets.users - 1)
+            )
+        return correct_count
+
+    # Take a quiz's correct answers back out of the standings; the caller commits
+    def remove_quiz(self, db: Session, quiz_id: int):
+        correct_users = select(QuizInteraction.user_id).where(
+            QuizInteraction.quiz_id == quiz_id, QuizInteraction.correct_rank.is_not(None)
+        )
+        # every affected user drops from their current count to the one below it
+        moved = Counter(
+            db.execute(
+                select(UserQuizScores.correct_count).where(UserQuizScores.user_id.in_(correct_users))
+            ).scalars()
+        )
+        if moved:
+            self._move_bucket_users(db, moved, step=-1)
+            db.execute(
+                update(UserQuizScores)
+                .where(UserQuizScores.user_id.in_(correct_users))
+                .values(correct_count=UserQuizScores.correct_count - 1)
+                .execution_options(synchronize_session=False)
+            )
+            db.execute(
+                delete(UserQuizScores)
+                .where(UserQuizScores.correct_count <= 0)
+                .execution_options(synchronize_session=False)
+            )
+        db.execute(
+            update(QuizInteraction)
+            .where(QuizInteraction.quiz_id == quiz_id)
+            .values(correct_rank=None)
+            .execution_options(synchronize_session=False)
+        )
+        return sum(moved.values())
+
+    # Re-rank a quiz after its correct answer changed; the caller commits
+    def rerank_quiz(self, db: Session, quiz_id: int, correct_answer: int):
+        self.remove_quiz(db, quiz_id)
+        ranked = (
+            select(
+                QuizInteraction.id,
+                func.row_number()
+                .over(order_by=(QuizInteraction.created_at, QuizInteraction.id))
+                .label("correct_rank"),
+            )
+            .where(QuizInteraction.quiz_id == quiz_id, QuizInteraction.answer_id == correct_answer)
+            .subquery()
+        )
+        db.execute(
+            update(QuizInteraction)
+            .where(QuizInteraction.id == ranked.c.id)
+            .values(correct_rank=ranked.c.correct_rank)
+            .execution_options(synchronize_session=False)
+        )
+
+        correct = (
+            select(QuizInteraction.user_id, QuizInteraction.created_at)
+            .where(QuizInteraction.quiz_id == quiz_id, QuizInteraction.correct_rank.is_not(None))
+            .subquery("correct")
+        )
+        correct_users = select(correct.c.user_id)
+        # users already ranked move up one count; the rest enter at 1
+        moved = Counter(
+            db.execute(
+                select(UserQuizScores.correct_count).where(UserQuizScores.user_id.in_(correct_users))
+            ).scalars()
+        )
+        answered_at = (
+            select(QuizInteraction.created_at)
+            .where(QuizInteraction.quiz_id == quiz_id, QuizInteraction.user_id == UserQuizScores.user_id)
+            .scalar_subquery()
+        )
+        db.execute(
+            update(UserQuizScores)
+            .where(UserQuizScores.user_id.in_(correct_users))
+            .values(
+                correct_count=UserQuizScores.correct_count + 1,
+                reached_at=case(
+                    (answered_at > UserQuizScores.reached_at, answered_at),
+                    else_=UserQuizScores.reached_at,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        entered = db.execute(
+            insert(UserQuizScores).from_select(
+                ["user_id", "correct_count", "reached_at"],
+                select(correct.c.user_id, literal(1), correct.c.created_at).where(
+                    correct.c.user_id.not_in(select(UserQuizScores.user_id))
+                ),
+            )
+        ).rowcount
+        if entered:
+            moved[0] += entered
+        if moved:
+            self._move_bucket_users(db, moved, step=1)
+        return sum(moved.values())
+
+    # move {count: users} from each count to count + step, dropping empty buckets
+    def _move_bucket_users(self, db: Session, moved: Counter, step: int):
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        for correct_count, users in moved.items():
+            if correct_count > 0:
+                db.execute(
+                    update(QuizScoreBuckets)
+                    .where(QuizScoreBuckets.correct_count == correct_count)
+                    .values(users=QuizScoreBuckets.users - users)
+                )
+            if correct_count + step > 0:
+                bucket = dialect.insert(QuizScoreBuckets).values(correct_count=correct_count + step, users=users)
+                db.execute(
+                    bucket.on_conflict_do_update(
+                        index_elements=["correct_count"],
+                        set_={"users": QuizScoreBuckets.users + bucket.excluded.users},
+                    )
+                )
+        db.execute(delete(QuizScoreBuckets).where(QuizScoreBuckets.users <= 0))
+
+    # First correct answers on a quiz
+    def get_quiz_top(self, db: Session, quiz_id: int, limit: int):
+        try:
+            rows = (
+                db.query(QuizInteraction.correct_rank, QuizInteraction.created_at, User.id, User.name, User.image)
+                .join(User, User.id == QuizInteraction.user_id)
+                .filter(QuizInteraction.quiz_id == quiz_id, QuizInteraction.correct_rank.is_not(None))
+                .order_by(QuizInteraction.correct_rank)
+                .limit(limit)
+                .all()
+            )
+            return [
+                QuizLeaderboardEntry(
+                    rank=row.correct_rank,
+                    user=UserPreview(id=row.id, name=row.name, image=row.image),
+                    answered_at=row.created_at,
+                )
+                for row in rows
+            ]
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching quiz leaderboard: {str(e)}")
+            raise DatabaseError("Failed to fetch quiz leaderboard")
+
+    # Caller's position on a quiz
+    def get_quiz_rank(self, db: Session, quiz_id: int, user: AuthenticatedUser):
+        try:
+            row = (
+                db.query(QuizInteraction.correct_rank, QuizInteraction.created_at)
+                .filter(QuizInteraction.quiz_id == quiz_id, QuizInteraction.user_id == user.id)
+                .first()
+            )
+            if not row or row.correct_rank is None:
+                raise NotFoundError("Not ranked on this quiz")
+            return QuizLeaderboardEntry(
+                rank=row.correct_rank,
+                user=UserPreview(id=user.id, name=user.name, image=user.image),
+                answered_at=row.created_at,
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching quiz rank: {str(e)}")
+            raise DatabaseError("Failed to fetch quiz rank")
+
+    # Most correct answers overall; ties share a rank and list by who got there first
+    def get_global_top(self, db: Session, limit: int):
+        try:
+            rows = (
+                db.query(
+                    UserQuizScores.correct_count, UserQuizScores.reached_at, User.id, User.name, User.image
+                )
+                .join(User, User.id == UserQuizScores.user_id)
+                .filter(UserQuizScores.correct_count > 0)
+                .order_by(
+                    UserQuizScores.correct_count.desc(), UserQuizScores.reached_at, UserQuizScores.user_id
+                )
+                .limit(limit)
+                .all()
+            )
+            entries = []
+            for position, row in enumerate(rows, start=1):
+                tied = entries and entries[-1].correct_count == row.correct_count
+                entries.append(
+                    GlobalLeaderboardEntry(
+                        rank=entries[-1].rank if tied else position,
+                        user=UserPreview(id=row.id, name=row.name, image=row.image),
+                        correct_count=row.correct_count,
+                        reached_at=row.reached_at,
+                    )
+                )
+            return entries
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching global leaderboard: {str(e)}")
+            raise DatabaseError("Failed to fetch leaderboard")
+
+    # Caller's overall position
+    def get_global_rank(self, db: Session, user: AuthenticatedUser):
+        try:
+            score = db.get(UserQuizScores, user.id)
+            if not score or score.correct_count == 0:
+                raise NotFoundError("Not ranked yet")
+            ahead = db.execute(
+                select(func.coalesce(func.sum(QuizScoreBuckets.users), 0)).where(
+                    QuizScoreBuckets.correct_count > score.correct_count
+                )
+            ).scalar_one()
+            return GlobalLeaderboardEntry(
+                rank=ahead + 1,
+                user=UserPreview(id=user.id, name=user.name, image=user.image),
+                correct_count=score.correct_count,
+                reached_at=score.reached_at,
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching global rank: {str(e)}")
+            raise DatabaseError("Failed to fetch rank")
+
+    # Recompute every standing from quiz_interactions
+    def rebuild(self, db: Session):
+        try:
+            db.execute(update(QuizInteraction).values(correct_rank=None).execution_options(synchronize_session=False))
+            ranked = (
+                select(
+                    QuizInteraction.id,
+                    func.row_number()
+                    .over(
+                        partition_by=QuizInteraction.quiz_id,
+                        order_by=(QuizInteraction.created_at, QuizInteraction.id),
+                    )
+                    .label("correct_rank"),
+                )
+                .join(Quiz, Quiz.id == QuizInteraction.quiz_id)
+                .where(QuizInteraction.answer_id == Quiz.correct_answer)
+                .subquery()
+            )
+            ranked_rows = db.execute(
+                update(QuizInteraction)
+                .where(QuizInteraction.id == ranked.c.id)
+                .values(correct_rank=ranked.c.correct_rank)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+            db.execute(delete(UserQuizScores))
+            db.execute(
+                insert(UserQuizScores).from_select(
+                    ["user_id", "correct_count", "reached_at"],
+                    select(
+                        QuizInteraction.user_id,
+                        func.count(QuizInteraction.id),
+                        func.max(QuizInteraction.created_at),
+                    )
+                    .where(QuizInteraction.correct_rank.is_not(None))
+                    .group_by(QuizInteraction.user_id),
+                )
+            )
+            db.execute(delete(QuizScoreBuckets))
+            db.execute(
+                insert(QuizScoreBuckets).from_select(
+                    ["correct_count", "users"],
+                    select(UserQuizScores.correct_count, func.count(UserQuizScores.user_id)).group_by(
+                        UserQuizScores.correct_count
+                    ),
+                )
+            )
+            db.commit()
+            logger.info(f"Quiz leaderboard rebuilt from {ranked_rows} correct answers")
+            return ranked_rows
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"Error rebuilding quiz leaderboard: {str(e)}")
+            raise DatabaseError("Failed to rebuild quiz leaderboard")
+
+
+crud_quiz_leaderboard = CRUDQuizLeaderboard()
@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Session, contains_eager, selectinload
 from app.models.user import User, Teacher, Student
 from app.schemas.user import UserFullCreate, UserUpdate, User as UserSchema
 from typing import Optional, List
@@ -6,6 +7,7 @@ from app.utils.security import hash_password
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.constants.roles import ROLE_TEACHER, ROLE_STUDENT
 from app.core.exceptions import DatabaseError, ValidationError, NotFoundError
+from app.utils.pagination import encode_cursor, decode_cursor
 import logging
 
 logger = logging.getLogger(__name__)
@@ -89,7 +91,12 @@ class CRUDUser:
     # get teachers
     def get_teachers(self, db: Session):
         try:
-            return db.query(User).filter(User.role_id == ROLE_TEACHER).all()
+            return (
+                db.query(User)
+                .options(selectinload(User.teacher))
+                .filter(User.role_id == ROLE_TEACHER)
+                .all()
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error fetching teachers: {str(e)}")
             raise DatabaseError("Failed to fetch teachers")
@@ -97,11 +104,55 @@ class CRUDUser:
     # get students
     def get_students(self, db: Session):
         try:
-            return db.query(User).filter(User.role_id == ROLE_STUDENT).all()
+            return (
+                db.query(User)
+                .options(selectinload(User.student))
+                .filter(User.role_id == ROLE_STUDENT)
+                .all()
+            )
         except SQLAlchemyError as e:
             logger.error(f"Error fetching students: {str(e)}")
             raise DatabaseError("Failed to fetch students")
 
+    # get teachers page (keyset on created_at, id)
+    def get_teachers_page(
+        self,
+        db: Session,
+        limit: int,
+        cursor: Optional[str] = None,
+        school: Optional[str] = None,
+        city: Optional[str] = None,
+        province: Optional[str] = None,
+    ):
+        try:
+            filters = [User.role_id == ROLE_TEACHER]
+            filters += self._location_filters(school, city, province)
+            return self._role_page(db, Teacher, User.teacher, filters, limit, cursor)
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching teachers page: {str(e)}")
+            raise DatabaseError("Failed to fetch teachers")
+
+    # get students page (keyset on created_at, id)
+    def get_students_page(
+        self,
+        db: Session,
+        limit: int,
+        cursor: Optional[str] = None,
+        grade: Optional[int] = None,
+        school: Optional[str] = None,
+        city: Optional[str] = None,
+        province: Optional[str] = None,
+    ):
+        try:
+            filters = [User.role_id == ROLE_STUDENT]
+            if grade is not None:
+                filters.append(Student.grade == grade)
+            filters += self._location_filters(school, city, province)
+            return self._role_page(db, Student, User.student, filters, limit, cursor)
+        except SQLAlchemyError as e:
+            logger.error(f"Error fetching students page: {str(e)}")
+            raise DatabaseError("Failed to fetch students")
+
     # get user by email
     def get_user_by_email(self, db: Session, email: str) -> Optional[UserSchema]:
         try:
@@ -128,6 +179,46 @@ class CRUDUser:
             logger.error(f"Error fetching most engaging users: {str(e)}")
             raise DatabaseError("Failed to fetch most engaging users")
 
+    def _location_filters(
+        self, school: Optional[str], city: Optional[str], province: Optional[str]
+    ) -> list:
+        filters = []
+        if school:
+            filters.append(User.school_name == school)
+        if city:
+            filters.append(User.city == city)
+        if province:
+            filters.append(User.province == province)
+        return filters
+
+    # role listing joined to its profile table; returns (users, total, next_cursor)
+    def _role_page(self, db: Session, profile, relation, filters, limit, cursor):
+        total = (
+            db.query(func.count(User.id))
+            .join(profile, profile.user_id == User.id)
+            .filter(*filters)
+            .scalar()
+        )
+
+        query = (
+            db.query(User)
+            .join(profile, profile.user_id == User.id)
+            .options(contains_eager(relation))
+            .filter(*filters)
+        )
+        if cursor:
+            created_at, user_id = decode_cursor(cursor)
+            query = query.filter(
+                tuple_(User.created_at, User.id) > tuple_(created_at, user_id)
+            )
+        users = query.order_by(User.created_at, User.id).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            next_cursor = encode_cursor(users[-1].created_at, users[-1].id)
+        return users, total, next_cursor
+
     def _check_existing_user(self, db: Session, email: str, nic: str) -> Optional[User]:
         existing_email = self.get_user_by_email(db, email)
         if existing_email:
@@ -1,6 +1,7 @@
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, AsyncSessionLocal
 from sqlalchemy.orm import Session
-from typing import Generator
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncGenerator, Generator
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -9,3 +10,8 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,112 @@
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.connects = 0
+        self.overflow_events = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "connects": self.connects,
+                "overflow_events": self.overflow_events,
+                "invalidations": self.invalidations,
+                "checkout_timeouts": self.timeouts,
+                "checkout_wait_avg_ms": (
+                    self.wait_total / self.wait_count * 1000 if self.wait_count else 0.0
+                ),
+                "checkout_wait_max_ms": self.wait_max * 1000,
+            }
+        if isinstance(self.pool, QueuePool):
+            data.update(
+                pool_size=self.pool.size(),
+                checked_out=self.pool.checkedout(),
+                overflow=self.pool.overflow(),
+            )
+        return data
+
+    def attach(self, pool):
+        self.pool = pool
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+        event.listen(pool, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+            if isinstance(self.pool, QueuePool) and self.pool.overflow() > 0:
+                self.overflow_events += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+
+class _TimedCheckoutMixin:
+    # times Pool.connect(), i.e. how long a caller waited for a connection
+    metrics: PoolMetrics = None
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            # only pool exhaustion counts; connect/auth/DBAPI errors just propagate
+            if self.metrics:
+                self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        if self.metrics:
+            self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
+def timed_pool_class(base, metrics: PoolMetrics):
+    return type(
+        f"Timed{base.__name__}",
+        (_TimedCheckoutMixin, base),
+        {"metrics": metrics},
+    )
+
+
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+TimedQueuePool = timed_pool_class(QueuePool, sync_pool_metrics)
+TimedAsyncQueuePool = timed_pool_class(AsyncAdaptedQueuePool, async_pool_metrics)
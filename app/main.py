@@ -3,13 +3,14 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, async_engine
 from app.db.init_db import (
     init_default_roles,
     init_score_levels,
     init_default_reaction_types,
 )
-from app.utils.scheduler import start_scheduler
+from app.services.score_level_cache import load_score_levels
+from app.utils.scheduler import start_scheduler, stop_scheduler
 from app.middleware.auth_middleware import AuthMiddleware
 from app.core.exceptions import (
     NotFoundError,
@@ -31,6 +32,7 @@ from app.api.v1.routes import event
 from app.api.v1.routes import quiz
 from app.api.v1.routes import exam_paper
 from app.api.v1.routes import course
+from app.api.v1.routes import internal
 
 logger = logging.getLogger(__name__)
 
@@ -41,15 +43,18 @@ async def lifespan(app: FastAPI):
     try:
         init_default_roles(db)
         init_score_levels(db)
+        load_score_levels(db)
         init_default_reaction_types(db)
         start_scheduler()
         print("[Startup] Initialized default roles, score levels, and scheduler.")
-        yield
     except Exception as e:
         logger.error(f"Startup Error: {str(e)}")
-        yield
     finally:
+        # release the startup connection back to the pool before serving
         db.close()
+    yield
+    stop_scheduler()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -79,6 +84,7 @@ app.include_router(event.router, prefix="/api")
 app.include_router(quiz.router, prefix="/api")
 app.include_router(exam_paper.router, prefix="/api")
 app.include_router(course.router, prefix="/api")
+app.include_router(internal.router, prefix="/api")
 
 @app.exception_handler(NotFoundError)
 async def not_found_exception_handler(request: Request, exc: NotFoundError):
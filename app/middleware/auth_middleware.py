@@ -1,57 +1,67 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request, status
+from starlette.types import ASGIApp, Receive, Scope, Send
+from fastapi import status
 from fastapi.responses import JSONResponse
 from app.utils.jwt import verify_access_token
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal
 from app.models.user import User
-from sqlalchemy.orm import Session
 from app.constants.public_paths import PUBLIC_PATHS
+from app.services.principal_cache import AuthenticatedUser, principal_cache
 
+PUBLIC_PATH_SET = frozenset(PUBLIC_PATHS)
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-
-        if request.url.path in PUBLIC_PATHS:
-            return await call_next(request)
-
-        authorization: str = request.headers.get("Authorization")
-        if authorization:
-            scheme, _, token = authorization.partition(" ")
-            if scheme.lower() != "bearer" or not token:
-                return JSONResponse(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    content={"detail": "Invalid authentication scheme"},
-                )
-            try:
-                payload = verify_access_token(token)
-                user_id: int = payload.get("user_id")
-                if not user_id:
-                    return JSONResponse(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        content={"detail": "Invalid token"},
-                    )
-
-                db: Session = SessionLocal()
-                user = db.get(User, user_id)
-                db.close()
-
-                if not user:
-                    return JSONResponse(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        content={"detail": "User not found"},
-                    )
-
-                request.state.user = user
-            except Exception:
-                return JSONResponse(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    content={"detail": "Authentication failed"},
-                )
-
-        else:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Missing Authorization Header"},
-            )
-
-        return await call_next(request)
+
+class AuthMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in PUBLIC_PATH_SET:
+            await self.app(scope, receive, send)
+            return
+
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value.decode("latin-1")
+                break
+
+        if not authorization:
+            await self._unauthorized(scope, receive, send, "Missing Authorization Header")
+            return
+
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            await self._unauthorized(scope, receive, send, "Invalid authentication scheme")
+            return
+
+        try:
+            payload = verify_access_token(token)
+            user_id: int = payload.get("user_id")
+            if not user_id:
+                await self._unauthorized(scope, receive, send, "Invalid token")
+                return
+
+            principal = principal_cache.get(user_id)
+            if principal is None:
+                async with AsyncSessionLocal() as db:
+                    user = await db.get(User, user_id)
+                    if user:
+                        principal = AuthenticatedUser.from_user(user)
+                        principal_cache.put(principal.id, principal)
+        except Exception:
+            await self._unauthorized(scope, receive, send, "Authentication failed")
+            return
+
+        if not principal:
+            await self._unauthorized(scope, receive, send, "User not found")
+            return
+
+        # request.state is backed by scope["state"]
+        scope.setdefault("state", {})["user"] = principal
+        await self.app(scope, receive, send)
+
+    async def _unauthorized(self, scope: Scope, receive: Receive, send: Send, detail: str):
+        response = JSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED, content={"detail": detail}
+        )
+        await response(scope, receive, send)
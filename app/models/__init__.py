@@ -2,9 +2,21 @@ from app.models.user import User, Teacher, Student
 from app.models.system import UserRoles, ScoreLevels, ReactionTypes
 from app.models.post import Post
 from app.models.comment import Comments
-from app.models.post_reaction import PostReactions
+from app.models.post_reaction import PostReactions, PostReactionCounts
 from app.models.post_ratings import PostRatings
 from app.models.events import Event, EventInterests
-from app.models.quiz import Quiz, QuizInteraction
+from app.models.quiz import (
+    Quiz,
+    QuizInteraction,
+    QuizAnswerCounts,
+    UserQuizScores,
+    QuizScoreBuckets,
+)
 from app.models.exam_paper import ExamPaper
-from app.models.course import Course, CourseQuestion, CourseAnswer
\ No newline at end of file
+from app.models.course import (
+    Course,
+    CourseQuestion,
+    CourseAnswer,
+    CourseAttempt,
+    CourseCompletion,
+)
\ No newline at end of file
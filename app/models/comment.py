@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, DateTime
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship, backref
 from app.db.base import Base
 from datetime import datetime
@@ -6,6 +6,14 @@ from datetime import datetime
 
 class Comments(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index(
+            "ix_comments_post_parent_created",
+            "post_id",
+            "parent_comment_id",
+            "created_at",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     post_id = Column(Integer, ForeignKey("posts.id"))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from datetime import datetime
@@ -37,7 +37,9 @@ class Course(Base):
     applicable_level = Column(String(10))
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    questions = relationship("CourseQuestion", back_populates="course", cascade="all, delete-orphan")
+    questions = relationship(
+        "CourseQuestion", back_populates="course", cascade="all, delete-orphan", order_by="CourseQuestion.id"
+    )
 
 class CourseQuestion(Base):
     __tablename__ = "course_questions"
@@ -49,7 +51,9 @@ class CourseQuestion(Base):
     marks = Column(Integer, nullable=False)
 
     course = relationship("Course", back_populates="questions")
-    answers = relationship("CourseAnswer", back_populates="question", cascade="all, delete-orphan")
+    answers = relationship(
+        "CourseAnswer", back_populates="question", cascade="all, delete-orphan", order_by="CourseAnswer.id"
+    )
 
 class CourseAnswer(Base):
     __tablename__ = "course_answers"
@@ -59,3 +63,24 @@ class CourseAnswer(Base):
     answer = Column(Text, nullable=False)
 
     question = relationship("CourseQuestion", back_populates="answers")
+
+class CourseAttempt(Base):
+    __tablename__ = "course_attempts"
+    __table_args__ = (
+        Index("ix_course_attempts_course_user", "course_id", "user_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    score = Column(Integer, nullable=False)
+    total_marks = Column(Integer, nullable=False)
+    passed = Column(Boolean, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class CourseCompletion(Base):
+    __tablename__ = "course_completions"
+
+    course_id = Column(Integer, ForeignKey("courses.id"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    completed_at = Column(DateTime, default=datetime.utcnow)
@@ -1,4 +1,12 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    ForeignKey,
+    DateTime,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from datetime import datetime
@@ -6,6 +14,7 @@ from datetime import datetime
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (Index("ix_events_date_time_id", "date_time", "id"),)
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title = Column(String(255))
@@ -26,6 +35,9 @@ class Event(Base):
 
 class EventInterests(Base):
     __tablename__ = "event_interests"
+    __table_args__ = (
+        UniqueConstraint("event_id", "user_id", name="uq_event_interests_event_user"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     interest_type = Column(String(255), default="INTERESTED")
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Float,
     Boolean,
     JSON,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -15,6 +16,7 @@ from datetime import datetime
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (Index("ix_posts_created_at_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     media_link = Column(String(255))
@@ -25,6 +27,11 @@ class Post(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     user_id = Column(Integer, ForeignKey("users.id"))
+    # engagement counters, maintained on write
+    comment_count = Column(Integer, default=0, server_default="0", nullable=False)
+    reaction_count = Column(Integer, default=0, server_default="0", nullable=False)
+    rating_sum = Column(Float, default=0.0, server_default="0", nullable=False)
+    rating_count = Column(Integer, default=0, server_default="0", nullable=False)
 
     user = relationship("User", back_populates="post")
     comment = relationship("Comments", back_populates="post")
@@ -6,6 +6,9 @@ from datetime import datetime
 
 class PostReactions(Base):
     __tablename__ = "post_reactions"
+    __table_args__ = (
+        UniqueConstraint("post_id", "user_id", name="uq_post_reactions_post_user"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     reaction_type_id = Column(Integer, ForeignKey("reaction_types.id"))
@@ -16,3 +19,13 @@ class PostReactions(Base):
     reaction_type = relationship("ReactionTypes", back_populates="post_reaction")
     post = relationship("Post", back_populates="post_reaction")
     user = relationship("User", back_populates="post_reaction")
+
+
+class PostReactionCounts(Base):
+    __tablename__ = "post_reaction_counts"
+
+    post_id = Column(Integer, ForeignKey("posts.id"), primary_key=True)
+    reaction_type_id = Column(
+        Integer, ForeignKey("reaction_types.id"), primary_key=True
+    )
+    count = Column(Integer, default=0, server_default="0", nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from datetime import datetime
@@ -6,6 +6,9 @@ from datetime import datetime
 
 class Quiz(Base):
     __tablename__ = "quizzes"
+    __table_args__ = (
+        Index("ix_quizzes_visibility_created_at", "visibility", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title = Column(String(255))
@@ -30,12 +33,43 @@ class Quiz(Base):
 
 class QuizInteraction(Base):
     __tablename__ = "quiz_interactions"
+    __table_args__ = (
+        UniqueConstraint("quiz_id", "user_id", name="uq_quiz_interactions_quiz_user"),
+        Index("ix_quiz_interactions_quiz_correct_rank", "quiz_id", "correct_rank"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     quiz_id = Column(Integer, ForeignKey("quizzes.id"))
     answer_id = Column(Integer)
     created_at = Column(DateTime, default=datetime.utcnow)
+    correct_rank = Column(Integer, nullable=True)  # nth correct answer on the quiz
 
     user = relationship("User", back_populates="quiz_interactions")
     quizzes = relationship("Quiz", back_populates="quiz_interactions")
+
+
+class QuizAnswerCounts(Base):
+    __tablename__ = "quiz_answer_counts"
+
+    quiz_id = Column(Integer, ForeignKey("quizzes.id"), primary_key=True)
+    answer_id = Column(Integer, primary_key=True)
+    count = Column(Integer, default=0, server_default="0", nullable=False)
+
+
+class UserQuizScores(Base):
+    __tablename__ = "user_quiz_scores"
+    __table_args__ = (
+        Index("ix_user_quiz_scores_standing", "correct_count", "reached_at"),
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    correct_count = Column(Integer, default=0, server_default="0", nullable=False)
+    reached_at = Column(DateTime, nullable=False)
+
+
+class QuizScoreBuckets(Base):
+    __tablename__ = "quiz_score_buckets"
+
+    correct_count = Column(Integer, primary_key=True)
+    users = Column(Integer, default=0, server_default="0", nullable=False)
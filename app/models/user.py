@@ -7,6 +7,7 @@ from sqlalchemy import (
     Float,
     Boolean,
     JSON,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -15,6 +16,7 @@ from datetime import datetime
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (Index("ix_users_role_created_id", "role_id", "created_at", "id"),)
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     image = Column(String(255))
@@ -66,7 +68,7 @@ class Student(Base):
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
-    grade = Column(Integer, default=1)
+    grade = Column(Integer, default=1, index=True)
     is_completed = Column(Boolean, default=False)
 
     user = relationship("User", back_populates="student")
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 
 class CourseAnswerCreate(BaseModel):
@@ -21,7 +21,7 @@ class CourseQuestionResponse(BaseModel):
     id: int
     question: str
     answers: List[str]
-    correct_answer: int = Field(..., alias="correctAnswer")
+    correct_answer: Optional[int] = Field(None, alias="correctAnswer")  # hidden from students
     marks: int
 
     class Config:
@@ -58,3 +58,31 @@ class CourseResponse(BaseModel):
     class Config:
         from_attributes = True
         allow_population_by_field_name = True
+
+class CourseSummary(BaseModel):
+    id: int
+    title: str
+    thumbnail: Optional[List[str]] = None
+    marks_for_pass: Optional[int] = Field(None, alias="marksForPass")
+    applicable_grade: Optional[str] = Field(None, alias="applicableGrade")
+    applicable_level: Optional[str] = Field(None, alias="applicableLevel")
+    question_count: int = Field(0, alias="questionCount")
+    created_at: datetime
+
+class CourseSummaryPage(BaseModel):
+    courses: List[CourseSummary]
+    next_cursor: Optional[str] = None
+
+class CourseAttemptCreate(BaseModel):
+    answers: Dict[int, int]  # question id -> chosen answer
+
+class CourseAttemptResponse(BaseModel):
+    id: int
+    course_id: int
+    score: int
+    total_marks: int
+    correct_count: int
+    question_count: int
+    passed: bool
+    credited: bool  # first completion, VIEW_COURSE score awarded
+    created_at: datetime
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 
 
@@ -31,6 +31,13 @@ class EventResponse(EventCreate):
     user: UserPreview
     id: int
     created_at: datetime
+    interest_counts: Dict[str, int] = {}  # interest_type -> count
+    my_interest: Optional[str] = None
+
+
+class EventPage(BaseModel):
+    events: List[EventResponse]
+    next_cursor: Optional[str] = None
 
 
 class EventInterestsCreate(BaseModel):
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field
+from typing import Dict, Optional, List
 from datetime import datetime
 
 
@@ -28,6 +28,7 @@ class CommentResponse(BaseModel):
     updated_at: datetime
     user: UserPreview
     parent_comment_id: Optional[int] = None
+    reply_count: int = 0
     replies: Optional[List["CommentResponse"]] = []  # recursive replies
 
     class Config:
@@ -37,11 +38,33 @@ class CommentResponse(BaseModel):
 CommentResponse.update_forward_refs()
 
 
+class CommentPage(BaseModel):
+    comments: List[CommentResponse]
+    next_cursor: Optional[str] = None
+
+
 class ReactionCreate(BaseModel):
     reaction_type_id: int
     post_id: int
 
 
+class ReactionBatch(BaseModel):
+    reactions: List[ReactionCreate] = Field(..., min_length=1, max_length=100)
+
+
+class ReactionState(BaseModel):
+    id: Optional[int] = None
+    post_id: int
+    reaction_type_id: Optional[int] = None
+    state: str  # created | updated | deleted | unchanged
+
+
+class ReactionSummary(BaseModel):
+    post_id: int
+    counts: Dict[int, int] = {}  # reaction_type_id -> count
+    my_reaction_type_id: Optional[int] = None
+
+
 class ReactionResponse(BaseModel):
     id: int
     reaction_type_id: int
@@ -87,3 +110,8 @@ class PostResponse(PostCreate):
 
     class Config:
         from_attributes = True
+
+
+class PostFeedPage(BaseModel):
+    posts: List[PostResponse]
+    next_cursor: Optional[str] = None
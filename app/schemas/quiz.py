@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 class UserPreview(BaseModel):
@@ -33,6 +33,10 @@ class QuizResponse(QuizCreate):
     user: UserPreview
     created_at: datetime
 
+class QuizPage(BaseModel):
+    quizzes: List[QuizResponse]
+    next_cursor: Optional[str] = None
+
 class QuizInteractionCreate(BaseModel):
     answer_id: int
 
@@ -44,3 +48,25 @@ class QuizInteractionResponse(QuizInteractionCreate):
     user: Optional[UserPreview] = None
     quiz_id: int
     created_at: datetime
+
+class QuizInteractionPage(BaseModel):
+    interactions: List[QuizInteractionResponse]
+    next_cursor: Optional[str] = None
+
+class QuizStats(BaseModel):
+    quiz_id: int
+    attempts: int
+    correct: int
+    percent_correct: float
+    answers: Dict[int, int] = {}  # answer_id -> count
+
+class QuizLeaderboardEntry(BaseModel):
+    rank: int
+    user: UserPreview
+    answered_at: datetime
+
+class GlobalLeaderboardEntry(BaseModel):
+    rank: int
+    user: UserPreview
+    correct_count: int
+    reached_at: datetime
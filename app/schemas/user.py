@@ -161,3 +161,15 @@ class StudentListResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TeacherListPage(BaseModel):
+    teachers: List[TeacherListResponse]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+class StudentListPage(BaseModel):
+    students: List[StudentListResponse]
+    total: int
+    next_cursor: Optional[str] = None
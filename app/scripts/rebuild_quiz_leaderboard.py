@@ -0,0 +1,17 @@
+from app.db.session import SessionLocal
+from app.crud.crud_quiz_leaderboard import crud_quiz_leaderboard
+
+
+def main():
+    db = SessionLocal()
+    try:
+        ranked = crud_quiz_leaderboard.rebuild(db)
+        print(f"Quiz leaderboard rebuilt, {ranked} correct answers ranked")
+    except Exception as e:
+        print("Failed to rebuild quiz leaderboard: ", e)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
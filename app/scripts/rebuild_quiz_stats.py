@@ -0,0 +1,17 @@
+from app.db.session import SessionLocal
+from app.services.quiz_stats import rebuild_quiz_answer_counts
+
+
+def main():
+    db = SessionLocal()
+    try:
+        rows = rebuild_quiz_answer_counts(db)
+        print(f"Quiz answer counts rebuilt, {rows} rows written")
+    except Exception as e:
+        print("Failed to rebuild quiz answer counts: ", e)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+from app.db.session import SessionLocal
+from app.services.post_counters import rebuild_reaction_counts
+
+
+def main():
+    db = SessionLocal()
+    try:
+        rows = rebuild_reaction_counts(db)
+        print(f"Reaction counts rebuilt, {rows} rows written")
+    except Exception as e:
+        print("Failed to rebuild reaction counts: ", e)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
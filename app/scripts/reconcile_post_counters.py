@@ -0,0 +1,17 @@
+from app.db.session import SessionLocal
+from app.services.post_counters import reconcile_post_counters
+
+
+def main():
+    db = SessionLocal()
+    try:
+        repaired = reconcile_post_counters(db)
+        print(f"Post counters reconciled, {repaired} posts repaired")
+    except Exception as e:
+        print("Failed to reconcile post counters: ", e)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
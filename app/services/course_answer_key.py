@@ -0,0 +1,101 @@
+import threading
+from dataclasses import dataclass
+from itertools import compress
+from operator import eq
+from typing import Dict, Tuple
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.exceptions import NotFoundError
+from app.models.course import Course, CourseQuestion
+from app.utils.ttl_cache import TTLCache
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    """A course's questions compiled into parallel tuples for grading."""
+
+    course_id: int
+    question_ids: Tuple[int, ...]
+    correct_answers: Tuple[int, ...]
+    marks: Tuple[int, ...]
+    total_marks: int
+    pass_marks: int
+
+    def grade(self, answers: Dict[int, int]) -> Tuple[int, int]:
+        # one pass over the aligned columns: chosen == correct -> mask -> marks
+        chosen = map(answers.get, self.question_ids)
+        hits = tuple(map(eq, chosen, self.correct_answers))
+        return sum(compress(self.marks, hits)), sum(hits)
+
+
+def compile_answer_key(db: Session, course_id: int) -> AnswerKey:
+    marks_for_pass = (
+        db.query(Course.marks_for_pass).filter(Course.id == course_id).one_or_none()
+    )
+    if marks_for_pass is None:
+        raise NotFoundError("Course not found")
+    rows = (
+        db.query(CourseQuestion.id, CourseQuestion.correct_answer, CourseQuestion.marks)
+        .filter(CourseQuestion.course_id == course_id)
+        .order_by(CourseQuestion.id)
+        .all()
+    )
+    question_ids, correct_answers, marks = tuple(zip(*rows)) or ((), (), ())
+    total_marks = sum(marks)
+    return AnswerKey(
+        course_id=course_id,
+        question_ids=question_ids,
+        correct_answers=correct_answers,
+        marks=marks,
+        total_marks=total_marks,
+        # without a pass mark every mark is required
+        pass_marks=(
+            marks_for_pass[0] if marks_for_pass[0] is not None else total_marks
+        ),
+    )
+
+
+class AnswerKeyCache:
+    """Compiled answer keys in a per-process TTL-LRU.
+
+    ``invalidate`` bumps a generation counter so a key compiled from data
+    read before an update is never stored. Other workers may grade against
+    an edited course up to ``ttl`` seconds late.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._keys = TTLCache(maxsize, ttl)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, course_id: int) -> AnswerKey:
+        key = self._keys.get(course_id)
+        if key is not None:
+            return key
+        with self._lock:
+            generation = self._generation
+
+        key = compile_answer_key(db, course_id)
+        with self._lock:
+            if generation == self._generation:
+                self._keys.put(course_id, key)
+        return key
+
+    def invalidate(self, course_id: int):
+        with self._lock:
+            self._generation += 1
+            self._keys.invalidate(course_id)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._keys.clear()
+
+
+answer_key_cache = AnswerKeyCache(
+    maxsize=settings.COURSE_KEY_CACHE_MAX_SIZE,
+    ttl=settings.COURSE_KEY_CACHE_TTL_SECONDS,
+)
@@ -1,12 +1,14 @@
+from collections import defaultdict
+from typing import List, Optional
 from app.schemas.post import CommentResponse
-from app.models.comment import Comments
 
 
-def format_comment(comment: Comments) -> CommentResponse:
+def format_comment(row) -> CommentResponse:
+    comment = row.Comments
     commented_user = {
         "id": comment.user_id,
-        "name": comment.user.name,
-        "image": comment.user.image,
+        "name": row.user_name,
+        "image": row.user_image,
     }
 
     return CommentResponse(
@@ -16,9 +18,32 @@ def format_comment(comment: Comments) -> CommentResponse:
         updated_at=comment.updated_at,
         user=commented_user,
         parent_comment_id=comment.parent_comment_id,
-        replies=(
-            [format_comment(reply) for reply in comment.replies]
-            if comment.replies
-            else []
-        ),
+        replies=[],
     )
+
+
+def build_comment_tree(
+    rows,
+    max_depth: Optional[int] = None,
+    reply_limit: Optional[int] = None,
+) -> List[CommentResponse]:
+    # rows are flat (Comments, user_name, user_image) tuples for one post,
+    # already in display order; replies are attached by parent id in O(n)
+    children = defaultdict(list)
+    for row in rows:
+        children[row.Comments.parent_comment_id].append(row)
+
+    top_level = [format_comment(row) for row in children[None]]
+    level = top_level
+    depth = 0
+    while level and (max_depth is None or depth < max_depth):
+        next_level = []
+        for node in level:
+            replies = children.get(node.id, [])
+            if reply_limit is not None:
+                replies = replies[:reply_limit]
+            node.replies = [format_comment(row) for row in replies]
+            next_level.extend(node.replies)
+        level = next_level
+        depth += 1
+    return top_level
@@ -1,21 +1,57 @@
 from app.models.user import User
+from sqlalchemy import event, update
 from sqlalchemy.orm import Session
+from app.services.score_accumulator import score_accumulator
 import logging
 
 logger = logging.getLogger(__name__)
 
+PENDING_SCORE_DELTAS = "pending_score_deltas"
 
-def update_user_score(db: Session, value: int, user_id: int):
+
+# buffered deltas only reach the accumulator once the caller's transaction commits
+@event.listens_for(Session, "after_commit")
+def _release_score_deltas(session: Session):
+    for user_id, value in session.info.pop(PENDING_SCORE_DELTAS, ()):
+        score_accumulator.add(user_id, value)
+
+
+# a rollback (or closing without commit) drops them
+@event.listens_for(Session, "after_transaction_end")
+def _drop_score_deltas(session: Session, transaction):
+    if transaction.parent is None:
+        session.info.pop(PENDING_SCORE_DELTAS, None)
+
+
+def update_user_score(db: Session, value: int, user_id: int, commit: bool = True):
+    # with write-behind enabled the delta is buffered and flushed in batches
+    if score_accumulator.enabled:
+        if commit:
+            score_accumulator.add(user_id, value)
+        else:
+            # tie the delta to the caller's transaction, even if nothing ran yet
+            if db.get_transaction() is None:
+                db.begin()
+            db.info.setdefault(PENDING_SCORE_DELTAS, []).append((user_id, value))
+        return None
+
+    # single atomic UPDATE ... RETURNING; with commit=False the increment joins
+    # the caller's transaction and errors propagate to the caller
     try:
-        user = db.get(User, user_id)
-        if not user:
-            return None
-        user.system_score += value
-        db.commit()
-        db.refresh(user)
+        new_score = db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(system_score=User.system_score + value)
+            .returning(User.system_score)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        if commit:
+            db.commit()
         logger.info("score updated")
-        return user.system_score
+        return new_score
     except Exception as e:
+        if not commit:
+            raise
         db.rollback()
         logger.error(f"Error updating score: {str(e)}")
         return None
@@ -0,0 +1,148 @@
+from sqlalchemy import bindparam, delete, func, insert, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.post import Post
+from app.models.comment import Comments
+from app.models.post_reaction import PostReactions, PostReactionCounts
+from app.models.post_ratings import PostRatings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def adjust_post_counters(db: Session, post_id: int, **deltas):
+    # in-place increments; the caller commits
+    values = {
+        getattr(Post, column): getattr(Post, column) + delta
+        for column, delta in deltas.items()
+        if delta
+    }
+    if not values:
+        return
+    db.execute(
+        update(Post)
+        .where(Post.id == post_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def adjust_reaction_counts(db: Session, post_id: int, deltas: dict):
+    # upsert per reaction type; the caller commits
+    _upsert_reaction_counts(
+        db,
+        [
+            {"post_id": post_id, "reaction_type_id": type_id, "count": delta}
+            for type_id, delta in deltas.items()
+            if delta
+        ],
+    )
+
+
+def adjust_reaction_counters(db: Session, post_deltas: dict, type_deltas: dict):
+    # batched reaction_count + per-type updates for many posts; the caller commits
+    params = [
+        {"b_post_id": post_id, "b_delta": delta}
+        for post_id, delta in post_deltas.items()
+        if delta
+    ]
+    if params:
+        posts = Post.__table__
+        db.connection().execute(
+            update(posts)
+            .where(posts.c.id == bindparam("b_post_id"))
+            .values(reaction_count=posts.c.reaction_count + bindparam("b_delta")),
+            params,
+        )
+    _upsert_reaction_counts(
+        db,
+        [
+            {"post_id": post_id, "reaction_type_id": type_id, "count": delta}
+            for (post_id, type_id), delta in type_deltas.items()
+            if delta
+        ],
+    )
+
+
+def _upsert_reaction_counts(db: Session, rows: list):
+    if not rows:
+        return
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(PostReactionCounts).values(rows)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["post_id", "reaction_type_id"],
+            set_={"count": PostReactionCounts.count + stmt.excluded.count},
+        )
+    )
+
+
+def rebuild_reaction_counts(db: Session) -> int:
+    try:
+        db.execute(delete(PostReactionCounts))
+        result = db.execute(
+            insert(PostReactionCounts).from_select(
+                ["post_id", "reaction_type_id", "count"],
+                select(
+                    PostReactions.post_id,
+                    PostReactions.reaction_type_id,
+                    func.count(PostReactions.id),
+                ).group_by(PostReactions.post_id, PostReactions.reaction_type_id),
+            )
+        )
+        db.commit()
+        logger.info(f"Rebuilt {result.rowcount} reaction count rows")
+        return result.rowcount
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error rebuilding reaction counts: {str(e)}")
+        raise
+
+
+def reconcile_post_counters(db: Session) -> int:
+    comment_count = (
+        select(func.count(Comments.id))
+        .where(Comments.post_id == Post.id)
+        .scalar_subquery()
+    )
+    reaction_count = (
+        select(func.count(PostReactions.id))
+        .where(PostReactions.post_id == Post.id)
+        .scalar_subquery()
+    )
+    rating_sum = (
+        select(func.coalesce(func.sum(PostRatings.ratings), 0.0))
+        .where(PostRatings.post_id == Post.id)
+        .scalar_subquery()
+    )
+    rating_count = (
+        select(func.count(PostRatings.id))
+        .where(PostRatings.post_id == Post.id)
+        .scalar_subquery()
+    )
+    try:
+        result = db.execute(
+            update(Post)
+            .where(
+                or_(
+                    Post.comment_count != comment_count,
+                    Post.reaction_count != reaction_count,
+                    Post.rating_sum != rating_sum,
+                    Post.rating_count != rating_count,
+                )
+            )
+            .values(
+                comment_count=comment_count,
+                reaction_count=reaction_count,
+                rating_sum=rating_sum,
+                rating_count=rating_count,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        logger.info(f"Reconciled counters for {result.rowcount} posts")
+        return result.rowcount
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error reconciling post counters: {str(e)}")
+        raise
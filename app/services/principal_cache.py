@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Optional
+from sqlalchemy import event, inspect
+from app.core.config import settings
+from app.models.user import User
+from app.utils.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    id: int
+    role_id: Optional[int]
+    name: str
+    image: Optional[str]
+    is_verified: Optional[bool]
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthenticatedUser":
+        return cls(
+            id=user.id,
+            role_id=user.role_id,
+            name=user.name,
+            image=user.image,
+            is_verified=user.is_verified,
+        )
+
+
+# per process, so other workers may see an updated user up to the TTL late
+principal_cache = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAX_SIZE, ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
+
+
+PRINCIPAL_FIELDS = ("role_id", "name", "image", "is_verified")
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_updated_principal(mapper, connection, target: User):
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in PRINCIPAL_FIELDS):
+        principal_cache.invalidate(target.id)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_principal(mapper, connection, target: User):
+    principal_cache.invalidate(target.id)
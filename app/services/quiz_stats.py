@@ -0,0 +1,48 @@
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.quiz import QuizAnswerCounts, QuizInteraction
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def adjust_quiz_answer_count(db: Session, quiz_id: int, answer_id: int, delta: int = 1) -> int:
+    # upsert the per-answer counter and return the new count; the caller commits
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(QuizAnswerCounts).values(
+        quiz_id=quiz_id, answer_id=answer_id, count=delta
+    )
+    return db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["quiz_id", "answer_id"],
+            set_={"count": QuizAnswerCounts.count + stmt.excluded.count},
+        ).returning(QuizAnswerCounts.count)
+    ).scalar_one()
+
+
+def rebuild_quiz_answer_counts(db: Session) -> int:
+    try:
+        db.execute(delete(QuizAnswerCounts))
+        result = db.execute(
+            insert(QuizAnswerCounts).from_select(
+                ["quiz_id", "answer_id", "count"],
+                select(
+                    QuizInteraction.quiz_id,
+                    QuizInteraction.answer_id,
+                    func.count(QuizInteraction.id),
+                )
+                .where(
+                    QuizInteraction.quiz_id.is_not(None),
+                    QuizInteraction.answer_id.is_not(None),
+                )
+                .group_by(QuizInteraction.quiz_id, QuizInteraction.answer_id),
+            )
+        )
+        db.commit()
+        logger.info(f"Rebuilt {result.rowcount} quiz answer count rows")
+        return result.rowcount
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error rebuilding quiz answer counts: {str(e)}")
+        raise
@@ -0,0 +1,147 @@
+import glob
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Optional
+from sqlalchemy import Float, Integer, bindparam, column, update, values
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+def apply_score_deltas(db: Session, deltas: Dict[int, float]):
+    # one UPDATE ... FROM (VALUES ...) on Postgres, executemany elsewhere
+    if db.get_bind().dialect.name == "postgresql":
+        score_deltas = values(
+            column("user_id", Integer), column("delta", Float), name="score_deltas"
+        ).data(list(deltas.items()))
+        db.execute(
+            update(User)
+            .where(User.id == score_deltas.c.user_id)
+            .values(system_score=User.system_score + score_deltas.c.delta)
+            .execution_options(synchronize_session=False)
+        )
+        return
+
+    users = User.__table__
+    db.execute(
+        update(users)
+        .where(users.c.id == bindparam("user_id"))
+        .values(system_score=users.c.system_score + bindparam("delta")),
+        [{"user_id": user_id, "delta": delta} for user_id, delta in deltas.items()],
+    )
+
+
+class ScoreAccumulator:
+    """Buffers per-user score deltas and writes them in one batched UPDATE.
+
+    Deltas that cannot be written at shutdown are spilled to a spool file
+    of their own per process (``<spool_path>.<pid>``) and replayed on the
+    next start. A spool is claimed by renaming it to ``.processing`` and
+    only removed once its deltas are committed.
+    """
+
+    def __init__(self, enabled: bool, max_events: int, spool_path: str):
+        self.enabled = enabled
+        self.max_events = max_events
+        self.spool_path = os.path.abspath(spool_path)
+        self.on_threshold: Optional[Callable[[], None]] = None
+        self._deltas: Dict[int, float] = defaultdict(float)
+        self._events = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def add(self, user_id: int, value: float):
+        with self._lock:
+            self._deltas[user_id] += value
+            self._events += 1
+            full = self._events >= self.max_events
+        if full and self.on_threshold:
+            self.on_threshold()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._deltas)
+
+    def _drain(self) -> Dict[int, float]:
+        with self._lock:
+            deltas, self._deltas = self._deltas, defaultdict(float)
+            self._events = 0
+        return {user_id: delta for user_id, delta in deltas.items() if delta}
+
+    def _restore(self, deltas: Dict[int, float]):
+        with self._lock:
+            for user_id, delta in deltas.items():
+                self._deltas[user_id] += delta
+
+    def flush(self, db: Session) -> int:
+        with self._flush_lock:
+            deltas = self._drain()
+            if not deltas:
+                return 0
+            try:
+                apply_score_deltas(db, deltas)
+                db.commit()
+            except Exception:
+                db.rollback()
+                self._restore(deltas)
+                raise
+            logger.info(f"Flushed score deltas for {len(deltas)} users")
+            return len(deltas)
+
+    def spill(self):
+        deltas = self._drain()
+        if not deltas:
+            return
+        path = f"{self.spool_path}.{os.getpid()}"
+        with open(path, "a") as spool:
+            spool.write(json.dumps(deltas) + "\n")
+        logger.warning(f"Spilled score deltas for {len(deltas)} users to {path}")
+
+    def replay_spools(self, db: Session) -> int:
+        for stale in glob.glob(f"{glob.escape(self.spool_path)}.*.processing"):
+            # either another worker is replaying it right now, or one died
+            # mid-replay and its deltas may already be committed
+            logger.warning(f"Leaving score spool {stale} alone; check it if no worker is replaying it")
+
+        # the bare path is the spool written before spools were per process
+        spools = glob.glob(glob.escape(self.spool_path)) + glob.glob(f"{glob.escape(self.spool_path)}.*")
+        replayed = 0
+        for path in sorted(spools):
+            if path.endswith(".processing"):
+                continue
+            claimed = f"{path}.{os.getpid()}.processing"
+            try:
+                # rename is atomic, so only one worker claims each spool
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue
+            deltas: Dict[int, float] = defaultdict(float)
+            with open(claimed) as spool:
+                for line in spool:
+                    if line.strip():
+                        for user_id, delta in json.loads(line).items():
+                            deltas[int(user_id)] += delta
+            try:
+                if deltas:
+                    apply_score_deltas(db, deltas)
+                db.commit()
+            except Exception:
+                db.rollback()
+                # put it back for the next start
+                os.rename(claimed, path)
+                raise
+            os.remove(claimed)
+            replayed += len(deltas)
+            logger.info(f"Replayed score deltas for {len(deltas)} users from {path}")
+        return replayed
+
+score_accumulator = ScoreAccumulator(
+    enabled=settings.SCORE_WRITE_BEHIND,
+    max_events=settings.SCORE_FLUSH_MAX_EVENTS,
+    spool_path=settings.SCORE_SPOOL_PATH,
+)
@@ -0,0 +1,52 @@
+import time
+from bisect import bisect_left
+from typing import Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.system import ScoreLevels
+from app.schemas.user import ScoreLevel as ScoreLevelSchema
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (sorted max_limits, matching levels, expires_at); swapped as a whole, never
+# mutated. Writes through the ORM in this process invalidate it; the TTL
+# bounds how late other workers and out-of-band edits are picked up.
+_score_table: Optional[Tuple[Tuple[int, ...], Tuple[ScoreLevelSchema, ...], float]] = None
+
+
+def load_score_levels(db: Session) -> Tuple[Tuple[int, ...], Tuple[ScoreLevelSchema, ...], float]:
+    global _score_table
+    levels = db.query(ScoreLevels).order_by(ScoreLevels.max_limit.asc()).all()
+    _score_table = (
+        tuple(level.max_limit for level in levels),
+        tuple(ScoreLevelSchema.model_validate(level) for level in levels),
+        time.monotonic() + settings.SCORE_LEVEL_CACHE_TTL_SECONDS,
+    )
+    logger.info(f"Loaded {len(levels)} score levels")
+    return _score_table
+
+
+def invalidate_score_levels():
+    global _score_table
+    _score_table = None
+
+
+@event.listens_for(ScoreLevels, "after_insert")
+@event.listens_for(ScoreLevels, "after_update")
+@event.listens_for(ScoreLevels, "after_delete")
+def _invalidate_written_score_levels(mapper, connection, target: ScoreLevels):
+    invalidate_score_levels()
+
+
+def resolve_score_level(db: Session, score: float) -> Optional[ScoreLevelSchema]:
+    table = _score_table
+    if table is None or table[2] < time.monotonic():
+        table = load_score_levels(db)
+    limits, levels, _ = table
+    if not levels:
+        return None
+    # first level whose max_limit covers the score, else the top level
+    index = bisect_left(limits, score)
+    return levels[min(index, len(levels) - 1)]
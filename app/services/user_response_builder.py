@@ -1,25 +1,15 @@
 from app.schemas.user import (
     UserResponse,
-    ScoreLevel as ScoreLevelSchema,
     TeacherListResponse,
     StudentListResponse,
 )
-from app.models.system import ScoreLevels
+from app.services.score_level_cache import resolve_score_level
 from sqlalchemy.orm import Session
 from app.models.user import User as UserModel
 
 
 def build_user_response(user: UserModel, db: Session) -> UserResponse:
-    score_levels = db.query(ScoreLevels).order_by(ScoreLevels.max_limit.asc()).all()
-    level_data = None
-    for level in score_levels:
-        if user.system_score <= level.max_limit:
-            level_data = level
-            break
-    if not level_data and score_levels:
-        level_data = score_levels[-1]
-
-    level_schema = ScoreLevelSchema.from_orm(level_data) if level_data else None
+    level_schema = resolve_score_level(db, user.system_score)
 
     return UserResponse(
         id=user.id,
@@ -48,16 +38,7 @@ def build_user_response(user: UserModel, db: Session) -> UserResponse:
 
 
 def build_teacher_list_response(user: UserModel, db: Session) -> TeacherListResponse:
-    score_levels = db.query(ScoreLevels).order_by(ScoreLevels.max_limit.asc()).all()
-    level_data = None
-    for level in score_levels:
-        if user.system_score <= level.max_limit:
-            level_data = level
-            break
-    if not level_data and score_levels:
-        level_data = score_levels[-1]
-
-    level_schema = ScoreLevelSchema.from_orm(level_data) if level_data else None
+    level_schema = resolve_score_level(db, user.system_score)
 
     return TeacherListResponse(
         id=user.id,
@@ -81,16 +62,7 @@ def build_teacher_list_response(user: UserModel, db: Session) -> TeacherListResp
 
 
 def build_student_list_response(user: UserModel, db: Session) -> StudentListResponse:
-    score_levels = db.query(ScoreLevels).order_by(ScoreLevels.max_limit.asc()).all()
-    level_data = None
-    for level in score_levels:
-        if user.system_score <= level.max_limit:
-            level_data = level
-            break
-    if not level_data and score_levels:
-        level_data = score_levels[-1]
-
-    level_schema = ScoreLevelSchema.from_orm(level_data) if level_data else None
+    level_schema = resolve_score_level(db, user.system_score)
 
     return StudentListResponse(
         id=user.id,
@@ -1,7 +1,14 @@
+import logging
 from apscheduler.schedulers.background import BackgroundScheduler
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.db.session import SessionLocal
 from app.services.grade_updater import update_student_grades
+from app.services.score_accumulator import score_accumulator
+
+logger = logging.getLogger(__name__)
+
+scheduler = BackgroundScheduler()
 
 
 def run_update():
@@ -12,8 +19,54 @@ def run_update():
         db.close()
 
 
+def run_score_flush():
+    db = SessionLocal()
+    try:
+        score_accumulator.flush(db)
+    except Exception as e:
+        logger.error(f"Error flushing score deltas: {str(e)}")
+    finally:
+        db.close()
+
+
+def request_score_flush():
+    # event-count trigger; runs on the scheduler's worker threads
+    if scheduler.running:
+        scheduler.add_job(run_score_flush, id="score_flush_now", replace_existing=True)
+
+
+def replay_score_spools():
+    db = SessionLocal()
+    try:
+        score_accumulator.replay_spools(db)
+    except Exception as e:
+        logger.error(f"Error replaying spooled score deltas: {str(e)}")
+    finally:
+        db.close()
+
+
 def start_scheduler():
-    scheduler = BackgroundScheduler()
     scheduler.add_job(run_update, "cron", month=1, day=1, hour=0, minute=0)
+    if score_accumulator.enabled:
+        replay_score_spools()
+        score_accumulator.on_threshold = request_score_flush
+        scheduler.add_job(
+            run_score_flush,
+            "interval",
+            seconds=settings.SCORE_FLUSH_INTERVAL_MS / 1000,
+            id="score_flush",
+            max_instances=1,
+            coalesce=True,
+        )
     scheduler.start()
     print("Scheduler started for yearly grade updates.")
+
+
+def stop_scheduler():
+    # startup may have failed before the scheduler was started
+    if scheduler.running:
+        scheduler.shutdown(wait=True)
+    if score_accumulator.enabled:
+        run_score_flush()
+        # anything still buffered could not be written; keep it for next start
+        score_accumulator.spill()
@@ -0,0 +1,100 @@
+"""Requests/sec of AuthMiddleware on a trivial authenticated route.
+
+Compares the previous BaseHTTPMiddleware implementation with the pure
+ASGI one. The principal cache is primed so no database is touched; the
+app is driven in-process so only middleware + routing cost is measured.
+
+    python -m benchmarks.auth_middleware_bench
+"""
+import asyncio
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("CLIENT_URL", "http://localhost")
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.constants.public_paths import PUBLIC_PATHS
+from app.middleware.auth_middleware import AuthMiddleware
+from app.services.principal_cache import AuthenticatedUser, principal_cache
+from app.utils.jwt import create_access_token, verify_access_token
+
+REQUESTS = 20000
+
+
+class BaseHTTPAuthMiddleware(BaseHTTPMiddleware):
+    # previous implementation, kept here as the baseline
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in PUBLIC_PATHS:
+            return await call_next(request)
+        authorization = request.headers.get("Authorization")
+        if not authorization:
+            return JSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content={"detail": "Missing Authorization Header"},
+            )
+        scheme, _, token = authorization.partition(" ")
+        payload = verify_access_token(token)
+        request.state.user = principal_cache.get(payload.get("user_id"))
+        return await call_next(request)
+
+
+def build_app(middleware) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {"user": request.state.user.id}
+
+    return app
+
+
+async def run(app, token: str) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 1234),
+        "server": ("127.0.0.1", 8000),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(dict(scope), receive, send)
+    return REQUESTS / (time.perf_counter() - start)
+
+
+def main():
+    principal_cache.put(
+        1, AuthenticatedUser(id=1, role_id=1, name="bench", image=None, is_verified=True)
+    )
+    token = create_access_token({"user_id": 1, "role_id": 1})
+
+    before = asyncio.run(run(build_app(BaseHTTPAuthMiddleware), token))
+    after = asyncio.run(run(build_app(AuthMiddleware), token))
+    print(f"BaseHTTPMiddleware: {before:10.0f} req/s")
+    print(f"pure ASGI:          {after:10.0f} req/s  ({after / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
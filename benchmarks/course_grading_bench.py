@@ -0,0 +1,122 @@
+"""Course attempt grading on large courses and under concurrent submissions.
+
+Seeds a throwaway SQLite file with one course (2000 questions by
+default), then compares grading with a per-request ORM walk over the
+questions against the cached, compiled answer key, and finally drives
+submit_attempt from several threads to check throughput and that the
+VIEW_COURSE credit is applied once per user.
+
+    python -m benchmarks.course_grading_bench [questions] [threads]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("CLIENT_URL", "http://localhost")
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import sessionmaker
+from app.db.base import Base
+import app.models  # noqa: F401  registers every table
+from app.models.course import Course, CourseQuestion, CourseCompletion
+from app.models.user import User
+from app.crud.crud_course import crud_course
+from app.schemas.course import CourseAttemptCreate
+from app.services.course_answer_key import answer_key_cache, compile_answer_key
+
+USERS = 200
+REPEAT = 200
+
+
+def timed(fn, repeat=REPEAT) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def seed(db, questions: int):
+    db.execute(
+        insert(User),
+        [
+            {"id": i, "name": f"user{i}", "email": f"user{i}@bench", "password": "x", "role_id": 1}
+            for i in range(1, USERS + 1)
+        ],
+    )
+    db.execute(insert(Course), [{"id": 1, "title": "bench", "marks_for_pass": questions}])
+    rng = random.Random(7)
+    db.execute(
+        insert(CourseQuestion),
+        [
+            {"course_id": 1, "question": f"q{n}", "correct_answer": rng.randint(1, 4), "marks": rng.randint(1, 3)}
+            for n in range(questions)
+        ],
+    )
+    db.commit()
+
+
+def grade_by_walking_questions(db, answers):
+    # baseline: load the questions for every submission and compare one by one
+    course = db.get(Course, 1)
+    score = 0
+    for question in db.query(CourseQuestion).filter(CourseQuestion.course_id == course.id):
+        if answers.get(question.id) == question.correct_answer:
+            score += question.marks
+    db.expire_all()
+    return score
+
+
+def main():
+    questions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db", connect_args={"timeout": 30})
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        db = Session()
+        seed(db, questions)
+
+        key = compile_answer_key(db, 1)
+        rng = random.Random(11)
+        answers = {question_id: rng.randint(1, 4) for question_id in key.question_ids}
+        assert key.grade(answers)[0] == grade_by_walking_questions(db, answers)
+
+        print(f"{questions} questions")
+        print(f"ORM walk per submission:  {timed(lambda: grade_by_walking_questions(db, answers), 20):8.3f} ms")
+        print(f"compile answer key:       {timed(lambda: compile_answer_key(db, 1), 20):8.3f} ms")
+        print(f"grade with cached key:    {timed(lambda: answer_key_cache.get(db, 1).grade(answers)):8.3f} ms")
+        db.close()
+
+        # each user submits a failing then a passing attempt, concurrently
+        perfect = {question_id: correct for question_id, correct in zip(key.question_ids, key.correct_answers)}
+
+        def submit(user_id: int):
+            session = Session()
+            try:
+                crud_course.submit_attempt(session, 1, user_id, CourseAttemptCreate(answers=answers))
+                crud_course.submit_attempt(session, 1, user_id, CourseAttemptCreate(answers=perfect))
+                crud_course.submit_attempt(session, 1, user_id, CourseAttemptCreate(answers=perfect))
+            finally:
+                session.close()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(submit, range(1, USERS + 1)))
+        elapsed = time.perf_counter() - start
+        db = Session()
+        completions = db.execute(select(func.count()).select_from(CourseCompletion)).scalar_one()
+        print(f"{threads} threads:                {USERS * 3 / elapsed:8.0f} submissions/s")
+        print(f"completions credited:     {completions:8d} (expected {USERS})")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
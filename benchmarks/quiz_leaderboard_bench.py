@@ -0,0 +1,146 @@
+"""Quiz leaderboard queries over a large quiz_interactions table.
+
+Seeds a throwaway SQLite file (1M interactions by default: 2000 quizzes
+answered by 500 users), rebuilds the standings, then compares the
+maintained top-K / my-rank lookups with the equivalent scans over
+quiz_interactions. Also times the answer path, which now updates the
+standings inline.
+
+    python -m benchmarks.quiz_leaderboard_bench [interactions]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("CLIENT_URL", "http://localhost")
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import sessionmaker
+from app.db.base import Base
+import app.models  # noqa: F401  registers every table
+from app.models.quiz import Quiz, QuizInteraction
+from app.models.user import User
+from app.crud.crud_quiz import crud_quiz
+from app.crud.crud_quiz_leaderboard import crud_quiz_leaderboard
+from app.schemas.quiz import QuizInteractionCreate
+from app.services.principal_cache import AuthenticatedUser
+
+USERS = 500
+ME = USERS // 2  # always answers correctly, so it is ranked everywhere
+REPEAT = 50
+CHUNK = 50000
+
+
+def timed(fn, repeat=REPEAT) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def seed(db, interactions: int):
+    quizzes = max(1, interactions // USERS)
+    now = datetime.utcnow()
+    db.execute(
+        insert(User),
+        [
+            {"id": i, "name": f"user{i}", "email": f"user{i}@bench", "password": "x", "role_id": 1}
+            for i in range(1, USERS + 2)
+        ],
+    )
+    db.execute(
+        insert(Quiz),
+        [
+            {"id": q, "title": f"quiz{q}", "question": "?", "correct_answer": 1, "user_id": 1, "visibility": True}
+            for q in range(1, quizzes + 2)
+        ],
+    )
+    rng = random.Random(7)
+    rows = []
+    for n in range(quizzes * USERS):
+        user_id = n % USERS + 1
+        rows.append(
+            {
+                "quiz_id": n // USERS + 1,
+                "user_id": user_id,
+                "answer_id": 1 if user_id == ME else rng.choice((1, 1, 2, 3, 4)),
+                "created_at": now + timedelta(milliseconds=n),
+            }
+        )
+        if len(rows) == CHUNK:
+            db.execute(insert(QuizInteraction), rows)
+            rows = []
+    if rows:
+        db.execute(insert(QuizInteraction), rows)
+    db.commit()
+    return quizzes
+
+
+def scan_top(db):
+    correct = (
+        select(QuizInteraction.user_id, func.count().label("correct"))
+        .join(Quiz, Quiz.id == QuizInteraction.quiz_id)
+        .where(QuizInteraction.answer_id == Quiz.correct_answer)
+        .group_by(QuizInteraction.user_id)
+        .subquery()
+    )
+    return db.execute(select(correct).order_by(correct.c.correct.desc()).limit(10)).all()
+
+
+def scan_rank(db, user_id: int):
+    correct = (
+        select(QuizInteraction.user_id, func.count().label("correct"))
+        .join(Quiz, Quiz.id == QuizInteraction.quiz_id)
+        .where(QuizInteraction.answer_id == Quiz.correct_answer)
+        .group_by(QuizInteraction.user_id)
+        .subquery()
+    )
+    mine = select(correct.c.correct).where(correct.c.user_id == user_id).scalar_subquery()
+    return db.execute(select(func.count()).where(correct.c.correct > mine)).scalar_one() + 1
+
+
+def main():
+    interactions = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+
+        start = time.perf_counter()
+        quizzes = seed(db, interactions)
+        print(f"seeded {quizzes * USERS} interactions in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        crud_quiz_leaderboard.rebuild(db)
+        print(f"rebuild:                  {time.perf_counter() - start:8.2f} s")
+
+        me = AuthenticatedUser(id=ME, role_id=1, name="me", image=None, is_verified=True)
+        print(f"scan top-10:              {timed(lambda: scan_top(db), 3):8.2f} ms")
+        print(f"scan my rank:             {timed(lambda: scan_rank(db, me.id), 3):8.2f} ms")
+        print(f"global top-10:            {timed(lambda: crud_quiz_leaderboard.get_global_top(db, 10)):8.2f} ms")
+        print(f"global my rank:           {timed(lambda: crud_quiz_leaderboard.get_global_rank(db, me)):8.2f} ms")
+        print(f"quiz top-10:              {timed(lambda: crud_quiz_leaderboard.get_quiz_top(db, quizzes // 2, 10)):8.2f} ms")
+        print(f"quiz my rank:             {timed(lambda: crud_quiz_leaderboard.get_quiz_rank(db, quizzes // 2, me)):8.2f} ms")
+
+        # every user answers the spare quiz through the regular answer path
+        spare = quizzes + 1
+        users = iter(range(1, USERS + 1))
+
+        def answer():
+            user = AuthenticatedUser(id=next(users), role_id=1, name="u", image=None, is_verified=True)
+            crud_quiz.create_quiz_interaction(db, spare, user, QuizInteractionCreate(answer_id=1))
+
+        print(f"answer + standings:       {timed(answer, USERS):8.2f} ms")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+
+# settings are read at import time
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+os.environ.setdefault("CLIENT_URL", "http://localhost")
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.db.base import Base
+import app.models  # noqa: F401  registers every table
+from app.models.user import User
+from app.services.course_answer_key import answer_key_cache
+from app.services.principal_cache import AuthenticatedUser
+
+USER_COUNT = 5
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.execute(
+        insert(User),
+        [
+            {"id": i, "name": f"user{i}", "email": f"user{i}@test", "password": "x", "role_id": 1}
+            for i in range(1, USER_COUNT + 1)
+        ],
+    )
+    session.commit()
+    # module-level caches outlive a single in-memory database
+    answer_key_cache.clear()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def principal():
+    def build(user_id: int) -> AuthenticatedUser:
+        return AuthenticatedUser(
+            id=user_id, role_id=1, name=f"user{user_id}", image=None, is_verified=True
+        )
+
+    return build
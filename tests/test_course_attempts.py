@@ -0,0 +1,116 @@
+import pytest
+from sqlalchemy import func, select
+from app.constants.score_update_values import SCORE_UPDATE_VALUES
+from app.core.exceptions import ValidationError
+from app.crud.crud_course import crud_course
+from app.models.course import CourseCompletion, CourseQuestion
+from app.models.user import User
+from app.schemas.course import CourseAttemptCreate, CourseCreate
+
+
+def create_course(db, questions, marks_for_pass=None):
+    return crud_course.create_course(
+        db,
+        CourseCreate(
+            title="course",
+            marksForPass=marks_for_pass,
+            questions=[
+                {"question": f"q{n}", "answers": ["a", "b", "c"], "correctAnswer": correct, "marks": marks}
+                for n, (correct, marks) in enumerate(questions)
+            ],
+        ),
+        user_id=1,
+    )
+
+
+def question_ids(db, course_id):
+    return db.execute(
+        select(CourseQuestion.id).where(CourseQuestion.course_id == course_id).order_by(CourseQuestion.id)
+    ).scalars().all()
+
+
+def submit(db, course_id, user_id, answers):
+    return crud_course.submit_attempt(db, course_id, user_id, CourseAttemptCreate(answers=answers))
+
+
+def score(db, user_id):
+    db.expire_all()
+    return db.get(User, user_id).system_score
+
+
+def test_attempt_is_graded_by_marks(db):
+    course = create_course(db, [(1, 2), (2, 3), (3, 5)], marks_for_pass=6)
+    first, second, third = question_ids(db, course.id)
+
+    result = submit(db, course.id, 2, {first: 1, second: 1, third: 3})
+
+    assert (result.score, result.total_marks) == (7, 10)
+    assert (result.correct_count, result.question_count) == (2, 3)
+    assert result.passed
+
+
+def test_unanswered_questions_score_nothing(db):
+    course = create_course(db, [(1, 4), (2, 4)], marks_for_pass=4)
+    first, _ = question_ids(db, course.id)
+
+    result = submit(db, course.id, 2, {first: 2})
+
+    assert result.score == 0
+    assert not result.passed
+    assert not result.credited
+
+
+def test_without_pass_mark_every_mark_is_required(db):
+    course = create_course(db, [(1, 1), (2, 1)])
+    first, second = question_ids(db, course.id)
+
+    assert not submit(db, course.id, 2, {first: 1}).passed
+    assert submit(db, course.id, 2, {first: 1, second: 2}).passed
+
+
+def test_completion_is_credited_once(db):
+    course = create_course(db, [(1, 1)], marks_for_pass=1)
+    (question,) = question_ids(db, course.id)
+    before = score(db, 2)
+
+    assert not submit(db, course.id, 2, {question: 2}).credited
+    assert submit(db, course.id, 2, {question: 1}).credited
+    assert not submit(db, course.id, 2, {question: 1}).credited
+
+    assert score(db, 2) == before + SCORE_UPDATE_VALUES["VIEW_COURSE"]
+    assert db.execute(select(func.count()).select_from(CourseCompletion)).scalar_one() == 1
+
+
+def test_answers_to_other_courses_are_rejected(db):
+    course = create_course(db, [(1, 1)])
+    other = create_course(db, [(1, 1)])
+    (foreign,) = question_ids(db, other.id)
+
+    with pytest.raises(ValidationError):
+        submit(db, course.id, 2, {foreign: 1})
+
+
+def test_course_without_questions_cannot_be_attempted(db):
+    course = create_course(db, [])
+
+    with pytest.raises(ValidationError):
+        submit(db, course.id, 2, {})
+    assert db.execute(select(func.count()).select_from(CourseCompletion)).scalar_one() == 0
+
+
+def test_edited_course_is_regraded(db):
+    course = create_course(db, [(1, 1)], marks_for_pass=1)
+    (question,) = question_ids(db, course.id)
+    assert submit(db, course.id, 2, {question: 1}).passed
+
+    crud_course.update_course(
+        db,
+        course.id,
+        CourseCreate(
+            title="course",
+            marksForPass=1,
+            questions=[{"question": "q0", "answers": ["a", "b", "c"], "correctAnswer": 2, "marks": 1}],
+        ),
+    )
+
+    assert not submit(db, course.id, 3, {question: 1}).passed
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert
+from app.core.exceptions import ValidationError
+from app.crud.crud_event import crud_events
+from app.crud.crud_quiz import crud_quiz
+from app.models.events import Event
+from app.models.quiz import Quiz
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 17, 9, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor(datetime(2024, 1, 1), 1)[:-4] + "!!!!"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
+
+
+def test_quiz_pages_cover_every_visible_quiz_once(db):
+    # shared timestamps force the id tie-breaker to do its job
+    start = datetime(2024, 1, 1)
+    db.execute(
+        insert(Quiz),
+        [
+            {
+                "id": quiz_id,
+                "title": f"quiz{quiz_id}",
+                "question": "?",
+                "answer_one": "yes",
+                "answer_two": "no",
+                "correct_answer": 1,
+                "user_id": 1 if quiz_id % 5 else 2,
+                "visibility": quiz_id % 5 != 0,
+                "created_at": start + timedelta(minutes=quiz_id // 3),
+            }
+            for quiz_id in range(1, 24)
+        ],
+    )
+    db.commit()
+
+    seen, cursor = [], None
+    while True:
+        page = crud_quiz.get_quiz_page(db, user_id=1, limit=4, cursor=cursor)
+        seen.extend(quiz.id for quiz in page.quizzes)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    expected = [quiz.id for quiz in crud_quiz.get_quizzes(db, user_id=1)]
+    assert len(seen) == len(set(seen))
+    assert sorted(seen) == sorted(expected)
+    assert 5 not in seen  # private quiz of another user
+
+
+def test_inactive_event_pages_walk_newest_first(db):
+    db.execute(
+        insert(Event),
+        [
+            {
+                "id": event_id,
+                "title": f"event{event_id}",
+                "location": "hall",
+                "description": "past",
+                "date_time": datetime(2020, 1, 1 + event_id // 2),
+                "user_id": 1,
+            }
+            for event_id in range(1, 12)
+        ],
+    )
+    db.commit()
+
+    seen, cursor = [], None
+    while True:
+        page = crud_events.get_inactive_events_page(db, user_id=1, limit=3, cursor=cursor)
+        seen.extend((event.date_time, event.id) for event in page.events)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == sorted(seen, reverse=True)
+    assert [event_id for _, event_id in seen] == [
+        event.id for event in crud_events.get_all_inactive_events(db, user_id=1)
+    ]
@@ -0,0 +1,114 @@
+import pytest
+from sqlalchemy import insert, select
+from app.crud.crud_post_reactions import crud_reactions
+from app.models.post import Post
+from app.models.post_reaction import PostReactions, PostReactionCounts
+from app.models.system import ReactionTypes
+from app.models.user import User
+from app.schemas.post import ReactionCreate
+from app.services.post_counters import rebuild_reaction_counts
+
+LIKE, LOVE = 1, 2
+
+
+@pytest.fixture
+def post_id(db):
+    db.execute(insert(ReactionTypes), [{"id": LIKE, "name": "like"}, {"id": LOVE, "name": "love"}])
+    db.execute(insert(Post), [{"id": 1, "title": "post", "user_id": 1, "is_public": True}])
+    db.commit()
+    return 1
+
+
+def reaction_count(db, post_id):
+    return db.execute(select(Post.reaction_count).where(Post.id == post_id)).scalar_one()
+
+
+def type_counts(db, post_id):
+    return dict(
+        db.execute(
+            select(PostReactionCounts.reaction_type_id, PostReactionCounts.count).where(
+                PostReactionCounts.post_id == post_id, PostReactionCounts.count != 0
+            )
+        ).all()
+    )
+
+
+def assert_counters_match_rows(db, post_id):
+    maintained = type_counts(db, post_id)
+    rebuild_reaction_counts(db)
+    assert type_counts(db, post_id) == maintained
+    rows = db.execute(select(PostReactions).where(PostReactions.post_id == post_id)).scalars().all()
+    assert reaction_count(db, post_id) == len(rows)
+
+
+def test_toggle_creates_then_deletes(db, post_id):
+    created = crud_reactions.react_to_a_post(db, ReactionCreate(post_id=post_id, reaction_type_id=LIKE), 2)
+    assert created.state == "created"
+    assert created.id is not None
+    assert reaction_count(db, post_id) == 1
+    assert type_counts(db, post_id) == {LIKE: 1}
+
+    deleted = crud_reactions.react_to_a_post(db, ReactionCreate(post_id=post_id, reaction_type_id=LIKE), 2)
+    assert deleted.state == "deleted"
+    assert deleted.reaction_type_id is None
+    assert reaction_count(db, post_id) == 0
+    assert type_counts(db, post_id) == {}
+    assert_counters_match_rows(db, post_id)
+
+
+def test_switching_type_moves_the_count(db, post_id):
+    crud_reactions.react_to_a_post(db, ReactionCreate(post_id=post_id, reaction_type_id=LIKE), 2)
+    crud_reactions.react_to_a_post(db, ReactionCreate(post_id=post_id, reaction_type_id=LIKE), 3)
+    switched = crud_reactions.react_to_a_post(db, ReactionCreate(post_id=post_id, reaction_type_id=LOVE), 2)
+
+    assert switched.state == "updated"
+    assert reaction_count(db, post_id) == 2
+    assert type_counts(db, post_id) == {LIKE: 1, LOVE: 1}
+    assert_counters_match_rows(db, post_id)
+
+
+def test_toggle_credits_the_reacting_user(db, post_id):
+    before = db.get(User, 2).system_score
+    crud_reactions.react_to_a_post(db, ReactionCreate(post_id=post_id, reaction_type_id=LIKE), 2)
+    db.expire_all()
+    assert db.get(User, 2).system_score > before
+
+
+def test_batch_applies_taps_in_order(db, post_id):
+    db.execute(insert(Post), [{"id": 2, "title": "other", "user_id": 1, "is_public": True}])
+    db.commit()
+    states = crud_reactions.react_to_posts(
+        db,
+        [
+            ReactionCreate(post_id=post_id, reaction_type_id=LIKE),
+            ReactionCreate(post_id=2, reaction_type_id=LOVE),
+            ReactionCreate(post_id=2, reaction_type_id=LOVE),
+        ],
+        3,
+    )
+
+    assert {state.post_id: state.state for state in states} == {post_id: "created", 2: "unchanged"}
+    assert type_counts(db, post_id) == {LIKE: 1}
+    assert type_counts(db, 2) == {}
+    assert_counters_match_rows(db, post_id)
+    assert_counters_match_rows(db, 2)
+
+
+def test_lost_first_tap_race_leaves_counters_alone(db, post_id, monkeypatch):
+    crud_reactions.react_to_a_post(db, ReactionCreate(post_id=post_id, reaction_type_id=LIKE), 2)
+    before = (reaction_count(db, post_id), type_counts(db, post_id))
+    # the second tap read "no reaction yet" before the first one committed
+    current = crud_reactions._current_reaction
+    stale_reads = [None]
+
+    def stale_then_current(db, post_id, user_id):
+        return stale_reads.pop() if stale_reads else current(db, post_id, user_id)
+
+    monkeypatch.setattr(crud_reactions, "_current_reaction", stale_then_current)
+
+    state = crud_reactions.react_to_a_post(db, ReactionCreate(post_id=post_id, reaction_type_id=LOVE), 2)
+
+    assert state.state == "unchanged"
+    assert state.reaction_type_id == LIKE
+    assert (reaction_count(db, post_id), type_counts(db, post_id)) == before
+    assert_counters_match_rows(db, post_id)
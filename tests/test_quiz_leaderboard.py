@@ -0,0 +1,94 @@
+from sqlalchemy import insert, select
+from app.crud.crud_quiz import crud_quiz
+from app.crud.crud_quiz_leaderboard import crud_quiz_leaderboard
+from app.models.quiz import Quiz, QuizScoreBuckets, UserQuizScores
+from app.models.user import User
+from app.schemas.quiz import QuizCreate, QuizInteractionCreate
+
+# user -> answers to quizzes 1..3 (the correct answer is always 1)
+ANSWERS = {1: (1, 1, 1), 2: (1, 2, 1), 3: (2, 1, 1), 4: (1, 2, 2), 5: (2, 2, 2)}
+
+
+def seed(db, principal):
+    db.execute(
+        insert(Quiz),
+        [
+            {"id": quiz_id, "title": "quiz", "question": "?", "correct_answer": 1, "user_id": 1}
+            for quiz_id in (1, 2, 3)
+        ],
+    )
+    db.commit()
+    for quiz_index in range(3):
+        for user_id, answers in ANSWERS.items():
+            crud_quiz.create_quiz_interaction(
+                db, quiz_index + 1, principal(user_id), QuizInteractionCreate(answer_id=answers[quiz_index])
+            )
+
+
+def standings(db):
+    return (
+        sorted(db.execute(select(UserQuizScores.user_id, UserQuizScores.correct_count)).all()),
+        sorted(db.execute(select(QuizScoreBuckets.correct_count, QuizScoreBuckets.users)).all()),
+    )
+
+
+def test_ranks_follow_correct_counts(db, principal):
+    seed(db, principal)
+
+    assert [entry.user.id for entry in crud_quiz_leaderboard.get_global_top(db, 3)] == [1, 2, 3]
+    assert crud_quiz_leaderboard.get_global_rank(db, principal(1)).rank == 1
+    # users 2 and 3 are tied on two correct answers
+    assert crud_quiz_leaderboard.get_global_rank(db, principal(2)).rank == 2
+    assert crud_quiz_leaderboard.get_global_rank(db, principal(3)).rank == 2
+    assert crud_quiz_leaderboard.get_global_rank(db, principal(4)).rank == 4
+    assert [entry.user.id for entry in crud_quiz_leaderboard.get_quiz_top(db, 2, 10)] == [1, 3]
+
+
+def test_repeat_answer_does_not_count_twice(db, principal):
+    seed(db, principal)
+    before = standings(db)
+
+    crud_quiz.create_quiz_interaction(db, 1, principal(1), QuizInteractionCreate(answer_id=1))
+
+    assert standings(db) == before
+
+
+def test_maintained_standings_match_a_rebuild(db, principal):
+    seed(db, principal)
+    maintained = standings(db)
+
+    crud_quiz_leaderboard.rebuild(db)
+
+    assert standings(db) == maintained
+
+
+def test_deleting_a_quiz_takes_its_answers_out(db, principal):
+    seed(db, principal)
+
+    crud_quiz.delete_quiz(db, 3, 1)
+    maintained = standings(db)
+    crud_quiz_leaderboard.rebuild(db)
+
+    assert standings(db) == maintained
+    assert dict(maintained[0]) == {1: 2, 2: 1, 3: 1, 4: 1}
+
+
+def test_changing_the_correct_answer_reranks_the_quiz(db, principal):
+    seed(db, principal)
+    quiz = db.get(Quiz, 2)
+    update = QuizCreate(
+        title=quiz.title, question=quiz.question, answer_one="a", answer_two="b", correct_answer=2
+    )
+
+    crud_quiz.update_quiz(db, 2, update, 1)
+    maintained = standings(db)
+    ranks = [entry.rank for entry in crud_quiz_leaderboard.get_quiz_top(db, 2, 10)]
+    crud_quiz_leaderboard.rebuild(db)
+
+    assert standings(db) == maintained
+    assert ranks == [1, 2, 3]
+    # the next correct answer continues the numbering
+    db.execute(insert(User), [{"id": 6, "name": "user6", "email": "user6@test", "password": "x", "role_id": 1}])
+    db.commit()
+    crud_quiz.create_quiz_interaction(db, 2, principal(6), QuizInteractionCreate(answer_id=2))
+    assert crud_quiz_leaderboard.get_quiz_rank(db, 2, principal(6)).rank == 4
@@ -0,0 +1,67 @@
+import os
+import pytest
+from app.models.user import User
+from app.services.interaction_score_update import update_user_score
+from app.services.score_accumulator import ScoreAccumulator, score_accumulator
+
+
+@pytest.fixture
+def write_behind(monkeypatch):
+    monkeypatch.setattr(score_accumulator, "enabled", True)
+    score_accumulator._drain()
+    yield score_accumulator
+    score_accumulator._drain()
+
+
+def system_score(db, user_id):
+    db.expire_all()
+    return db.get(User, user_id).system_score
+
+
+def test_delta_waits_for_the_callers_commit(db, write_behind):
+    before = system_score(db, 1)
+    update_user_score(db, 5, 1, commit=False)
+    assert write_behind.pending() == 0
+
+    db.commit()
+    assert write_behind.pending() == 1
+    write_behind.flush(db)
+    assert system_score(db, 1) == before + 5
+
+
+def test_rolled_back_delta_is_dropped(db, write_behind):
+    update_user_score(db, 5, 1, commit=False)
+    db.rollback()
+    db.commit()
+
+    assert write_behind.pending() == 0
+
+
+def test_spools_are_replayed_then_removed(db, tmp_path):
+    base = tmp_path / "scores.spool"
+    accumulator = ScoreAccumulator(enabled=True, max_events=100, spool_path=str(base))
+    before = system_score(db, 2)
+
+    accumulator.add(2, 3)
+    accumulator.spill()
+    assert os.listdir(tmp_path) == [f"scores.spool.{os.getpid()}"]
+
+    assert accumulator.replay_spools(db) == 1
+    assert os.listdir(tmp_path) == []
+    assert system_score(db, 2) == before + 3
+
+
+def test_failed_replay_keeps_the_spool(db, tmp_path, monkeypatch):
+    base = tmp_path / "scores.spool"
+    accumulator = ScoreAccumulator(enabled=True, max_events=100, spool_path=str(base))
+    accumulator.add(2, 3)
+    accumulator.spill()
+
+    def fail(db, deltas):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr("app.services.score_accumulator.apply_score_deltas", fail)
+    with pytest.raises(RuntimeError):
+        accumulator.replay_spools(db)
+
+    assert os.listdir(tmp_path) == [f"scores.spool.{os.getpid()}"]